@@ -7,12 +7,29 @@ Erkennt das Einlegen von Audio-CDs via Polling
 import logging
 import time
 import os
+import fcntl
 import subprocess
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from dataclasses import dataclass
 
 
+# CD-ROM ioctls aus <linux/cdrom.h>
+CDROM_DRIVE_STATUS = 0x5326
+CDROM_DISC_STATUS = 0x5327
+CDSL_CURRENT = 0x7fffffff
+
+# Rückgabewerte von CDROM_DRIVE_STATUS
+CDS_NO_DISC = 1
+CDS_TRAY_OPEN = 2
+CDS_DRIVE_NOT_READY = 3
+CDS_DISC_OK = 4
+
+# Rückgabewerte von CDROM_DISC_STATUS
+CDS_AUDIO = 100
+CDS_MIXED = 105
+
+
 @dataclass
 class CDInfo:
     """Informationen über eine erkannte CD"""
@@ -24,23 +41,126 @@ class CDInfo:
 
 class CDDetector:
     """
-    Erkennt Audio-CDs durch Polling des CD-ROM Devices
+    Erkennt Audio-CDs über den Medien-Status des CD-ROM Devices
+    
+    Backends:
+        auto:  udev-Events + ioctl, Fallback auf Polling
+        udev:  udev Media-Change-Events (pyudev) + ioctl
+        ioctl: CDROM_DRIVE_STATUS/CDROM_DISC_STATUS in kurzen Abständen
+        poll:  cdparanoia bei jedem Aufruf (altes Verhalten)
+    
+    Bei udev/ioctl läuft der teure TOC-Check (cdparanoia) nur, wenn sich
+    der Medien-Status tatsächlich ändert.
     """
     
-    def __init__(self, device: str = "/dev/sr0", poll_interval: int = 5):
+    def __init__(self, device: str = "/dev/sr0", poll_interval: int = 5, backend: str = "auto"):
         """
         Initialisiert den CD-Detector
         
         Args:
             device: CD-ROM Device-Pfad
             poll_interval: Polling-Intervall in Sekunden
+            backend: Erkennungs-Backend (auto, udev, ioctl, poll)
         """
         self.device = device
         self.poll_interval = poll_interval
+        self.backend = backend
         self.logger = logging.getLogger('cd_ripper.detector')
         self._last_state = None
         self._running = False
         
+        # Zuletzt gesehener Medien-Status und zugehöriges Ergebnis
+        self._media_state: Optional[Tuple[int, int]] = None
+        self._cached_info: Optional[CDInfo] = None
+        self._udev_monitor = None
+        
+        if backend in ('auto', 'udev'):
+            self._udev_monitor = self._create_udev_monitor()
+        
+    def _create_udev_monitor(self):
+        """
+        Erstellt einen udev-Monitor für Block-Devices
+        
+        Returns:
+            pyudev Monitor oder None, falls nicht verfügbar
+        """
+        try:
+            import pyudev
+            
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by('block')
+            monitor.start()
+            self.logger.debug("udev-Monitor für Medienwechsel aktiv")
+            return monitor
+        except ImportError:
+            if self.backend == 'udev':
+                self.logger.warning("pyudev nicht installiert, verwende ioctl-Polling")
+        except Exception as e:
+            self.logger.warning(f"udev-Monitor nicht verfügbar: {e}")
+        return None
+    
+    def read_media_state(self) -> Optional[Tuple[int, int]]:
+        """
+        Liest den Medien-Status per ioctl (ohne Prozess-Start)
+        
+        Returns:
+            Tuple (Drive-Status, Disc-Status) oder None, falls nicht unterstützt
+        """
+        if self.backend == 'poll':
+            return None
+        
+        try:
+            fd = os.open(self.device, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            return None
+        
+        try:
+            drive_status = fcntl.ioctl(fd, CDROM_DRIVE_STATUS, CDSL_CURRENT)
+            disc_status = 0
+            if drive_status == CDS_DISC_OK:
+                disc_status = fcntl.ioctl(fd, CDROM_DISC_STATUS)
+            return drive_status, disc_status
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+    
+    def wait_for_change(self, timeout: float) -> bool:
+        """
+        Wartet auf eine Änderung des Medien-Status
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+            
+        Returns:
+            True wenn sich der Status (vermutlich) geändert hat
+        """
+        deadline = time.monotonic() + timeout
+        
+        if self.read_media_state() is None and not self._udev_monitor:
+            # Kein ioctl-Support: klassisches Polling
+            time.sleep(timeout)
+            return False
+        
+        device_node = os.path.realpath(self.device)
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            
+            if self._udev_monitor:
+                # Events kommen sofort, ioctl-Check fängt Laufwerke ohne Events ab
+                event = self._udev_monitor.poll(timeout=min(remaining, 1.0))
+                if event is not None and event.device_node == device_node:
+                    return True
+            else:
+                time.sleep(min(remaining, 0.5))
+            
+            if self.read_media_state() != self._media_state:
+                return True
+        
     def check_device_exists(self) -> bool:
         """
         Prüft, ob das CD-ROM Device existiert
@@ -101,6 +221,29 @@ class CDDetector:
             self.logger.debug(f"Device {self.device} existiert nicht")
             return cd_info
         
+        media_state = self.read_media_state()
+        if media_state is not None:
+            if media_state == self._media_state and self._cached_info:
+                # Keine Änderung - kein erneuter TOC-Check
+                return self._cached_info
+            
+            self._media_state = media_state
+            drive_status, disc_status = media_state
+            
+            if drive_status != CDS_DISC_OK:
+                self.logger.debug(f"Kein Medium bereit (Drive-Status {drive_status})")
+                self._cached_info = cd_info
+                return cd_info
+            
+            if disc_status not in (CDS_AUDIO, CDS_MIXED):
+                cd_info.present = True
+                self.logger.debug(f"Nicht-Audio Medium erkannt (Disc-Status {disc_status})")
+                self._cached_info = cd_info
+                return cd_info
+            
+            # Medium hat sich geändert und enthält Audio: TOC prüfen
+            self._cached_info = None
+        
         try:
             # Prüfe mit cdparanoia ob Audio-CD vorhanden
             result = subprocess.run(
@@ -115,6 +258,8 @@ class CDDetector:
                 cd_info.present = True
                 cd_info.is_audio = True
                 self.logger.debug("Audio-CD erkannt")
+                if media_state is not None:
+                    self._cached_info = cd_info
             else:
                 # Prüfe ob irgendeine Disc vorhanden ist
                 # (könnte Daten-CD sein)
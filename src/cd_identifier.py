@@ -12,6 +12,9 @@ from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from cover_cache import CoverCache
+from mb_cache import MusicBrainzCache
+
 
 @dataclass
 class TrackInfo:
@@ -20,6 +23,8 @@ class TrackInfo:
     title: str
     artist: str
     duration: int  # Sekunden
+    sectors: int = 0  # Länge laut TOC (1 Sektor = 2352 Bytes PCM)
+    offset: int = 0  # Start-Sektor laut TOC (inkl. 150 Sektoren Lead-In)
     
 
 @dataclass
@@ -34,6 +39,8 @@ class AlbumInfo:
     cover_url: Optional[str] = None
     cover_data: Optional[bytes] = None
     musicbrainz_id: Optional[str] = None
+    leadout: int = 0  # Lead-Out-Sektor laut TOC (inkl. 150 Sektoren Lead-In)
+    freedb_id: Optional[str] = None
     
 
 class CDIdentifier:
@@ -41,15 +48,21 @@ class CDIdentifier:
     Identifiziert Audio-CDs und lädt Metadaten
     """
     
-    def __init__(self, device: str = "/dev/sr0", user_agent: str = "CD-Ripper/1.0"):
+    def __init__(self, device: str = "/dev/sr0", user_agent: str = "CD-Ripper/1.0",
+                 cover_cache: Optional[CoverCache] = None,
+                 mb_cache: Optional[MusicBrainzCache] = None):
         """
         Initialisiert den CD-Identifier
         
         Args:
             device: CD-ROM Device-Pfad
             user_agent: User-Agent für MusicBrainz API
+            cover_cache: Optional Cover-Cache (vermeidet erneute Downloads)
+            mb_cache: Optional MusicBrainz-Cache (Disc-ID → Release)
         """
         self.device = device
+        self.cover_cache = cover_cache
+        self.mb_cache = mb_cache
         self.logger = logging.getLogger('cd_ripper.identifier')
         
         # MusicBrainz konfigurieren
@@ -93,6 +106,33 @@ class CDIdentifier:
             self.logger.error(f"Fehler beim Lesen der Disc: {e}")
             return None
     
+    def toc_album_info(self, disc: discid.Disc, artist: str = "Unknown Artist",
+                       album: str = "Unknown Album") -> AlbumInfo:
+        """
+        Erstellt AlbumInfo allein aus der TOC (ohne MusicBrainz-Abfrage)
+        
+        Args:
+            disc: Disc-Objekt mit TOC-Daten
+            artist: Artist (z.B. aus dem Disc-Index)
+            album: Album-Titel
+            
+        Returns:
+            AlbumInfo mit Track-Längen und -Positionen
+        """
+        album_info = AlbumInfo(disc_id=disc.id, artist=artist, album=album)
+        for track in disc.tracks:
+            album_info.tracks.append(TrackInfo(
+                number=track.number,
+                title=f"Track {track.number:02d}",
+                artist=artist,
+                duration=track.sectors // 75,  # 75 Sektoren = 1 Sekunde
+                sectors=track.sectors,
+                offset=track.offset
+            ))
+        album_info.leadout = disc.sectors
+        album_info.freedb_id = getattr(disc, 'freedb_id', None)
+        return album_info
+    
     def query_musicbrainz(self, disc_id: str) -> Optional[Dict[str, Any]]:
         """
         Fragt MusicBrainz nach Metadaten ab
@@ -103,6 +143,12 @@ class CDIdentifier:
         Returns:
             Release-Dictionary von MusicBrainz
         """
+        if self.mb_cache:
+            cached = self.mb_cache.get(disc_id)
+            if cached:
+                self.logger.info(f"✅ Release aus MusicBrainz-Cache für Disc-ID: {disc_id}")
+                return cached
+        
         try:
             self.logger.info(f"Frage MusicBrainz ab für Disc-ID: {disc_id}")
             result = musicbrainzngs.get_releases_by_discid(
@@ -114,7 +160,10 @@ class CDIdentifier:
                 releases = result["disc"]["release-list"]
                 if releases:
                     self.logger.info(f"✅ {len(releases)} Release(s) gefunden")
-                    return releases[0]  # Nimm erstes Match
+                    release = releases[0]  # Nimm erstes Match
+                    if self.mb_cache:
+                        self.mb_cache.put(disc_id, release)
+                    return release
                 else:
                     self.logger.warning("Keine Releases für Disc-ID gefunden")
                     return None
@@ -124,10 +173,28 @@ class CDIdentifier:
                 
         except musicbrainzngs.ResponseError as e:
             self.logger.error(f"MusicBrainz API-Fehler: {e}")
-            return None
+            return self._cached_fallback(disc_id)
         except Exception as e:
             self.logger.error(f"Fehler bei MusicBrainz-Abfrage: {e}")
+            return self._cached_fallback(disc_id)
+    
+    def _cached_fallback(self, disc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Liefert einen abgelaufenen Cache-Eintrag, wenn MusicBrainz nicht erreichbar ist
+        
+        Args:
+            disc_id: Disc-ID der CD
+            
+        Returns:
+            Release-Dictionary oder None
+        """
+        if not self.mb_cache:
             return None
+        
+        release = self.mb_cache.get(disc_id, allow_stale=True)
+        if release:
+            self.logger.warning("Verwende gecachtes Release (MusicBrainz nicht erreichbar)")
+        return release
     
     def get_cover_art(self, mb_release_id: str) -> Optional[bytes]:
         """
@@ -139,6 +206,12 @@ class CDIdentifier:
         Returns:
             Bilddaten als Bytes oder None
         """
+        if self.cover_cache:
+            cached = self.cover_cache.get(mb_release_id)
+            if cached:
+                self.logger.info(f"✅ Cover aus Cache ({len(cached)} bytes)")
+                return cached
+        
         try:
             url = f"https://coverartarchive.org/release/{mb_release_id}/front-500"
             self.logger.info(f"Lade Cover von: {url}")
@@ -147,6 +220,8 @@ class CDIdentifier:
             
             if response.status_code == 200:
                 self.logger.info(f"✅ Cover geladen ({len(response.content)} bytes)")
+                if self.cover_cache:
+                    self.cover_cache.put(mb_release_id, response.content)
                 return response.content
             else:
                 self.logger.warning(f"Cover nicht verfügbar (HTTP {response.status_code})")
@@ -233,9 +308,21 @@ class CDIdentifier:
                     number=i,
                     title=f"Track {i:02d}",
                     artist=album_info.artist,
-                    duration=track.sectors // 75  # 75 Sektoren = 1 Sekunde
+                    duration=track.sectors // 75,  # 75 Sektoren = 1 Sekunde
+                    sectors=track.sectors,
+                    offset=track.offset
                 ))
         
+        # TOC-Längen und -Positionen ergänzen (Streaming-Progress, AccurateRip)
+        toc_tracks = {track.number: track for track in disc.tracks}
+        for track in album_info.tracks:
+            if track.number in toc_tracks:
+                if not track.sectors:
+                    track.sectors = toc_tracks[track.number].sectors
+                track.offset = toc_tracks[track.number].offset
+        album_info.leadout = disc.sectors
+        album_info.freedb_id = getattr(disc, 'freedb_id', None)
+        
         self.logger.info(f"✅ Album identifiziert: {album_info.artist} - {album_info.album}")
         self.logger.info(f"   {len(album_info.tracks)} Tracks")
         
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Cover Cache Module
+Hält Cover-Art pro MusicBrainz-Release im Speicher (aktuelles Album)
+und auf Disk (LRU, größenbegrenzt über mehrere Alben)
+"""
+
+import logging
+import os
+import re
+import threading
+import requests
+from pathlib import Path
+from typing import Optional
+
+
+def detect_image_mime(data: bytes) -> str:
+    """
+    Ermittelt den MIME-Typ eines Bildes anhand der Magic Bytes
+
+    Args:
+        data: Bilddaten
+
+    Returns:
+        MIME-Typ (Default: image/jpeg)
+    """
+    if data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if data.startswith(b'GIF8'):
+        return 'image/gif'
+    return 'image/jpeg'
+
+
+class CoverCache:
+    """
+    Cache für Cover-Bilder, Schlüssel ist die MusicBrainz Release-ID
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 50 * 1024 * 1024, timeout: int = 10):
+        """
+        Initialisiert den Cover-Cache
+
+        Args:
+            cache_dir: Verzeichnis für den Disk-Cache
+            max_bytes: Maximale Gesamtgröße des Disk-Caches
+            timeout: Timeout für Downloads in Sekunden
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.logger = logging.getLogger('cd_ripper.cover_cache')
+
+        # Nur das aktuelle Album bleibt im Speicher
+        self._memory_key: Optional[str] = None
+        self._memory_data: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Cover-Cache-Verzeichnis nicht verfügbar: {e}")
+
+    def _path_for(self, key: str) -> Path:
+        """Dateipfad für einen Cache-Schlüssel"""
+        safe_key = re.sub(r'[^A-Za-z0-9._-]', '_', key)
+        return self.cache_dir / f"{safe_key}.img"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Liest ein Cover aus dem Cache
+
+        Args:
+            key: MusicBrainz Release-ID (oder URL als Fallback)
+
+        Returns:
+            Bilddaten oder None
+        """
+        with self._lock:
+            if key == self._memory_key:
+                return self._memory_data
+
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Lesen des Cover-Caches: {e}")
+            return None
+
+        # Zugriffszeit für LRU aktualisieren
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self._remember(key, data)
+        self.logger.debug(f"Cover aus Cache: {key}")
+        return data
+
+    def put(self, key: str, data: bytes):
+        """
+        Speichert ein Cover im Cache
+
+        Args:
+            key: MusicBrainz Release-ID (oder URL als Fallback)
+            data: Bilddaten
+        """
+        if not data:
+            return
+
+        self._remember(key, data)
+
+        path = self._path_for(key)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._evict()
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Schreiben des Cover-Caches: {e}")
+
+    def fetch(self, key: str, url: str) -> Optional[bytes]:
+        """
+        Liefert ein Cover aus dem Cache oder lädt es herunter
+
+        Args:
+            key: MusicBrainz Release-ID (oder URL als Fallback)
+            url: Download-URL
+
+        Returns:
+            Bilddaten oder None
+        """
+        data = self.get(key)
+        if data:
+            return data
+
+        try:
+            self.logger.debug(f"Lade Cover von: {url}")
+            response = requests.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Cover-Download: {e}")
+            return None
+
+        self.put(key, response.content)
+        return response.content
+
+    def _remember(self, key: str, data: bytes):
+        """Hält das Cover des aktuellen Albums im Speicher"""
+        with self._lock:
+            self._memory_key = key
+            self._memory_data = data
+
+    def _evict(self):
+        """Löscht die am längsten nicht genutzten Cover, bis max_bytes eingehalten ist"""
+        try:
+            entries = [(p.stat().st_mtime, p.stat().st_size, p) for p in self.cache_dir.glob('*.img')]
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Prüfen des Cover-Caches: {e}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                self.logger.debug(f"Cover aus Cache entfernt: {path.name}")
+            except OSError:
+                pass
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Disc Index Module
+Lokaler SQLite-Index bereits gerippter CDs (Disc-ID, MusicBrainz-Release,
+AccurateRip-Ergebnisse, Sync-Ziel). Eine erneut eingelegte CD wird allein
+anhand der TOC erkannt, ohne MusicBrainz-Abfrage und ohne Rippen.
+"""
+
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+
+# Aktion für bereits gerippte CDs (index.duplicate_action)
+DUPLICATE_ACTIONS = ('skip', 'verify', 'rerip')
+
+
+@dataclass
+class DiscRecord:
+    """Eintrag einer gerippten CD im Index"""
+    disc_id: str
+    artist: str
+    album: str
+    musicbrainz_id: Optional[str] = None
+    album_dir: Optional[str] = None
+    output_format: Optional[str] = None
+    track_count: int = 0
+    ripped_at: float = 0.0
+    verified_at: Optional[float] = None
+    accurate: int = 0
+    mismatch: int = 0
+    unknown: int = 0
+    sync_destination: Optional[str] = None
+    sync_state: Optional[str] = None                            # queued, synced
+    track_crcs: Dict[int, int] = field(default_factory=dict)    # Track -> CRC32 der PCM-Daten
+
+
+class DiscIndex:
+    """
+    Index aller gerippten CDs, Schlüssel ist die Disc-ID aus der TOC
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialisiert den Index
+
+        Args:
+            db_path: Pfad zur SQLite-Datenbank
+        """
+        self.db_path = Path(db_path)
+        self.logger = logging.getLogger('cd_ripper.disc_index')
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS discs ("
+                    " disc_id TEXT PRIMARY KEY,"
+                    " musicbrainz_id TEXT,"
+                    " artist TEXT NOT NULL,"
+                    " album TEXT NOT NULL,"
+                    " album_dir TEXT,"
+                    " output_format TEXT,"
+                    " track_count INTEGER NOT NULL,"
+                    " ripped_at REAL NOT NULL,"
+                    " verified_at REAL,"
+                    " accurate INTEGER NOT NULL DEFAULT 0,"
+                    " mismatch INTEGER NOT NULL DEFAULT 0,"
+                    " unknown INTEGER NOT NULL DEFAULT 0,"
+                    " sync_destination TEXT,"
+                    " sync_state TEXT)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS tracks ("
+                    " disc_id TEXT NOT NULL,"
+                    " track_number INTEGER NOT NULL,"
+                    " pcm_crc32 INTEGER,"
+                    " accuraterip TEXT,"
+                    " PRIMARY KEY (disc_id, track_number))"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS discs_release ON discs (musicbrainz_id)")
+        except Exception as e:
+            self.logger.warning(f"Disc-Index nicht verfügbar: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Öffnet eine Verbindung (eine pro Aufruf, damit thread-sicher)"""
+        return sqlite3.connect(str(self.db_path), timeout=5)
+
+    def lookup(self, disc_id: str) -> Optional[DiscRecord]:
+        """
+        Sucht eine CD im Index
+
+        Args:
+            disc_id: Disc-ID aus der TOC
+
+        Returns:
+            DiscRecord oder None, wenn die CD noch nicht gerippt wurde
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT disc_id, artist, album, musicbrainz_id, album_dir, output_format,"
+                    " track_count, ripped_at, verified_at, accurate, mismatch, unknown,"
+                    " sync_destination, sync_state FROM discs WHERE disc_id = ?",
+                    (disc_id,)
+                ).fetchone()
+                if not row:
+                    return None
+
+                record = DiscRecord(*row)
+                record.track_crcs = {
+                    number: crc for number, crc in conn.execute(
+                        "SELECT track_number, pcm_crc32 FROM tracks"
+                        " WHERE disc_id = ? AND pcm_crc32 IS NOT NULL",
+                        (disc_id,)
+                    )
+                }
+                return record
+
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Lesen des Disc-Index: {e}")
+            return None
+
+    def record_rip(self, record: DiscRecord, tracks: Dict[int, Tuple[Optional[int], Optional[str]]]):
+        """
+        Trägt eine fertig verarbeitete CD ein (ersetzt einen früheren Eintrag)
+
+        Args:
+            record: Daten der CD
+            tracks: Track-Nummer -> (CRC32 der PCM-Daten, AccurateRip-Status)
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO discs (disc_id, musicbrainz_id, artist, album, album_dir,"
+                    " output_format, track_count, ripped_at, verified_at, accurate, mismatch, unknown,"
+                    " sync_destination, sync_state) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (record.disc_id, record.musicbrainz_id, record.artist, record.album, record.album_dir,
+                     record.output_format, record.track_count, record.ripped_at or time.time(),
+                     record.verified_at, record.accurate, record.mismatch, record.unknown,
+                     record.sync_destination, record.sync_state)
+                )
+                conn.execute("DELETE FROM tracks WHERE disc_id = ?", (record.disc_id,))
+                conn.executemany(
+                    "INSERT INTO tracks (disc_id, track_number, pcm_crc32, accuraterip) VALUES (?, ?, ?, ?)",
+                    [(record.disc_id, number, crc, status) for number, (crc, status) in sorted(tracks.items())]
+                )
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Schreiben des Disc-Index: {e}")
+
+    def update_sync(self, disc_id: str, state: Optional[str]) -> bool:
+        """
+        Aktualisiert den Sync-Stand einer CD (z.B. nach einem Hintergrund-Sync)
+
+        Args:
+            disc_id: Disc-ID
+            state: queued, synced oder None
+
+        Returns:
+            True wenn die CD im Index war
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                cursor = conn.execute(
+                    "UPDATE discs SET sync_state = ? WHERE disc_id = ?",
+                    (state, disc_id)
+                )
+                return cursor.rowcount > 0
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Schreiben des Disc-Index: {e}")
+            return False
+
+    def record_verification(self, disc_id: str, counts: Dict[str, int],
+                            tracks: Dict[int, Tuple[Optional[int], Optional[str]]]):
+        """
+        Hält das Ergebnis einer erneuten Verifikation fest
+
+        Args:
+            disc_id: Disc-ID
+            counts: Anzahl Tracks pro AccurateRip-Status
+            tracks: Track-Nummer -> (CRC32 der PCM-Daten, AccurateRip-Status)
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "UPDATE discs SET verified_at = ?, accurate = ?, mismatch = ?, unknown = ?"
+                    " WHERE disc_id = ?",
+                    (time.time(), counts.get('accurate', 0), counts.get('mismatch', 0),
+                     counts.get('unknown', 0), disc_id)
+                )
+                # Gespeicherte CRC32 bleiben die Referenz des ursprünglichen Rips
+                conn.executemany(
+                    "UPDATE tracks SET accuraterip = ? WHERE disc_id = ? AND track_number = ?",
+                    [(status, disc_id, number) for number, (_, status) in sorted(tracks.items())]
+                )
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Schreiben des Disc-Index: {e}")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Display Backends für den DisplayManager
+Headless-Ersatz für die ST7789 Hardware (Tests, Profiling, Entwicklung ohne Pi)
+
+Alle Backends verhalten sich wie adafruit_rgb_display:
+image(img, rotation=None, x=0, y=0) dreht das Bild um `rotation` Grad
+und schreibt es an Position (x, y) in nativer Ausrichtung des Panels.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger('cd_ripper.display')
+
+
+class NullDisplay:
+    """
+    Verwirft alle Frames, zählt nur Frames und übertragene Bytes (RGB565)
+    """
+
+    def __init__(self, width: int = 240, height: int = 320, rotation: int = 0):
+        """
+        Args:
+            width: Native Breite des Panels
+            height: Native Höhe des Panels
+            rotation: Rotation in Grad (0, 90, 180, 270)
+        """
+        if rotation not in (0, 90, 180, 270):
+            raise ValueError("Rotation must be 0/90/180/270")
+        self.width = width
+        self.height = height
+        self.rotation = rotation
+        self.frames = 0
+        self.bytes_written = 0
+
+    def _prepare(self, img: Image.Image, rotation: Optional[int], x: int, y: int) -> Image.Image:
+        """Prüft und dreht ein Bild wie die Adafruit-Bibliothek"""
+        if rotation is None:
+            rotation = self.rotation
+        if img.mode not in ('RGB', 'RGBA'):
+            raise ValueError("Image must be in mode RGB or RGBA")
+        if rotation:
+            img = img.rotate(rotation, expand=True)
+        if x + img.width > self.width or y + img.height > self.height:
+            raise ValueError(f"Image must not exceed dimensions of display ({self.width}x{self.height}).")
+        return img
+
+    def image(self, img: Image.Image, rotation: Optional[int] = None, x: int = 0, y: int = 0):
+        """Nimmt einen Frame bzw. Ausschnitt entgegen"""
+        img = self._prepare(img, rotation, x, y)
+        self.frames += 1
+        self.bytes_written += img.width * img.height * 2
+        return img
+
+
+class FramebufferDisplay(NullDisplay):
+    """
+    Hält den Panel-Inhalt im Speicher: als RGB565 NumPy-Array (falls
+    NumPy verfügbar) und als PIL-Bild
+    """
+
+    def __init__(self, width: int = 240, height: int = 320, rotation: int = 0):
+        super().__init__(width, height, rotation)
+        self.frame = Image.new('RGB', (width, height))
+        self.buffer = numpy.zeros((height, width), dtype=numpy.uint16) if numpy is not None else None
+
+    def image(self, img: Image.Image, rotation: Optional[int] = None, x: int = 0, y: int = 0):
+        """Schreibt einen Frame bzw. Ausschnitt in den Framebuffer"""
+        img = super().image(img, rotation, x, y).convert('RGB')
+        self.frame.paste(img, (x, y))
+
+        if self.buffer is not None:
+            data = numpy.asarray(img, dtype=numpy.uint16)
+            color = ((data[:, :, 0] & 0xF8) << 8) | ((data[:, :, 1] & 0xFC) << 3) | (data[:, :, 2] >> 3)
+            self.buffer[y:y + img.height, x:x + img.width] = color
+        return img
+
+
+class PngDisplay(FramebufferDisplay):
+    """
+    Schreibt den Panel-Inhalt nach jedem Frame als PNG-Datei
+    """
+
+    def __init__(self, path: str, width: int = 240, height: int = 320, rotation: int = 0):
+        """
+        Args:
+            path: Zieldatei (wird bei jedem Frame überschrieben)
+        """
+        super().__init__(width, height, rotation)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def image(self, img: Image.Image, rotation: Optional[int] = None, x: int = 0, y: int = 0):
+        """Schreibt den Frame und speichert das PNG"""
+        img = super().image(img, rotation, x, y)
+        self.frame.save(self.path)
+        return img
+
+
+def create_backend(name: str, config: dict):
+    """
+    Erstellt ein Headless-Backend aus der display-Konfiguration
+
+    Args:
+        name: null, framebuffer oder png
+        config: display-Sektion aus config.yaml
+
+    Returns:
+        Backend-Objekt mit image(img, rotation, x, y)
+    """
+    width = config.get('width', 240)
+    height = config.get('height', 320)
+    rotation = config.get('rotation', 0)
+
+    if name == 'null':
+        return NullDisplay(width, height, rotation)
+    if name == 'framebuffer':
+        return FramebufferDisplay(width, height, rotation)
+    if name == 'png':
+        return PngDisplay(config.get('png_path', '/tmp/cd-ripper-display.png'), width, height, rotation)
+
+    raise ValueError(f"Unbekanntes Display-Backend: {name}")
@@ -7,14 +7,21 @@ Basiert auf: https://learn.adafruit.com/2-0-inch-320-x-240-color-ips-tft-display
 import logging
 import requests
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 import os
+import threading
+import time
 
 logger = logging.getLogger('cd_ripper.display')
 
 class DisplayManager:
     """Verwaltet das ST7789 Display (2.0" 240x320)"""
     
+    # Cover-Bereich (220px, lässt 10px Rand auf jeder Seite)
+    COVER_SIZE = 220
+    COVER_X = 10
+    COVER_Y = 10
+    
     def __init__(self, config):
         """
         Initialisiert das Display
@@ -30,9 +37,34 @@ class DisplayManager:
         
         self.enabled = self.config.get('enabled', False)
         self.rotation = self.config.get('rotation', 0)
+        self.partial_updates = self.config.get('partial_updates', True)
+        self.async_render = self.config.get('async_render', True)
+        self.max_fps = self.config.get('max_fps', 10)
         
         self.display = None
         
+        # Render-Caches: Fonts einmalig, Cover + statische Layer pro Album
+        self._fonts = {}
+        self._cover_key = None
+        self._cover_img = None
+        self._layers = {}
+        self._idle_frame = None
+        
+        # Zuletzt übertragener Frame (in nativer Ausrichtung des Controllers)
+        self._panel_frame = None
+        
+        # Render-Thread mit Mailbox: nur der neueste Auftrag wird gezeichnet
+        self._mailbox = threading.Condition()
+        self._pending = None
+        self._render_thread = None
+        self._render_running = False
+        
+        # Immer nur ein Frame gleichzeitig (Render-Thread oder synchron),
+        # nach cleanup() werden Aufträge verworfen
+        self._render_lock = threading.Lock()
+        self._rendering = threading.local()
+        self._closed = False
+        
         if self.enabled:
             try:
                 self._init_display()
@@ -40,8 +72,121 @@ class DisplayManager:
             except Exception as e:
                 logger.error(f"Display-Initialisierung fehlgeschlagen: {e}")
                 self.enabled = False
+        
+        if self.enabled and self.display and self.async_render:
+            self._render_running = True
+            self._render_thread = threading.Thread(
+                target=self._render_loop,
+                daemon=True,
+                name="DisplayRender"
+            )
+            self._render_thread.start()
+    
+    def _dispatch(self, method, *args, **kwargs):
+        """
+        Übergibt einen Anzeige-Auftrag an den Render-Thread
+        
+        Ein noch nicht gezeichneter Auftrag wird überschrieben (latest frame
+        wins), der Aufrufer kehrt sofort zurück. Ohne Render-Thread wird der
+        Auftrag synchron unter dem Render-Lock gezeichnet, damit mehrere
+        Laufwerks-Threads nicht gleichzeitig auf das Panel schreiben.
+        
+        Args:
+            method: Öffentliche Anzeige-Methode
+            
+        Returns:
+            True wenn der Auftrag erledigt ist (übergeben, gezeichnet oder nach
+            cleanup() verworfen), False wenn der Aufrufer jetzt selbst zeichnen
+            soll (er hält bereits den Render-Lock)
+        """
+        if getattr(self._rendering, 'active', False):
+            return False
+        
+        if self._closed:
+            return True
+        
+        with self._mailbox:
+            if self._render_running:
+                self._pending = (method, args, kwargs)
+                self._mailbox.notify()
+                return True
+        
+        self._render(method, *args, **kwargs)
+        return True
+    
+    def _render(self, method, *args, **kwargs):
+        """Zeichnet einen Auftrag im aktuellen Thread unter dem Render-Lock"""
+        with self._render_lock:
+            self._rendering.active = True
+            try:
+                method(*args, **kwargs)
+            finally:
+                self._rendering.active = False
+    
+    def _render_loop(self):
+        """Zeichnet jeweils den neuesten Auftrag, begrenzt auf max_fps"""
+        frame_interval = 1.0 / self.max_fps if self.max_fps else 0
+        
+        while True:
+            with self._mailbox:
+                while self._pending is None and self._render_running:
+                    self._mailbox.wait()
+                if not self._render_running:
+                    return
+                method, args, kwargs = self._pending
+                self._pending = None
+            
+            started = time.monotonic()
+            try:
+                self._render(method, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"Fehler im Render-Thread: {e}")
+            
+            # Frame-Rate begrenzen; neuere Aufträge ersetzen währenddessen ältere
+            remaining = frame_interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+    
+    def _stop_render_thread(self):
+        """Beendet den Render-Thread (offene und spätere Aufträge werden verworfen)"""
+        self._closed = True
+        if not self._render_thread:
+            return
+        
+        with self._mailbox:
+            self._render_running = False
+            self._pending = None
+            self._mailbox.notify()
+        self._render_thread.join(timeout=5)
+        self._render_thread = None
     
     def _init_display(self):
+        """Initialisiert das Display-Backend (ST7789 Hardware oder headless)"""
+        backend = self.config.get('backend', 'st7789')
+        
+        if backend == 'st7789':
+            self._init_st7789()
+        else:
+            from display_backends import create_backend
+            self.display = create_backend(backend, self.config)
+            logger.info(f"Display-Backend: {backend}")
+        
+        # Bildgröße basierend auf Rotation
+        if self.display.rotation % 180 == 90:
+            # Landscape
+            self.width = self.display.height
+            self.height = self.display.width
+        else:
+            # Portrait
+            self.width = self.display.width
+            self.height = self.display.height
+        
+        logger.info(f"Display: {self.width}x{self.height}, Rotation: {self.rotation}°")
+        
+        # Zeige initialen schwarzen Screen
+        self._show_black_screen()
+    
+    def _init_st7789(self):
         """Initialisiert die ST7789 Hardware"""
         try:
             import board
@@ -66,21 +211,6 @@ class DisplayManager:
                 baudrate=24000000
             )
             
-            # Bildgröße basierend auf Rotation
-            if self.display.rotation % 180 == 90:
-                # Landscape
-                self.width = self.display.height
-                self.height = self.display.width
-            else:
-                # Portrait
-                self.width = self.display.width
-                self.height = self.display.height
-            
-            logger.info(f"Display: {self.width}x{self.height}, Rotation: {self.rotation}°")
-            
-            # Zeige initialen schwarzen Screen
-            self._show_black_screen()
-            
         except ImportError as e:
             logger.error(f"Adafruit Bibliothek nicht installiert: {e}")
             raise
@@ -93,81 +223,248 @@ class DisplayManager:
         if not self.display:
             return
         img = Image.new('RGB', (self.width, self.height), color=(0, 0, 0))
-        self.display.image(img)
+        self._push(img)
     
-    def show_idle(self):
+    def _push(self, img):
         """
-        SCHRITT 1: Zeigt statischen Screen mit CD-Icon und Text
+        Überträgt einen Frame, bei Bedarf nur den geänderten Bereich
+        
+        Der Frame wird wie in der Adafruit-Bibliothek in die native
+        Ausrichtung gedreht und mit dem zuletzt übertragenen verglichen.
+        Nur das umschließende Rechteck der Änderung wird als RGB565 per
+        Fenster-Adressierung (CASET/RASET) geschrieben.
+        
+        Args:
+            img: Frame in logischer Ausrichtung (width x height)
         """
-        if not self.enabled or not self.display:
-            return
+        native = img.rotate(self.rotation, expand=True) if self.rotation else img
+        
+        bbox = (0, 0) + native.size
+        if (self.partial_updates and self._panel_frame is not None
+                and self._panel_frame.size == native.size):
+            bbox = ImageChops.difference(native, self._panel_frame).getbbox()
+            if bbox is None:
+                # Keine Änderung - nichts zu übertragen
+                return
         
         try:
-            # Dunkler, eleganter Hintergrund (sehr dunkles Blau-Grau)
-            img = Image.new('RGB', (self.width, self.height), color=(18, 22, 32))
-            draw = ImageDraw.Draw(img)
-            
-            # Fonts laden
+            if bbox == (0, 0) + native.size:
+                self.display.image(native, rotation=0)
+            else:
+                self.display.image(native.crop(bbox), rotation=0, x=bbox[0], y=bbox[1])
+        except Exception:
+            # Panel-Inhalt unbekannt - nächster Frame wird komplett übertragen
+            self._panel_frame = None
+            raise
+        
+        self._panel_frame = native
+    
+    def _font(self, name, size):
+        """
+        Lädt einen Font einmalig und hält ihn im Cache
+        
+        Args:
+            name: Dateiname im DejaVu-Verzeichnis
+            size: Schriftgröße
+        """
+        key = (name, size)
+        if key not in self._fonts:
             try:
-                font_main = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-                font_sub = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-            except:
-                font_main = ImageFont.load_default()
-                font_sub = ImageFont.load_default()
+                self._fonts[key] = ImageFont.truetype(f"/usr/share/fonts/truetype/dejavu/{name}", size)
+            except Exception:
+                self._fonts[key] = ImageFont.load_default()
+        return self._fonts[key]
+    
+    def _get_cover(self, cover_path):
+        """
+        Liefert das dekodierte, skalierte Cover des aktuellen Albums
+        
+        Das Cover wird nur neu geladen, wenn sich Pfad oder Datei ändern
+        (z.B. /tmp/current-cover.jpg für eine neue CD). Dann werden auch
+        die vorgerenderten Layer verworfen.
+        
+        Args:
+            cover_path: Lokaler Pfad oder URL zum Cover-Bild
             
-            # CD-Icon zeichnen (größer, zentriert oben)
-            center_x = self.width // 2
-            icon_y = 80
-            icon_size = 80
+        Returns:
+            PIL Image (COVER_SIZE x COVER_SIZE) oder None
+        """
+        key = cover_path or None
+        if cover_path and not cover_path.startswith('http'):
+            try:
+                stat = os.stat(cover_path)
+                key = (cover_path, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                key = (cover_path, None, None)
+        
+        if key == self._cover_key:
+            return self._cover_img
+        
+        self._cover_key = key
+        self._cover_img = None
+        self._layers.clear()
+        
+        if not cover_path:
+            return None
+        
+        try:
+            if cover_path.startswith('http'):
+                # Von URL laden
+                response = requests.get(cover_path, timeout=5)
+                cover_img = Image.open(BytesIO(response.content))
+            else:
+                # Von lokalem Pfad laden
+                cover_img = Image.open(cover_path)
             
-            # Äußerer Kreis (CD-Rand) - helles Grau/Blau
-            draw.ellipse(
-                [center_x - icon_size//2, icon_y - icon_size//2, 
-                 center_x + icon_size//2, icon_y + icon_size//2],
-                outline=(100, 120, 180), width=3
+            # Cover auf quadratische Größe skalieren
+            self._cover_img = cover_img.convert('RGB').resize(
+                (self.COVER_SIZE, self.COVER_SIZE), Image.Resampling.LANCZOS
             )
+            logger.info(f"Cover geladen: {cover_path[:50]}")
+        except Exception as e:
+            logger.warning(f"Cover konnte nicht geladen werden: {e}")
+        
+        return self._cover_img
+    
+    def _cover_layer(self, cover_path, shadow_color, placeholder_label):
+        """
+        Vorgerenderter Hintergrund mit Schatten und Cover bzw. Platzhalter
+        
+        Args:
+            cover_path: Lokaler Pfad oder URL zum Cover-Bild (optional)
+            shadow_color: Farbe des Schattens
+            placeholder_label: Platzhalter-Text ohne Cover
             
-            # Innerer Kreis (CD-Loch) - gefüllt
-            inner_size = 20
-            draw.ellipse(
-                [center_x - inner_size//2, icon_y - inner_size//2,
-                 center_x + inner_size//2, icon_y + inner_size//2],
-                fill=(100, 120, 180), outline=(100, 120, 180), width=2
-            )
+        Returns:
+            PIL Image (nicht verändern, ggf. kopieren)
+        """
+        cover_img = self._get_cover(cover_path)
+        key = ('cover', shadow_color, placeholder_label)
+        if key in self._layers:
+            return self._layers[key]
+        
+        cover_size = self.COVER_SIZE
+        cover_x = self.COVER_X
+        cover_y = self.COVER_Y
+        
+        # Weißer Hintergrund
+        img = Image.new('RGB', (self.width, self.height), color=(255, 255, 255))
+        draw = ImageDraw.Draw(img)
+        
+        # Schatten zeichnen (leicht versetzt, dunkler)
+        shadow_offset = 3
+        draw.rectangle(
+            [(cover_x + shadow_offset, cover_y + shadow_offset), 
+             (cover_x + cover_size + shadow_offset, cover_y + cover_size + shadow_offset)],
+            fill=shadow_color
+        )
+        
+        if cover_img:
+            # Cover mit 10px Rand einfügen
+            img.paste(cover_img, (cover_x, cover_y))
             
-            # Reflektions-Arcs (CD-Glanz-Effekt)
-            arc_width = 2
-            draw.arc(
-                [center_x - icon_size//2 + 10, icon_y - icon_size//2 + 10,
-                 center_x + icon_size//2 - 10, icon_y + icon_size//2 - 10],
-                start=45, end=135, fill=(140, 160, 220), width=arc_width
+            # Border um das Cover zeichnen
+            draw.rectangle(
+                [(cover_x, cover_y), (cover_x + cover_size - 1, cover_y + cover_size - 1)],
+                outline=(200, 200, 200),
+                width=1
             )
-            draw.arc(
-                [center_x - icon_size//2 + 10, icon_y - icon_size//2 + 10,
-                 center_x + icon_size//2 - 10, icon_y + icon_size//2 - 10],
-                start=225, end=315, fill=(140, 160, 220), width=arc_width
+        else:
+            # Weißer Hintergrund für Platzhalter
+            draw.rectangle(
+                [(cover_x, cover_y), (cover_x + cover_size, cover_y + cover_size)],
+                fill=(255, 255, 255),
+                outline=(150, 150, 150),
+                width=2
             )
-            
-            # Haupttext (direkt unter Icon)
-            text_y = icon_y + icon_size//2 + 40
-            text = "Bereit"
-            bbox = draw.textbbox((0, 0), text, font=font_main)
-            text_width = bbox[2] - bbox[0]
-            draw.text((center_x - text_width//2, text_y), text, fill=(180, 190, 220), font=font_main)
-            
-            # Subtext (darunter, etwas heller)
-            subtext = "Lege eine CD ein"
-            bbox_sub = draw.textbbox((0, 0), subtext, font=font_sub)
-            subtext_width = bbox_sub[2] - bbox_sub[0]
-            draw.text((center_x - subtext_width//2, text_y + 35), subtext, fill=(120, 140, 180), font=font_sub)
+            if placeholder_label:
+                # Platzhalter-Text (zentriert)
+                font_medium = self._font("DejaVuSans-Bold.ttf", 20)
+                draw.text((cover_x + 75, cover_y + 95), "NO", fill=(120, 120, 120), font=font_medium)
+                draw.text((cover_x + 60, cover_y + 120), "COVER", fill=(120, 120, 120), font=font_medium)
+        
+        self._layers[key] = img
+        return img
+    
+    def show_idle(self):
+        """
+        SCHRITT 1: Zeigt statischen Screen mit CD-Icon und Text
+        """
+        if not self.enabled or not self.display:
+            return
+        
+        if self._dispatch(self.show_idle):
+            return
+        
+        try:
+            if self._idle_frame is None:
+                self._idle_frame = self._render_idle()
             
             # Auf Display anzeigen
-            self.display.image(img)
+            self._push(self._idle_frame)
             logger.info("Idle-Screen angezeigt")
             
         except Exception as e:
             logger.error(f"Fehler beim Anzeigen des Idle-Screens: {e}")
     
+    def _render_idle(self):
+        """Rendert den statischen Idle-Screen (einmalig)"""
+        # Dunkler, eleganter Hintergrund (sehr dunkles Blau-Grau)
+        img = Image.new('RGB', (self.width, self.height), color=(18, 22, 32))
+        draw = ImageDraw.Draw(img)
+        
+        # Fonts laden
+        font_main = self._font("DejaVuSans.ttf", 24)
+        font_sub = self._font("DejaVuSans.ttf", 16)
+        
+        # CD-Icon zeichnen (größer, zentriert oben)
+        center_x = self.width // 2
+        icon_y = 80
+        icon_size = 80
+        
+        # Äußerer Kreis (CD-Rand) - helles Grau/Blau
+        draw.ellipse(
+            [center_x - icon_size//2, icon_y - icon_size//2, 
+             center_x + icon_size//2, icon_y + icon_size//2],
+            outline=(100, 120, 180), width=3
+        )
+        
+        # Innerer Kreis (CD-Loch) - gefüllt
+        inner_size = 20
+        draw.ellipse(
+            [center_x - inner_size//2, icon_y - inner_size//2,
+             center_x + inner_size//2, icon_y + inner_size//2],
+            fill=(100, 120, 180), outline=(100, 120, 180), width=2
+        )
+        
+        # Reflektions-Arcs (CD-Glanz-Effekt)
+        arc_width = 2
+        draw.arc(
+            [center_x - icon_size//2 + 10, icon_y - icon_size//2 + 10,
+             center_x + icon_size//2 - 10, icon_y + icon_size//2 - 10],
+            start=45, end=135, fill=(140, 160, 220), width=arc_width
+        )
+        draw.arc(
+            [center_x - icon_size//2 + 10, icon_y - icon_size//2 + 10,
+             center_x + icon_size//2 - 10, icon_y + icon_size//2 - 10],
+            start=225, end=315, fill=(140, 160, 220), width=arc_width
+        )
+        
+        # Haupttext (direkt unter Icon)
+        text_y = icon_y + icon_size//2 + 40
+        text = "Bereit"
+        bbox = draw.textbbox((0, 0), text, font=font_main)
+        text_width = bbox[2] - bbox[0]
+        draw.text((center_x - text_width//2, text_y), text, fill=(180, 190, 220), font=font_main)
+        
+        # Subtext (darunter, etwas heller)
+        subtext = "Lege eine CD ein"
+        bbox_sub = draw.textbbox((0, 0), subtext, font=font_sub)
+        subtext_width = bbox_sub[2] - bbox_sub[0]
+        draw.text((center_x - subtext_width//2, text_y + 35), subtext, fill=(120, 140, 180), font=font_sub)
+        
+        return img
+    
     def _draw_text_wrapped(self, draw, text, font, y_pos, color, max_width):
         """
         Zeichnet Text mit automatischem Zeilenumbruch
@@ -245,86 +542,37 @@ class DisplayManager:
         if not self.enabled or not self.display:
             return
         
+        if self._dispatch(self.show_cd_with_cover, artist, album, cover_path=cover_path, year=year):
+            return
+        
         try:
-            # Weißer Hintergrund
-            img = Image.new('RGB', (self.width, self.height), color=(255, 255, 255))
-            draw = ImageDraw.Draw(img)
-            
-            # Fonts laden
-            try:
-                font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-                font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-            except:
-                font_medium = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # Cover laden und skalieren - 220px mit 10px Rand
-            cover_img = None
-            cover_size = 220  # 220px, lässt 10px Rand auf jeder Seite
-            cover_x = 10
-            cover_y = 10
-            
-            # Schatten zeichnen (leicht versetzt, dunkler)
-            shadow_offset = 3
-            draw.rectangle(
-                [(cover_x + shadow_offset, cover_y + shadow_offset), 
-                 (cover_x + cover_size + shadow_offset, cover_y + cover_size + shadow_offset)],
-                fill=(200, 200, 200)
-            )
-            
-            if cover_path:
-                try:
-                    if cover_path.startswith('http'):
-                        # Von URL laden
-                        response = requests.get(cover_path, timeout=5)
-                        cover_img = Image.open(BytesIO(response.content))
-                    else:
-                        # Von lokalem Pfad laden
-                        cover_img = Image.open(cover_path)
-                    
-                    # Cover auf quadratische Größe skalieren
-                    cover_img = cover_img.resize((cover_size, cover_size), Image.Resampling.LANCZOS)
-                    
-                    # Cover mit 10px Rand einfügen
-                    img.paste(cover_img, (cover_x, cover_y))
-                    
-                    # Border um das Cover zeichnen
-                    draw.rectangle(
-                        [(cover_x, cover_y), (cover_x + cover_size - 1, cover_y + cover_size - 1)],
-                        outline=(200, 200, 200),
-                        width=1
-                    )
-                    
-                    logger.info(f"Cover geladen: {cover_path[:50]}")
-                    
-                except Exception as e:
-                    logger.warning(f"Cover konnte nicht geladen werden: {e}")
-                    cover_path = None  # Fallback zu Platzhalter
-            
-            # Platzhalter zeichnen, wenn kein Cover
-            if not cover_path or not cover_img:
-                # Weißer Hintergrund für Platzhalter
-                draw.rectangle(
-                    [(cover_x, cover_y), (cover_x + cover_size, cover_y + cover_size)],
-                    fill=(255, 255, 255),
-                    outline=(150, 150, 150),
-                    width=2
-                )
-                # Platzhalter-Text (zentriert)
-                draw.text((cover_x + 75, cover_y + 95), "NO", fill=(120, 120, 120), font=font_medium)
-                draw.text((cover_x + 60, cover_y + 120), "COVER", fill=(120, 120, 120), font=font_medium)
+            img = self._cover_layer(cover_path, shadow_color=(200, 200, 200), placeholder_label=True)
             
             # Auf Display anzeigen
-            self.display.image(img)
+            self._push(img)
             logger.info(f"CD mit Cover angezeigt: {artist} - {album}")
             
         except Exception as e:
             logger.error(f"Fehler beim Anzeigen von CD mit Cover: {e}")
     
+    # Farben für verschiedene Steps
+    STEP_COLORS = {
+        'detecting': (100, 100, 200),
+        'identifying': (100, 100, 200),
+        'ripping': (100, 200, 100),     # Grün
+        'verifying': (100, 200, 100),
+        'encoding': (100, 150, 255),    # Blau
+        'tagging': (200, 150, 100),
+        'syncing': (200, 100, 200)      # Violett
+    }
+    
     def show_progress(self, step, progress, current_track=None, total_tracks=None, cover_path=None):
         """
         SCHRITT 4: Zeigt Cover mit Fortschrittsbalken
         
+        Cover, Icon und Rahmen kommen aus dem Layer-Cache, pro Frame wird
+        nur der Fortschrittsbalken gezeichnet.
+        
         Args:
             step: Phase (ripping, encoding, tagging, syncing)
             progress: Fortschritt in Prozent (0-100)
@@ -335,245 +583,204 @@ class DisplayManager:
         if not self.enabled or not self.display:
             return
         
+        if self._dispatch(self.show_progress, step, progress, current_track, total_tracks, cover_path):
+            return
+        
         try:
-            # Weißer Hintergrund
-            img = Image.new('RGB', (self.width, self.height), color=(255, 255, 255))
+            img = self._progress_layer(step, cover_path).copy()
             draw = ImageDraw.Draw(img)
             
-            # Fonts laden
-            try:
-                font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18)
-                font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            except:
-                font_medium = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # === COVER BEREICH (wie in show_cd_with_cover) ===
-            cover_size = 220
-            cover_x = 10
-            cover_y = 10
-            
-            # Schatten zeichnen
-            shadow_offset = 3
-            draw.rectangle(
-                [(cover_x + shadow_offset, cover_y + shadow_offset), 
-                 (cover_x + cover_size + shadow_offset, cover_y + cover_size + shadow_offset)],
-                fill=(180, 180, 180)
-            )
-            
-            # Cover laden (falls vorhanden)
-            if cover_path:
-                try:
-                    if cover_path.startswith('http'):
-                        response = requests.get(cover_path, timeout=5)
-                        cover_img = Image.open(BytesIO(response.content))
-                    else:
-                        cover_img = Image.open(cover_path)
-                    
-                    cover_img = cover_img.resize((cover_size, cover_size), Image.Resampling.LANCZOS)
-                    img.paste(cover_img, (cover_x, cover_y))
-                    
-                    # Border um das Cover
-                    draw.rectangle(
-                        [(cover_x, cover_y), (cover_x + cover_size - 1, cover_y + cover_size - 1)],
-                        outline=(200, 200, 200),
-                        width=1
-                    )
-                except Exception as e:
-                    logger.warning(f"Cover konnte nicht geladen werden: {e}")
-                    cover_path = None
-            
-            # Platzhalter, wenn kein Cover
-            if not cover_path:
-                draw.rectangle(
-                    [(cover_x, cover_y), (cover_x + cover_size, cover_y + cover_size)],
-                    fill=(255, 255, 255),
-                    outline=(150, 150, 150),
-                    width=2
-                )
-            
-            # === PROGRESS BEREICH (unterhalb des Covers) ===
-            progress_y = cover_y + cover_size + 20  # Mehr Abstand
-            
-            # Farben für verschiedene Steps
-            step_colors = {
-                'detecting': (100, 100, 200),
-                'identifying': (100, 100, 200),
-                'ripping': (100, 200, 100),     # Grün
-                'encoding': (100, 150, 255),    # Blau
-                'tagging': (200, 150, 100),
-                'syncing': (200, 100, 200)      # Violett
-            }
-            
-            # Icons für verschiedene Steps (Unicode Emojis)
-            step_icons = {
-                'detecting': '💿',
-                'identifying': '🔍',
-                'ripping': '💿',      # CD Icon
-                'encoding': '⚙️',     # Zahnrad/Encoding Icon
-                'tagging': '🏷️',
-                'syncing': '📤'       # Upload/Transfer Icon
-            }
-            
-            bar_color = step_colors.get(step, (100, 200, 100))
-            
-            # --- Vektor-Icon zeichnen (statt Emoji) ---
-            def _draw_vector_icon(step, x, y, size, color):
-                """Zeichnet einfache Vektor-Icons direkt auf das Haupt-Image"""
-                center_x = x + size // 2
-                center_y = y + size // 2
-                
-                if step in ['detecting', 'identifying', 'ripping']:
-                    # CD Icon
-                    # Äußerer Kreis
-                    draw.ellipse([x + 3, y + 3, x + size - 3, y + size - 3], outline=color, width=3)
-                    # Innerer Kreis (Loch)
-                    hole_size = size // 4
-                    hole_x = center_x - hole_size // 2
-                    hole_y = center_y - hole_size // 2
-                    draw.ellipse([hole_x, hole_y, hole_x + hole_size, hole_y + hole_size], fill=color)
-                    # Glanz-Effekt (kleine Bögen)
-                    draw.arc([x + 8, y + 8, x + size - 8, y + size - 8], 30, 60, fill=color, width=2)
-                    draw.arc([x + 8, y + 8, x + size - 8, y + size - 8], 130, 160, fill=color, width=2)
-                    
-                elif step in ['encoding', 'tagging']:
-                    # Zahnrad Icon
-                    import math
-                    radius = size // 3
-                    
-                    # 8 Zähne
-                    for i in range(8):
-                        angle = i * 45
-                        rad = math.radians(angle)
-                        
-                        # Äußere Punkte
-                        x1 = center_x + int((radius + 6) * math.cos(rad))
-                        y1 = center_y + int((radius + 6) * math.sin(rad))
-                        
-                        # Innere Punkte
-                        rad_left = math.radians(angle - 12)
-                        rad_right = math.radians(angle + 12)
-                        x2 = center_x + int(radius * math.cos(rad_left))
-                        y2 = center_y + int(radius * math.sin(rad_left))
-                        x3 = center_x + int(radius * math.cos(rad_right))
-                        y3 = center_y + int(radius * math.sin(rad_right))
-                        
-                        draw.polygon([x1, y1, x2, y2, x3, y3], fill=color)
-                    
-                    # Hauptkreis
-                    draw.ellipse([center_x - radius, center_y - radius, 
-                                 center_x + radius, center_y + radius], 
-                                outline=color, width=2)
-                    
-                    # Inneres Loch
-                    hole_radius = radius // 3
-                    draw.ellipse([center_x - hole_radius, center_y - hole_radius,
-                                 center_x + hole_radius, center_y + hole_radius],
-                                fill=color)
-                    
-                elif step == 'syncing':
-                    # Upload/Transfer Icon
-                    arrow_width = size // 3
-                    
-                    # Pfeilspitze (Dreieck nach oben)
-                    draw.polygon([
-                        center_x, y + 6,  # Spitze
-                        center_x - arrow_width, y + 18,  # Links
-                        center_x + arrow_width, y + 18   # Rechts
-                    ], fill=color)
-                    
-                    # Pfeilschaft
-                    shaft_width = arrow_width // 2
-                    draw.rectangle([
-                        center_x - shaft_width, y + 16,
-                        center_x + shaft_width, y + size - 10
-                    ], fill=color)
-                    
-                    # Basis-Linie
-                    draw.line([x + 6, y + size - 6, x + size - 6, y + size - 6], 
-                             fill=color, width=3)
-            
-            # Icon links neben der Progress Bar zeichnen
-            icon_size = 36
-            icon_x = 10
-            icon_y = progress_y + 4
-            _draw_vector_icon(step, icon_x, icon_y, icon_size, bar_color)
-
-            # Progress Bar - gleiche Höhe wie Icon, leicht abgerundete Ecken, mit Rahmen
-            bar_width = 220 - (icon_size + 8)
-            bar_height = 36  # Gleiche Höhe wie Icon
-            bar_x = icon_x + icon_size + 8
-            bar_y = progress_y + 4  # Gleiche Y-Position wie Icon
-            corner_radius = 4  # Kleine Rundung statt Pille
-            
-            # Funktion für abgerundetes Rechteck
-            def draw_rounded_rectangle(draw, coords, radius, fill=None, outline=None, width=1):
-                """Zeichnet ein Rechteck mit abgerundeten Ecken"""
-                x1, y1, x2, y2 = coords
-                
-                # Hauptrechtecke (ohne Ecken)
-                if fill:
-                    draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-                    draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-                    
-                    # Ecken (Kreise)
-                    draw.ellipse([x1, y1, x1 + radius * 2, y1 + radius * 2], fill=fill)
-                    draw.ellipse([x2 - radius * 2, y1, x2, y1 + radius * 2], fill=fill)
-                    draw.ellipse([x1, y2 - radius * 2, x1 + radius * 2, y2], fill=fill)
-                    draw.ellipse([x2 - radius * 2, y2 - radius * 2, x2, y2], fill=fill)
-                
-                if outline:
-                    # Outline mit Linien
-                    draw.arc([x1, y1, x1 + radius * 2, y1 + radius * 2], 180, 270, fill=outline, width=width)
-                    draw.arc([x2 - radius * 2, y1, x2, y1 + radius * 2], 270, 360, fill=outline, width=width)
-                    draw.arc([x1, y2 - radius * 2, x1 + radius * 2, y2], 90, 180, fill=outline, width=width)
-                    draw.arc([x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=outline, width=width)
-                    
-                    draw.line([x1 + radius, y1, x2 - radius, y1], fill=outline, width=width)
-                    draw.line([x1 + radius, y2, x2 - radius, y2], fill=outline, width=width)
-                    draw.line([x1, y1 + radius, x1, y2 - radius], fill=outline, width=width)
-                    draw.line([x2, y1 + radius, x2, y2 - radius], fill=outline, width=width)
-            
-            # Rahmen um die gesamte Bar (dunkelgrau)
-            frame_padding = 2
-            draw_rounded_rectangle(
-                draw,
-                [bar_x - frame_padding, bar_y - frame_padding, 
-                 bar_x + bar_width + frame_padding, bar_y + bar_height + frame_padding],
-                corner_radius + frame_padding,
-                outline=(150, 150, 150),
-                width=2
-            )
-            
-            # Hintergrund der Bar (hellgrau, abgerundet) - mit Abstand zum Rahmen
-            inner_padding = 2
-            draw_rounded_rectangle(
-                draw,
-                [bar_x + inner_padding, bar_y + inner_padding, 
-                 bar_x + bar_width - inner_padding, bar_y + bar_height - inner_padding],
-                corner_radius - 1,
-                fill=(240, 240, 240)
-            )
-            
             # Fortschritts-Balken (farbig je nach Step, abgerundet) - mit Abstand zum Rahmen
+            bar_x, bar_y, bar_width, bar_height = self._bar_geometry()
+            inner_padding = 2
+            corner_radius = 4
             if progress > 0:
                 progress_width = int((bar_width - inner_padding * 2) * (progress / 100))
                 if progress_width > corner_radius * 2:  # Nur zeichnen wenn breit genug für Rundung
-                    draw_rounded_rectangle(
+                    self._draw_rounded_rectangle(
                         draw,
                         [bar_x + inner_padding, bar_y + inner_padding, 
                          bar_x + inner_padding + progress_width, bar_y + bar_height - inner_padding],
                         corner_radius - 1,
-                        fill=bar_color
+                        fill=self.STEP_COLORS.get(step, (100, 200, 100))
                     )
             
             # Auf Display anzeigen
-            self.display.image(img)
+            self._push(img)
             logger.debug(f"Progress angezeigt: {step} {progress}%")
             
         except Exception as e:
             logger.error(f"Fehler beim Anzeigen des Fortschritts: {e}")
     
+    def _bar_geometry(self):
+        """
+        Position und Größe des Fortschrittsbalkens
+        
+        Returns:
+            Tuple (x, y, Breite, Höhe)
+        """
+        progress_y = self.COVER_Y + self.COVER_SIZE + 20  # Mehr Abstand
+        icon_size = 36
+        icon_x = 10
+        
+        # Progress Bar - gleiche Höhe wie Icon
+        bar_width = 220 - (icon_size + 8)
+        bar_x = icon_x + icon_size + 8
+        bar_y = progress_y + 4  # Gleiche Y-Position wie Icon
+        return bar_x, bar_y, bar_width, icon_size
+    
+    def _progress_layer(self, step, cover_path):
+        """
+        Vorgerenderter Progress-Screen ohne Füllstand (pro Album und Step)
+        
+        Args:
+            step: Phase (bestimmt Icon und Farbe)
+            cover_path: Pfad zum Cover-Bild (optional)
+            
+        Returns:
+            PIL Image (nicht verändern, ggf. kopieren)
+        """
+        background = self._cover_layer(cover_path, shadow_color=(180, 180, 180), placeholder_label=False)
+        key = ('progress', step)
+        if key in self._layers:
+            return self._layers[key]
+        
+        img = background.copy()
+        draw = ImageDraw.Draw(img)
+        bar_x, bar_y, bar_width, bar_height = self._bar_geometry()
+        corner_radius = 4  # Kleine Rundung statt Pille
+        
+        # Icon links neben der Progress Bar zeichnen
+        icon_size = bar_height
+        self._draw_vector_icon(draw, step, 10, bar_y, icon_size, self.STEP_COLORS.get(step, (100, 200, 100)))
+        
+        # Rahmen um die gesamte Bar (dunkelgrau)
+        frame_padding = 2
+        self._draw_rounded_rectangle(
+            draw,
+            [bar_x - frame_padding, bar_y - frame_padding, 
+             bar_x + bar_width + frame_padding, bar_y + bar_height + frame_padding],
+            corner_radius + frame_padding,
+            outline=(150, 150, 150),
+            width=2
+        )
+        
+        # Hintergrund der Bar (hellgrau, abgerundet) - mit Abstand zum Rahmen
+        inner_padding = 2
+        self._draw_rounded_rectangle(
+            draw,
+            [bar_x + inner_padding, bar_y + inner_padding, 
+             bar_x + bar_width - inner_padding, bar_y + bar_height - inner_padding],
+            corner_radius - 1,
+            fill=(240, 240, 240)
+        )
+        
+        self._layers[key] = img
+        return img
+    
+    def _draw_vector_icon(self, draw, step, x, y, size, color):
+        """Zeichnet einfache Vektor-Icons direkt auf das Haupt-Image"""
+        center_x = x + size // 2
+        center_y = y + size // 2
+        
+        if step in ['detecting', 'identifying', 'ripping', 'verifying']:
+            # CD Icon
+            # Äußerer Kreis
+            draw.ellipse([x + 3, y + 3, x + size - 3, y + size - 3], outline=color, width=3)
+            # Innerer Kreis (Loch)
+            hole_size = size // 4
+            hole_x = center_x - hole_size // 2
+            hole_y = center_y - hole_size // 2
+            draw.ellipse([hole_x, hole_y, hole_x + hole_size, hole_y + hole_size], fill=color)
+            # Glanz-Effekt (kleine Bögen)
+            draw.arc([x + 8, y + 8, x + size - 8, y + size - 8], 30, 60, fill=color, width=2)
+            draw.arc([x + 8, y + 8, x + size - 8, y + size - 8], 130, 160, fill=color, width=2)
+            
+        elif step in ['encoding', 'tagging']:
+            # Zahnrad Icon
+            import math
+            radius = size // 3
+            
+            # 8 Zähne
+            for i in range(8):
+                angle = i * 45
+                rad = math.radians(angle)
+                
+                # Äußere Punkte
+                x1 = center_x + int((radius + 6) * math.cos(rad))
+                y1 = center_y + int((radius + 6) * math.sin(rad))
+                
+                # Innere Punkte
+                rad_left = math.radians(angle - 12)
+                rad_right = math.radians(angle + 12)
+                x2 = center_x + int(radius * math.cos(rad_left))
+                y2 = center_y + int(radius * math.sin(rad_left))
+                x3 = center_x + int(radius * math.cos(rad_right))
+                y3 = center_y + int(radius * math.sin(rad_right))
+                
+                draw.polygon([x1, y1, x2, y2, x3, y3], fill=color)
+            
+            # Hauptkreis
+            draw.ellipse([center_x - radius, center_y - radius, 
+                         center_x + radius, center_y + radius], 
+                        outline=color, width=2)
+            
+            # Inneres Loch
+            hole_radius = radius // 3
+            draw.ellipse([center_x - hole_radius, center_y - hole_radius,
+                         center_x + hole_radius, center_y + hole_radius],
+                        fill=color)
+            
+        elif step == 'syncing':
+            # Upload/Transfer Icon
+            arrow_width = size // 3
+            
+            # Pfeilspitze (Dreieck nach oben)
+            draw.polygon([
+                center_x, y + 6,  # Spitze
+                center_x - arrow_width, y + 18,  # Links
+                center_x + arrow_width, y + 18   # Rechts
+            ], fill=color)
+            
+            # Pfeilschaft
+            shaft_width = arrow_width // 2
+            draw.rectangle([
+                center_x - shaft_width, y + 16,
+                center_x + shaft_width, y + size - 10
+            ], fill=color)
+            
+            # Basis-Linie
+            draw.line([x + 6, y + size - 6, x + size - 6, y + size - 6], 
+                     fill=color, width=3)
+    
+    @staticmethod
+    def _draw_rounded_rectangle(draw, coords, radius, fill=None, outline=None, width=1):
+        """Zeichnet ein Rechteck mit abgerundeten Ecken"""
+        x1, y1, x2, y2 = coords
+        
+        # Hauptrechtecke (ohne Ecken)
+        if fill:
+            draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
+            draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
+            
+            # Ecken (Kreise)
+            draw.ellipse([x1, y1, x1 + radius * 2, y1 + radius * 2], fill=fill)
+            draw.ellipse([x2 - radius * 2, y1, x2, y1 + radius * 2], fill=fill)
+            draw.ellipse([x1, y2 - radius * 2, x1 + radius * 2, y2], fill=fill)
+            draw.ellipse([x2 - radius * 2, y2 - radius * 2, x2, y2], fill=fill)
+        
+        if outline:
+            # Outline mit Linien
+            draw.arc([x1, y1, x1 + radius * 2, y1 + radius * 2], 180, 270, fill=outline, width=width)
+            draw.arc([x2 - radius * 2, y1, x2, y1 + radius * 2], 270, 360, fill=outline, width=width)
+            draw.arc([x1, y2 - radius * 2, x1 + radius * 2, y2], 90, 180, fill=outline, width=width)
+            draw.arc([x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=outline, width=width)
+            
+            draw.line([x1 + radius, y1, x2 - radius, y1], fill=outline, width=width)
+            draw.line([x1 + radius, y2, x2 - radius, y2], fill=outline, width=width)
+            draw.line([x1, y1 + radius, x1, y2 - radius], fill=outline, width=width)
+            draw.line([x2, y1 + radius, x2, y2 - radius], fill=outline, width=width)
+    
     def show_done(self):
         """Zeigt Erfolgs-Screen"""
         pass
@@ -584,9 +791,17 @@ class DisplayManager:
     
     def cleanup(self):
         """Cleanup beim Beenden"""
+        self._stop_render_thread()
+        
         if self.enabled and self.display:
+            # Wartet, falls der Render-Thread noch einen Frame zeichnet
+            if not self._render_lock.acquire(timeout=5):
+                logger.warning("Render-Thread reagiert nicht, Display wird nicht geleert")
+                return
             try:
                 self._show_black_screen()
                 logger.info("Display cleanup abgeschlossen")
             except:
                 pass
+            finally:
+                self._render_lock.release()
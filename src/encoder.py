@@ -6,9 +6,106 @@ Konvertiert WAV zu FLAC/MP3 basierend auf Profilen
 
 import logging
 import subprocess
+import threading
 import os
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
+
+from ripper import TrackSink
+
+
+# Eingabeformat der Stream-Encoder (entspricht cdparanoia -r)
+RAW_FLAC_ARGS = [
+    '--force-raw-format',
+    '--endian=little',
+    '--sign=signed',
+    '--channels=2',
+    '--bps=16',
+    '--sample-rate=44100'
+]
+RAW_LAME_ARGS = ['-r', '-s', '44.1', '--bitwidth', '16', '--signed', '--little-endian']
+
+
+class EncoderStream(TrackSink):
+    """
+    Laufender Encoder-Prozess, der rohe PCM-Daten über stdin erhält
+    """
+    
+    def __init__(self, process: subprocess.Popen, output_path: Path, format_type: str,
+                 logger: logging.Logger, timeout: int = 300,
+                 on_finished: Optional[Callable[[subprocess.Popen], None]] = None):
+        """
+        Args:
+            process: Gestarteter Encoder-Prozess mit stdin-Pipe
+            output_path: Ausgabe-Datei
+            format_type: "flac" oder "mp3"
+            logger: Logger des Encoders
+            timeout: Wartezeit auf Prozess-Ende nach Stream-Ende
+            on_finished: Optional Callback nach Prozess-Ende
+        """
+        self.process = process
+        self.output_path = output_path
+        self.format_type = format_type
+        self.logger = logger
+        self.timeout = timeout
+        self.on_finished = on_finished
+        self.bytes_written = 0
+    
+    def write(self, data: bytes) -> None:
+        """Schreibt PCM-Daten in den Encoder"""
+        self.process.stdin.write(data)
+        self.bytes_written += len(data)
+    
+    def close(self, success: bool = True) -> bool:
+        """
+        Beendet den Stream und wartet auf den Encoder
+        
+        Args:
+            success: False verwirft die (unvollständige) Ausgabe
+            
+        Returns:
+            True wenn die Ausgabedatei erfolgreich erstellt wurde
+        """
+        try:
+            return self._finish(success)
+        finally:
+            if self.on_finished:
+                self.on_finished(self.process)
+    
+    def _finish(self, success: bool) -> bool:
+        """Schließt stdin und prüft das Ergebnis des Encoders"""
+        try:
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        
+        if not success:
+            self.process.kill()
+            self.process.wait()
+            self.output_path.unlink(missing_ok=True)
+            return False
+        
+        try:
+            stderr = self.process.stderr.read().decode('utf-8', errors='replace')
+            returncode = self.process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+            self.logger.error(f"Timeout beim {self.format_type.upper()}-Encoding")
+            return False
+        
+        if returncode != 0:
+            self.logger.error(f"{self.format_type} Exit-Code {returncode}: {stderr}")
+            return False
+        
+        if not self.output_path.exists() or self.output_path.stat().st_size == 0:
+            self.logger.error(f"{self.format_type.upper()}-Datei fehlt oder leer")
+            return False
+        
+        size_mb = self.output_path.stat().st_size / (1024 * 1024)
+        ratio = (self.output_path.stat().st_size / self.bytes_written) * 100 if self.bytes_written else 0
+        self.logger.info(f"✅ {self.format_type.upper()} erstellt ({size_mb:.1f} MB, {ratio:.0f}% vom Original)")
+        return True
 
 
 class AudioEncoder:
@@ -26,6 +123,79 @@ class AudioEncoder:
         self.config = config
         self.logger = logging.getLogger('cd_ripper.encoder')
         self.profiles = config.get('encoder', {}).get('profiles', {})
+        
+        # Parallele Encoder-Prozesse (Default: Anzahl CPU-Kerne)
+        self.workers = config.get('encoder', {}).get('workers') or os.cpu_count() or 1
+        
+        # Gemeinsames Limit für Datei-Encodes, auch wenn mehrere Laufwerke
+        # gleichzeitig rippen (Streaming-Encoder laufen im Lesetempo der CD)
+        self._slots = threading.BoundedSemaphore(self.workers)
+        
+        # Laufende Prozesse, damit stop() sie beenden kann
+        self._processes = set()
+        self._process_lock = threading.Lock()
+        self._stop_event = threading.Event()
+    
+    def _run(self, cmd: List[str], timeout: int = 300) -> subprocess.CompletedProcess:
+        """
+        Führt ein Encoder-Kommando aus (abbrechbar über stop())
+        
+        Args:
+            cmd: Kommando als Liste
+            timeout: Timeout in Sekunden
+            
+        Returns:
+            CompletedProcess mit returncode, stdout, stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: Bei Timeout
+        """
+        with self._slots:
+            if self._stop_event.is_set():
+                return subprocess.CompletedProcess(cmd, -1, '', 'Encoder wurde gestoppt')
+            
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            with self._process_lock:
+                self._processes.add(process)
+            
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                self._forget_process(process)
+        
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    
+    def _forget_process(self, process: subprocess.Popen):
+        """Entfernt einen beendeten Prozess aus der Überwachung"""
+        with self._process_lock:
+            self._processes.discard(process)
+    
+    def stop(self):
+        """
+        Stoppt alle laufenden und wartenden Encoding-Jobs
+        (beim Herunterfahren des Services)
+        
+        Der Stopp ist endgültig: danach gestartete Encodes schlagen sofort
+        fehl, der Encoder ist nicht wiederverwendbar.
+        """
+        self._stop_event.set()
+        
+        with self._process_lock:
+            processes = list(self._processes)
+        
+        for process in processes:
+            if process.poll() is None:
+                self.logger.info(f"Beende Encoder-Prozess {process.pid}")
+                process.terminate()
     
     def get_profile(self, category: int) -> Dict[str, Any]:
         """
@@ -84,12 +254,7 @@ class AudioEncoder:
         self.logger.debug(f"Kommando: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 Minuten Timeout
-            )
+            result = self._run(cmd, timeout=300)  # 5 Minuten Timeout
             
             if result.returncode == 0:
                 if output_path.exists() and output_path.stat().st_size > 0:
@@ -148,12 +313,7 @@ class AudioEncoder:
         self.logger.debug(f"Kommando: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 Minuten Timeout
-            )
+            result = self._run(cmd, timeout=300)  # 5 Minuten Timeout
             
             if result.returncode == 0:
                 if output_path.exists() and output_path.stat().st_size > 0:
@@ -195,6 +355,24 @@ class AudioEncoder:
         
         self.logger.info(f"Encode mit Profil: Kategorie {category} → {format_type.upper()}")
         
+        return self.encode_with_profile(input_file, output_file, profile, progress_callback)
+    
+    def encode_with_profile(self, input_file: str, output_file: str, profile: Dict[str, Any],
+                            progress_callback: Optional[Callable[[int], None]] = None) -> bool:
+        """
+        Konvertiert Audio-Datei mit einem Encoding-Profil
+        
+        Args:
+            input_file: Eingabe-Datei (WAV)
+            output_file: Ausgabe-Datei
+            profile: Encoding-Profil (format, bitrate, compression)
+            progress_callback: Optional Callback für Progress
+            
+        Returns:
+            True bei Erfolg
+        """
+        format_type = profile.get('format', 'flac').lower()
+        
         if format_type == 'mp3':
             bitrate = profile.get('bitrate', 320)
             return self.encode_to_mp3(input_file, output_file, bitrate, progress_callback)
@@ -207,6 +385,65 @@ class AudioEncoder:
             self.logger.error(f"Unbekanntes Format: {format_type}")
             return False
     
+    def open_stream(self, output_file: str, profile: Dict[str, Any]) -> Optional[EncoderStream]:
+        """
+        Startet einen Encoder, der rohe PCM-Daten (cdparanoia -r) über stdin liest
+        
+        Args:
+            output_file: Ausgabe-Datei
+            profile: Encoding-Profil (format, bitrate, compression)
+            
+        Returns:
+            EncoderStream oder None bei Fehler
+        """
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        format_type = profile.get('format', 'flac').lower()
+        
+        cmd: List[str]
+        if format_type == 'mp3':
+            bitrate = profile.get('bitrate', 320)
+            self.logger.info(f"Konvertiere Stream zu MP3 ({bitrate} kbps): {output_path.name}")
+            cmd = ['lame'] + RAW_LAME_ARGS + [
+                '--preset', 'cbr', str(bitrate),
+                '-h',
+                '--quiet',
+                '-',  # stdin
+                str(output_path)
+            ]
+        elif format_type == 'flac':
+            compression = profile.get('compression', 8)
+            self.logger.info(f"Konvertiere Stream zu FLAC (Compression {compression}): {output_path.name}")
+            cmd = ['flac', f'-{compression}'] + RAW_FLAC_ARGS + [
+                '--totally-silent',
+                '-f',
+                '-o', str(output_path),
+                '-'  # stdin
+            ]
+        else:
+            self.logger.error(f"Unbekanntes Format: {format_type}")
+            return None
+        
+        self.logger.debug(f"Kommando: {' '.join(cmd)}")
+        
+        if self._stop_event.is_set():
+            return None
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            with self._process_lock:
+                self._processes.add(process)
+            return EncoderStream(process, output_path, format_type, self.logger,
+                                 on_finished=self._forget_process)
+        except Exception as e:
+            self.logger.error(f"Fehler beim Starten des {format_type.upper()}-Encoders: {e}")
+            return None
+    
     def get_output_extension(self, category: int) -> str:
         """
         Gibt Dateiendung für Kategorie zurück
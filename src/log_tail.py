@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Log Tail Module
+Liest das Ende der Log-Datei blockweise von hinten und liefert neue Zeilen
+ab einem Cursor (Inode + Byte-Offset), auch über Log-Rotation hinweg
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+BLOCK_SIZE = 8192
+MAX_INCREMENT_BYTES = 256 * 1024
+
+
+def make_cursor(inode: int, offset: int) -> str:
+    """Erstellt einen Cursor-String 'inode:offset'"""
+    return f"{inode}:{offset}"
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Zerlegt einen Cursor-String
+
+    Returns:
+        Tuple (Inode, Offset) oder None bei ungültigem Cursor
+    """
+    try:
+        inode, offset = cursor.split(':', 1)
+        return int(inode), int(offset)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _decode(lines: List[bytes]) -> List[str]:
+    return [line.decode('utf-8', errors='replace') for line in lines if line.strip()]
+
+
+def tail_lines(path: Path, count: int, block_size: int = BLOCK_SIZE) -> Tuple[List[str], Optional[str]]:
+    """
+    Liest die letzten vollständigen Zeilen einer Datei (rückwärts, blockweise)
+
+    Args:
+        path: Log-Datei
+        count: Anzahl Zeilen
+        block_size: Größe der Leseblöcke
+
+    Returns:
+        Tuple (Zeilen, Cursor hinter der letzten vollständigen Zeile)
+    """
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return [], None
+
+    with f:
+        stat = os.fstat(f.fileno())
+        pos = stat.st_size
+        data = b''
+
+        # count + 1 Zeilenumbrüche: auch die erste Zeile ist dann vollständig
+        while pos > 0 and data.count(b'\n') < count + 1:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            data = f.read(size) + data
+
+    complete_end = data.rfind(b'\n') + 1
+    lines = data[:complete_end].split(b'\n')[:-1]
+    if pos > 0 and lines:
+        lines = lines[1:]
+
+    selected = lines[-count:] if count > 0 else []
+    return _decode(selected), make_cursor(stat.st_ino, pos + complete_end)
+
+
+def _read_from(path: Path, offset: int, limit: int) -> Optional[Tuple[bytes, int, int]]:
+    """Liest ab offset bis zum Ende (None wenn mehr als limit Bytes)"""
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        size = stat.st_size
+        if offset > size:
+            # Datei wurde gekürzt
+            offset = 0
+        if size - offset > limit:
+            return None
+        f.seek(offset)
+        return f.read(), offset, stat.st_ino
+
+
+def read_since(path: Path, cursor: Optional[str], count: int,
+               max_bytes: int = MAX_INCREMENT_BYTES) -> Tuple[List[str], Optional[str], bool]:
+    """
+    Liefert nur die seit dem Cursor angehängten Zeilen
+
+    Nach einer Rotation durch RotatingFileHandler wird der Rest der
+    rotierten Datei (path.1) und danach die neue Datei gelesen. Ist der
+    Cursor ungültig, zu alt oder liegen mehr als max_bytes dazwischen,
+    werden stattdessen die letzten count Zeilen geliefert.
+
+    Args:
+        path: Log-Datei
+        cursor: Cursor aus einem vorherigen Aufruf (oder None)
+        count: Anzahl Zeilen bei einem Neustart
+        max_bytes: Maximale Datenmenge für ein inkrementelles Update
+
+    Returns:
+        Tuple (Zeilen, neuer Cursor, Neustart - Client soll Liste ersetzen)
+    """
+    position = parse_cursor(cursor)
+
+    try:
+        current_inode = os.stat(path).st_ino
+    except FileNotFoundError:
+        return [], None, True
+
+    if position is None:
+        lines, new_cursor = tail_lines(path, count)
+        return lines, new_cursor, True
+
+    inode, offset = position
+    chunks = []
+
+    try:
+        if inode != current_inode:
+            rotated = Path(f"{path}.1")
+            if not rotated.exists() or os.stat(rotated).st_ino != inode:
+                lines, new_cursor = tail_lines(path, count)
+                return lines, new_cursor, True
+
+            result = _read_from(rotated, offset, max_bytes)
+            if result is None:
+                lines, new_cursor = tail_lines(path, count)
+                return lines, new_cursor, True
+            chunks.append(result[0])
+            offset = 0
+
+        result = _read_from(path, offset, max_bytes)
+        if result is None:
+            lines, new_cursor = tail_lines(path, count)
+            return lines, new_cursor, True
+    except FileNotFoundError:
+        # Rotation während des Lesens - beim nächsten Aufruf neu versuchen
+        return [], cursor, False
+
+    data, offset, current_inode = result
+    complete_end = data.rfind(b'\n') + 1
+    chunks.append(data[:complete_end])
+
+    lines = b''.join(chunks).split(b'\n')
+    return _decode(lines), make_cursor(current_inode, offset + complete_end), False
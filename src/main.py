@@ -8,20 +8,44 @@ import logging
 import time
 import signal
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Tuple
 import yaml
 
 from cd_detector import CDDetector
 from cd_identifier import CDIdentifier
 from cd_categorizer import CDCategorizer
-from ripper import CDRipper
+from ripper import CDRipper, CD_SECTOR_BYTES
 from encoder import AudioEncoder
 from tagger import AudioTagger
 from syncer import ServerSyncer
-from utils import setup_logging, sanitize_filename
+from utils import setup_logging, sanitize_filename, get_state_dir
 from shared_status import SharedStatus
 from display_manager import DisplayManager
+from pipeline import TrackPipeline, PipelineStage, TrackJob
+from cover_cache import CoverCache
+from mb_cache import MusicBrainzCache
+from sync_queue import SyncQueue
+from verifier import AccurateRipDatabase, DiscVerifier, ChecksumSink, DiscardSink, accuraterip_ids, checksum_file
+from rip_journal import RipJournal
+from disc_index import DiscIndex, DiscRecord, DUPLICATE_ACTIONS
+
+
+@dataclass
+class DriveWorker:
+    """Ein CD-Laufwerk mit eigener Erkennung, Identifikation und eigenem Ripper"""
+    drive_id: str
+    device: str
+    detector: CDDetector
+    identifier: CDIdentifier
+    ripper: CDRipper
+    logger: logging.Logger
+    status_key: Optional[str] = None    # None: Einzel-Laufwerk, Status wie bisher auf oberster Ebene
+    cover_path: Optional[str] = None
+    processing: bool = False
+    thread: Optional[threading.Thread] = None
 
 
 class CDRipperService:
@@ -48,27 +72,82 @@ class CDRipperService:
         self.logger.info("=" * 60)
         
         # Module initialisieren
-        device = self.config.get('ripper', {}).get('device', '/dev/sr0')
-        self.detector = CDDetector(device=device, poll_interval=2)
-        self.identifier = CDIdentifier(device=device)
+        tagger_config = self.config.get('tagger', {})
+        self.cover_cache = CoverCache(
+            str(get_state_dir(self.config) / 'covers'),
+            max_bytes=tagger_config.get('cover_cache_mb', 50) * 1024 * 1024,
+            timeout=tagger_config.get('timeout', 10)
+        )
+        identification_config = self.config.get('identification', {})
+        self.mb_cache = MusicBrainzCache(
+            str(get_state_dir(self.config) / 'musicbrainz.sqlite'),
+            ttl_seconds=identification_config.get('cache_ttl_days', 30) * 24 * 3600,
+            max_entries=identification_config.get('cache_max_entries', 2000)
+        )
         self.categorizer = CDCategorizer()
-        self.ripper = CDRipper(
-            device=self.config.get('ripper', {}).get('device', '/dev/sr0'),
-            quality=self.config.get('ripper', {}).get('quality', 'paranoia')
+        
+        # Ein Worker pro Laufwerk; Encoder, Tagger, Syncer und Sync-Warteschlange
+        # werden von allen Laufwerken gemeinsam genutzt
+        self.drives = self._create_drives()
+        self.detector = self.drives[0].detector
+        self.identifier = self.drives[0].identifier
+        self.ripper = self.drives[0].ripper
+        verify_config = self.config.get('verify', {})
+        self.accuraterip = AccurateRipDatabase(
+            str(get_state_dir(self.config) / 'accuraterip'),
+            local_dir=verify_config.get('local_db') or None,
+            timeout=verify_config.get('timeout', 10)
         )
+        self.rip_mode = self.config.get('ripper', {}).get('mode', 'wav')
+        
+        # Journal pro Disc: nach Neustart oder erneutem Einlegen fortsetzen
+        journal_config = self.config.get('journal', {})
+        self.journal = None
+        if journal_config.get('enabled', True):
+            self.journal = RipJournal(
+                str(get_state_dir(self.config) / 'journal'),
+                keep_days=journal_config.get('keep_days', 30)
+            )
+        
+        # Index gerippter CDs: erneut eingelegte CDs allein anhand der TOC erkennen
+        index_config = self.config.get('index', {})
+        self.disc_index = None
+        if index_config.get('enabled', True):
+            self.disc_index = DiscIndex(str(get_state_dir(self.config) / 'disc_index.sqlite'))
+        self.duplicate_action = index_config.get('duplicate_action', 'skip')
+        if self.duplicate_action not in DUPLICATE_ACTIONS:
+            self.logger.warning(f"Unbekannte index.duplicate_action '{self.duplicate_action}', verwende 'skip'")
+            self.duplicate_action = 'skip'
         self.encoder = AudioEncoder(self.config)
-        self.tagger = AudioTagger(self.config)
+        self.tagger = AudioTagger(self.config, cover_cache=self.cover_cache)
         self.syncer = ServerSyncer(self.config)
         
-        # Shared Status für Web-Interface
+        # Shared Status für Web-Interface (im Multi-Laufwerk-Betrieb ein Eintrag pro Laufwerk)
         self.shared_status = SharedStatus()
+        if len(self.drives) > 1:
+            self.shared_status.set_drives({drive.drive_id: drive.device for drive in self.drives})
         
-        # Cover-Path für Display
-        self.current_cover_path = None
+        # Hintergrund-Sync: persistente Warteschlange, CD wird sofort ausgeworfen
+        sync_config = self.config.get('sync', {})
+        self.sync_queue = SyncQueue(
+            str(get_state_dir(self.config) / 'sync_queue'),
+            self.syncer.sync_directory,
+            base_delay=sync_config.get('retry_base_delay', 30),
+            max_delay=sync_config.get('retry_max_delay', 3600),
+            on_change=lambda summary: self.shared_status.update_sync(
+                {key: value for key, value in summary.items() if key != 'tasks'}
+            ),
+            on_done=self._sync_done
+        )
         
-        # Display Manager
+        # Display Manager (zeigt im Multi-Laufwerk-Betrieb das zuerst aktive Laufwerk)
         display_config = self.config.get('display', {})
         self.display = DisplayManager(display_config)
+        self._display_lock = threading.Lock()
+        self._display_drive: Optional[DriveWorker] = None
+        
+        # Blockierender Sync: immer nur ein Album gleichzeitig
+        self._sync_lock = threading.Lock()
         
         # Output-Verzeichnis
         self.output_dir = Path(self.config.get('output', {}).get('local_path', '/mnt/dietpi_userdata/rips'))
@@ -76,7 +155,6 @@ class CDRipperService:
         
         # Service-Status
         self.running = True
-        self.processing = False
         
         # Signal-Handler für graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -94,53 +172,148 @@ class CDRipperService:
         if self.processing:
             self.logger.info("Warte auf Abschluss der aktuellen Verarbeitung...")
     
-    def process_cd(self) -> bool:
+    @property
+    def processing(self) -> bool:
+        """True solange auf irgendeinem Laufwerk eine CD verarbeitet wird"""
+        return any(drive.processing for drive in self.drives)
+    
+    def _create_drives(self) -> List[DriveWorker]:
+        """
+        Erstellt die Laufwerks-Worker aus der Konfiguration
+        
+        ripper.devices listet mehrere Laufwerke, jeweils als Device-Pfad oder
+        als Dictionary mit eigenen ripper-Werten (z.B. read_offset). Ohne
+        devices wird wie bisher nur ripper.device verwendet.
+        
+        Returns:
+            Liste der DriveWorker (mindestens einer)
+        """
+        ripper_config = self.config.get('ripper', {})
+        entries = ripper_config.get('devices') or [ripper_config.get('device', '/dev/sr0')]
+        multi_drive = len(entries) > 1
+        
+        drives = []
+        used_ids = set()
+        for entry in entries:
+            drive_config = dict(ripper_config)
+            if isinstance(entry, dict):
+                drive_config.update(entry)
+            else:
+                drive_config['device'] = entry
+            device = drive_config.get('device', '/dev/sr0')
+            
+            drive_id = sanitize_filename(Path(device).name) or 'drive'
+            if drive_id in used_ids:
+                drive_id = f"{drive_id}-{len(drives) + 1}"
+            used_ids.add(drive_id)
+            
+            drives.append(DriveWorker(
+                drive_id=drive_id,
+                device=device,
+                detector=CDDetector(
+                    device=device,
+                    poll_interval=2,
+                    backend=drive_config.get('detection', 'auto')
+                ),
+                identifier=CDIdentifier(device=device, cover_cache=self.cover_cache,
+                                        mb_cache=self.mb_cache),
+                ripper=CDRipper(
+                    device=device,
+                    quality=drive_config.get('quality', 'paranoia'),
+                    read_offset=drive_config.get('read_offset', 0),
+                    reread_margin=drive_config.get('reread_margin', 8),
+                    spool_dir=drive_config.get('spool_dir') or None,
+                    spool_memory_mb=drive_config.get('spool_memory_mb', 64)
+                ),
+                logger=self.logger.getChild(drive_id) if multi_drive else self.logger,
+                status_key=drive_id if multi_drive else None
+            ))
+        
+        if multi_drive:
+            self.logger.info(f"Multi-Laufwerk-Betrieb: {', '.join(d.device for d in drives)}")
+        return drives
+    
+    def _owns_display(self, drive: DriveWorker) -> bool:
+        """
+        Prüft, ob ein Laufwerk das Display nutzen darf (übernimmt es, wenn frei)
+        
+        Args:
+            drive: Laufwerks-Worker
+            
+        Returns:
+            True wenn das Laufwerk das Display belegt
+        """
+        with self._display_lock:
+            if self._display_drive is None:
+                self._display_drive = drive
+            return self._display_drive is drive
+    
+    def _release_display(self, drive: DriveWorker):
+        """Gibt das Display für das nächste aktive Laufwerk frei"""
+        with self._display_lock:
+            if self._display_drive is drive:
+                self._display_drive = None
+    
+    def process_cd(self, drive: Optional[DriveWorker] = None) -> bool:
         """
         Verarbeitet eine eingelegte CD komplett
+        
+        Args:
+            drive: Laufwerks-Worker (Default: erstes Laufwerk)
             
         Returns:
             True bei Erfolg, False bei Fehler
         """
-        self.processing = True
+        drive = drive or self.drives[0]
+        drive.processing = True
+        journal = None
         
         try:
-            self.logger.info("=" * 60)
-            self.logger.info("Starte CD-Verarbeitung")
-            self.logger.info("=" * 60)
+            drive.logger.info("=" * 60)
+            drive.logger.info("Starte CD-Verarbeitung")
+            drive.logger.info("=" * 60)
+            
+            # 0. Bereits gerippt? Antwort allein aus TOC und Index, ohne MusicBrainz
+            if self.disc_index:
+                known = self._handle_known_disc(drive)
+                if known is not None:
+                    return known
             
             # 1. CD identifizieren
-            self.logger.info("Schritt 1/6: CD-Identifikation")
-            cd_info = self.identifier.identify_cd()
+            drive.logger.info("Schritt 1/6: CD-Identifikation")
+            cd_info = drive.identifier.identify_cd()
             
             if not cd_info:
-                self.logger.error("CD konnte nicht identifiziert werden")
+                drive.logger.error("CD konnte nicht identifiziert werden")
                 return False
             
-            self.logger.info(f"CD identifiziert: {cd_info.artist} - {cd_info.album}")
+            drive.logger.info(f"CD identifiziert: {cd_info.artist} - {cd_info.album}")
             
             # Shared Status aktualisieren
             cover_path = None
             if cd_info.cover_data:
-                cover_path = self.shared_status.save_cover(cd_info.cover_data, "/tmp")
+                cover_path = self.shared_status.save_cover(cd_info.cover_data, "/tmp", drive=drive.status_key)
             
             # Cover-Path für Display speichern
-            self.current_cover_path = cover_path
+            drive.cover_path = cover_path
             
             self.shared_status.update_cd(
                 name=cd_info.album,
                 artist=cd_info.artist,
-                cover_path=cover_path
+                cover_path=cover_path,
+                drive=drive.status_key
             )
-            self.shared_status.set_processing(True)
+            self.shared_status.set_processing(True, drive=drive.status_key)
             
             # Display aktualisieren
-            self.display.show_cd_info(
-                {'name': cd_info.album, 'artist': cd_info.artist},
-                cover_path
-            )
+            if self._owns_display(drive):
+                self.display.show_cd_info(
+                    {'name': cd_info.album, 'artist': cd_info.artist},
+                    cover_path
+                )
             
             # 2. Kategorisieren
-            self.logger.info("Schritt 2/6: Kategorisierung")
+            drive.logger.info("Schritt 2/6: Kategorisierung")
             category_result = self.categorizer.categorize(
                 artist=cd_info.artist,
                 album=cd_info.album,
@@ -148,109 +321,34 @@ class CDRipperService:
                 tracks=cd_info.tracks,
                 year=cd_info.year
             )
-            self.logger.info(f"Kategorie: {category_result.category_name} (Confidence: {category_result.confidence:.2f})")
-            self.logger.info(f"Grund: {category_result.reason}")
+            drive.logger.info(f"Kategorie: {category_result.category_name} (Confidence: {category_result.confidence:.2f})")
+            drive.logger.info(f"Grund: {category_result.reason}")
             
             # 3. Format-Profil ermitteln
             profile = self.encoder.get_profile(category_result.category)
-            self.logger.info(f"Encoding-Format: {profile['format'].upper()}")
+            drive.logger.info(f"Encoding-Format: {profile['format'].upper()}")
             
             # 4. Arbeitsverzeichnis erstellen
             album_dir = self._create_album_directory(cd_info)
-            self.logger.info(f"Arbeitsverzeichnis: {album_dir}")
-            
-            # 5. Tracks rippen
-            self.logger.info("Schritt 3/6: CD-Ripping")
-            ripped_files = []
-            
-            for track_info in cd_info.tracks:
-                if not self.running:
-                    self.logger.warning("Service wird beendet, breche Ripping ab")
-                    return False
-                
-                track_num = track_info.number
-                
-                # Dateinamen erstellen
-                track_name = sanitize_filename(track_info.title)
-                wav_file = album_dir / f"track{track_num:02d}.wav"
-                
-                self.logger.info(f"Rippe Track {track_num}/{len(cd_info.tracks)}: {track_name}")
-                
-                # Progress Update: Start Track
-                progress = int((track_num - 1) / len(cd_info.tracks) * 100)
-                self.shared_status.update_progress('ripping', progress, track_num, len(cd_info.tracks))
-                self.display.show_progress('ripping', progress, track_num, len(cd_info.tracks), self.current_cover_path)
-                
-                success = self.ripper.rip_track(
-                    track_num,
-                    str(wav_file),
-                    progress_callback=lambda p: self.logger.debug(f"Track {track_num} Progress: {p}%")
-                )
-                
-                if success:
-                    ripped_files.append((track_num, str(wav_file), track_info))
-                    self.logger.info(f"✓ Track {track_num} erfolgreich gerippt")
-                    # Progress Update: Track completed
-                    progress = int(track_num / len(cd_info.tracks) * 100)
-                    self.shared_status.update_progress('ripping', progress, track_num, len(cd_info.tracks))
-                    self.display.show_progress('ripping', progress, track_num, len(cd_info.tracks), self.current_cover_path)
-                else:
-                    self.logger.error(f"✗ Track {track_num} fehlgeschlagen")
-            
-            if not ripped_files:
-                self.logger.error("Keine Tracks erfolgreich gerippt")
-                return False
-            
-            # 6. Encoding
-            self.logger.info("Schritt 4/6: Audio-Encoding")
-            encoded_files = []
+            drive.logger.info(f"Arbeitsverzeichnis: {album_dir}")
             
-            for track_num, wav_file, track_info in ripped_files:
-                if not self.running:
-                    self.logger.warning("Service wird beendet, breche Encoding ab")
+            # Journal öffnen: erledigte Schritte früherer Durchläufe überspringen
+            resume = {}
+            if self.journal:
+                journal = self.journal.open(cd_info.disc_id, str(album_dir), profile['format'])
+                if journal is None:
+                    drive.logger.warning("CD wird bereits in einem anderen Laufwerk verarbeitet")
                     return False
-                
-                track_name = sanitize_filename(track_info.title)
-                output_file = album_dir / f"{track_num:02d} - {track_name}.{profile['format']}"
-                
-                self.logger.info(f"Encodiere Track {track_num}: {track_name}")
-                
-                # Progress Update: Start encoding
-                progress = int((track_num - 1) / len(ripped_files) * 100)
-                self.shared_status.update_progress('encoding', progress, track_num, len(ripped_files))
-                self.display.show_progress('encoding', progress, track_num, len(ripped_files), self.current_cover_path)
-                
-                if profile['format'] == 'mp3':
-                    success = self.encoder.encode_to_mp3(
-                        wav_file,
-                        str(output_file),
-                        bitrate=profile.get('bitrate', 320)
-                    )
-                else:  # FLAC
-                    success = self.encoder.encode_to_flac(
-                        wav_file,
-                        str(output_file),
-                        compression=profile.get('compression', 8)
-                    )
-                
-                if success:
-                    encoded_files.append((track_num, str(output_file), track_info))
-                    self.logger.info(f"✓ Track {track_num} erfolgreich encodiert")
-                    # Progress Update: Encoding completed
-                    progress = int(track_num / len(ripped_files) * 100)
-                    self.shared_status.update_progress('encoding', progress, track_num, len(ripped_files))
-                    self.display.show_progress('encoding', progress, track_num, len(ripped_files), self.current_cover_path)
-                    # WAV-Datei löschen nach Encoding
-                    Path(wav_file).unlink()
-                else:
-                    self.logger.error(f"✗ Track {track_num} Encoding fehlgeschlagen")
-            
-            if not encoded_files:
-                self.logger.error("Keine Tracks erfolgreich encodiert")
-                return False
-            
-            # 7. Tagging
-            self.logger.info("Schritt 5/6: Metadaten-Tagging")
+                if journal.tracks:
+                    resume = {t.number: journal.resume_step(t.number) for t in cd_info.tracks}
+                    resume = {number: step for number, step in resume.items() if step}
+                    if self.rip_mode in ('stream', 'disc'):
+                        # WAV-Zwischenstände (z.B. aus dem WAV-Modus) sind ohne Encoding-Stufe nutzlos
+                        resume = {number: step for number, step in resume.items()
+                                  if step not in ('ripped', 'verified')}
+                    drive.logger.info(f"Journal gefunden: {len(resume)}/{len(cd_info.tracks)} Tracks "
+                                      f"ganz oder teilweise erledigt, setze fort")
+                self._remove_leftover_wavs(album_dir, journal, resume, drive)
             
             # Album-Metadaten vorbereiten
             album_metadata = {
@@ -258,91 +356,762 @@ class CDRipperService:
                 'album': cd_info.album,
                 'date': str(cd_info.year) if cd_info.year else None,
                 'track_total': len(cd_info.tracks),
-                'genre': cd_info.genre
+                'genre': cd_info.genre,
+                'musicbrainz_id': cd_info.musicbrainz_id
             }
             
-            for track_num, audio_file, track_info in encoded_files:
-                if not self.running:
-                    self.logger.warning("Service wird beendet, breche Tagging ab")
+            # 5.-7. Rippen, Encoding und Tagging überlappend:
+            # Während cdparanoia Track N+1 liest, wird Track N encodiert und getaggt
+            drive.logger.info("Schritt 3/6: CD-Ripping")
+            drive.logger.info("Schritt 4/6 + 5/6: Encoding und Tagging laufen parallel zum Ripping")
+            
+            total_tracks = len(cd_info.tracks)
+            progress_lock = threading.Lock()
+            stage_done = {'ripping': 0, 'encoding': 0, 'tagging': 0}
+            ripping_done = threading.Event()
+            
+            def report_stage_done(step: str):
+                with progress_lock:
+                    stage_done[step] += 1
+                    done = stage_done[step]
+                # Solange gerippt wird, zeigt der Status den Ripping-Fortschritt
+                if step != 'ripping' and not ripping_done.is_set():
+                    return
+                self._update_progress(step, int(done / total_tracks * 100), done, total_tracks, drive)
+            
+            def output_file_for(track_info) -> Path:
+                track_name = sanitize_filename(track_info.title)
+                return album_dir / f"{track_info.number:02d} - {track_name}.{profile['format']}"
+            
+            def encode_stage(job: TrackJob) -> bool:
+                if journal and job.output_file and journal.done(job.track_number, 'encoded'):
+                    # Bereits in einem früheren Durchlauf encodiert
+                    report_stage_done('encoding')
+                    return True
+                
+                track_name = sanitize_filename(job.track_info.title)
+                output_file = output_file_for(job.track_info)
+                
+                drive.logger.info(f"Encodiere Track {job.track_number}: {track_name}")
+                
+                success = self.encoder.encode_with_profile(job.wav_file, str(output_file), profile)
+                
+                if not success:
+                    drive.logger.error(f"✗ Track {job.track_number} Encoding fehlgeschlagen")
                     return False
                 
+                job.output_file = str(output_file)
+                drive.logger.info(f"✓ Track {job.track_number} erfolgreich encodiert")
+                if journal:
+                    journal.mark(job.track_number, 'encoded', output_file=job.output_file)
+                # WAV-Datei löschen nach Encoding
+                Path(job.wav_file).unlink()
+                report_stage_done('encoding')
+                return True
+            
+            def tag_stage(job: TrackJob) -> bool:
+                if journal and journal.done(job.track_number, 'tagged'):
+                    report_stage_done('tagging')
+                    return True
+                
                 track_metadata = album_metadata.copy()
                 track_metadata.update({
-                    'title': track_info.title,
-                    'track_number': track_num
+                    'title': job.track_info.title,
+                    'track_number': job.track_number
                 })
                 
-                self.logger.info(f"Tagge Track {track_num}: {track_info.title}")
-                
-                # Progress Update: Start tagging
-                progress = int((track_num - 1) / len(encoded_files) * 100)
-                self.shared_status.update_progress('tagging', progress, track_num, len(encoded_files))
-                self.display.show_progress('tagging', progress, track_num, len(encoded_files), self.current_cover_path)
+                drive.logger.info(f"Tagge Track {job.track_number}: {job.track_info.title}")
                 
+                # Cover wurde bei der Identifikation bereits geladen - kein Download pro Track
                 success = self.tagger.tag_file(
-                    audio_file,
+                    job.output_file,
                     track_metadata,
-                    cover_url=cd_info.cover_url
+                    cover_url=cd_info.cover_url,
+                    cover_data=cd_info.cover_data
                 )
                 
                 if success:
-                    self.logger.info(f"✓ Track {track_num} erfolgreich getaggt")
-                    # Progress Update: Tagging completed
-                    progress = int(track_num / len(encoded_files) * 100)
-                    self.shared_status.update_progress('tagging', progress, track_num, len(encoded_files))
-                    self.display.show_progress('tagging', progress, track_num, len(encoded_files), self.current_cover_path)
+                    drive.logger.info(f"✓ Track {job.track_number} erfolgreich getaggt")
+                    if journal:
+                        # Prüfsumme nach dem Taggen neu aufzeichnen
+                        journal.mark(job.track_number, 'tagged', output_file=job.output_file)
                 else:
-                    self.logger.warning(f"⚠ Track {track_num} Tagging fehlgeschlagen")
+                    drive.logger.warning(f"⚠ Track {job.track_number} Tagging fehlgeschlagen")
+                
+                # Fehlendes Tagging verwirft den Track nicht
+                report_stage_done('tagging')
+                return True
+            
+            # Sync-Umfang: nur das Album (relativ zum Ausgabeverzeichnis) oder,
+            # wie früher, der komplette Artist-Ordner. sync_root entspricht
+            # dem Remote-Pfad, auch für den Streaming-Sync.
+            if self.syncer.scope == 'album':
+                sync_path, sync_root = album_dir, self.output_dir
+                sync_kwargs = {'local_root': str(sync_root)}
+            else:
+                sync_path, sync_root = album_dir.parent, album_dir.parent.parent
+                sync_kwargs = {}
+            uploaded_tracks = []
             
-            # 8. Sync zum Server
-            if self.config.get('sync', {}).get('enabled', True):
-                self.logger.info("Schritt 6/6: Server-Synchronisation")
+            def upload_stage(job: TrackJob) -> bool:
+                if journal and journal.done(job.track_number, 'uploaded'):
+                    uploaded_tracks.append(job.track_number)
+                    return True
+                if self.syncer.sync_file(job.output_file, str(sync_root), category_result.category):
+                    uploaded_tracks.append(job.track_number)
+                    if journal:
+                        journal.mark(job.track_number, 'uploaded')
+                else:
+                    drive.logger.warning(f"⚠ Track {job.track_number} Upload fehlgeschlagen, "
+                                         f"wird beim Abgleich übertragen")
                 
-                # Progress callback mit shared_status Update
-                def sync_progress_callback(progress):
-                    self.logger.info(f"Sync Progress: {progress}%")
-                    self.shared_status.update_progress('syncing', progress, 0, 0)
-                    self.display.show_progress('syncing', progress, None, None, self.current_cover_path)
+                # Fehlender Upload verwirft den Track nicht
+                return True
+            
+            pipeline_config = self.config.get('pipeline', {})
+            rip_mode = self.rip_mode
+            disc_layout = None
+            if rip_mode == 'disc' and resume:
+                drive.logger.info("Disc teilweise erledigt, rippe fehlende Tracks einzeln (Streaming)")
+                rip_mode = 'stream'
+            if rip_mode == 'disc':
+                disc_layout = self._disc_layout(cd_info, drive.ripper)
+                if not disc_layout:
+                    drive.logger.warning("Keine vollständige TOC, rippe Track für Track (Streaming)")
+                    rip_mode = 'stream'
+            
+            # Prüfsummen (CRC32, AccurateRip) werden während des Rippens berechnet
+            verifier = self._create_verifier(cd_info, drive)
+            checksum_sinks = {}
+            
+            # Im Streaming-/Disc-Modus encodiert der Ripper bereits direkt
+            direct_encode = rip_mode in ('stream', 'disc')
+            stages = [PipelineStage('tagging', tag_stage)]
+            if not direct_encode:
+                encode_workers = pipeline_config.get('encode_workers') or self.encoder.workers
+                # Längste wartende Tracks zuerst, damit am Ende kein einzelner
+                # langer Track allein auf einem Kern läuft
+                stages.insert(0, PipelineStage('encoding', encode_stage, workers=encode_workers,
+                                               priority=lambda job: -(job.track_info.duration or 0)))
+            if self.config.get('sync', {}).get('enabled', True) and self.syncer.streaming:
+                stages.append(PipelineStage('upload', upload_stage))
+            pipeline = TrackPipeline(
+                stages,
+                queue_size=pipeline_config.get('queue_size', 2),
+                should_continue=lambda: self.running
+            )
+            pipeline.start()
+            
+            ripped_count = 0
+            
+            # Adaptiv: Tracks mit unsicheren Bereichen oder AccurateRip-Abweichung
+            # werden nach dem schnellen Durchlauf komplett mit Paranoia neu gerippt
+            adaptive = drive.ripper.quality == 'adaptive'
+            retry_jobs = []
+            
+            def track_ripped(job: TrackJob, success: bool, retry_allowed: bool = True):
+                nonlocal ripped_count
+                if success:
+                    result = None
+                    if verifier:
+                        checksums = None
+                        if job.track_number in checksum_sinks:
+                            checksums = checksum_sinks.pop(job.track_number).result
+                        elif job.wav_file:
+                            checksums = checksum_file(job.wav_file, verifier.checksum(job.track_number))
+                        if checksums:
+                            result = verifier.verify(job.track_number, checksums)
+                    if adaptive and retry_allowed and result and result.status == 'mismatch':
+                        drive.logger.warning(f"⚠ Track {job.track_number}: AccurateRip-Abweichung, "
+                                             f"wird mit Paranoia neu gerippt")
+                        retry_jobs.append(job)
+                        return
+                    ripped_count += 1
+                    drive.logger.info(f"✓ Track {job.track_number} erfolgreich gerippt")
+                    if journal:
+                        steps = ['ripped'] + (['verified'] if result else []) + (['encoded'] if direct_encode else [])
+                        journal.mark(
+                            job.track_number, *steps,
+                            wav_file=None if direct_encode else job.wav_file,
+                            output_file=job.output_file if direct_encode else None,
+                            pcm_crc32=result.checksums.crc32 if result else None,
+                            accuraterip=result.status if result else None
+                        )
+                    # Blockiert, falls das Encoding nicht hinterherkommt
+                    pipeline.submit(job)
+                    report_stage_done('ripping')
+                    if direct_encode:
+                        report_stage_done('encoding')
+                elif adaptive and retry_allowed:
+                    drive.logger.warning(f"⚠ Track {job.track_number}: schneller Durchlauf unsicher, "
+                                         f"wird mit Paranoia neu gerippt")
+                    checksum_sinks.pop(job.track_number, None)
+                    retry_jobs.append(job)
+                else:
+                    checksum_sinks.pop(job.track_number, None)
+                    drive.logger.error(f"✗ Track {job.track_number} fehlgeschlagen")
+            
+            def resume_track(track_info, step: str):
+                nonlocal ripped_count
+                number = track_info.number
+                job = TrackJob(track_number=number, track_info=track_info)
+                if step in ('ripped', 'verified'):
+                    job.wav_file = journal.pending_wav(number)
+                else:
+                    job.output_file = journal.output_file(number)
+                drive.logger.info(f"✓ Track {number}: laut Journal bereits erledigt ({step}), "
+                                  f"überspringe Rippen")
+                ripped_count += 1
+                pipeline.submit(job)
+                report_stage_done('ripping')
+                if direct_encode:
+                    report_stage_done('encoding')
+            
+            try:
+                if rip_mode == 'disc':
+                    # Ganze Disc in einem cdparanoia-Lauf, Aufteilung anhand der TOC
+                    jobs = {
+                        t.number: TrackJob(track_number=t.number, track_info=t,
+                                           output_file=str(output_file_for(t)))
+                        for t in cd_info.tracks
+                    }
+                    
+                    def open_track(track_num: int):
+                        job = jobs[track_num]
+                        drive.logger.info(f"Rippe Track {track_num}/{total_tracks}: "
+                                          f"{sanitize_filename(job.track_info.title)}")
+                        progress = int((track_num - 1) / total_tracks * 100)
+                        self._update_progress('ripping', progress, track_num, total_tracks, drive)
+                        stream = self.encoder.open_stream(job.output_file, profile)
+                        if stream and verifier:
+                            stream = checksum_sinks[track_num] = ChecksumSink(stream, verifier.checksum(track_num))
+                        return stream
+                    
+                    drive.ripper.rip_disc_to_sinks(
+                        disc_layout,
+                        open_track,
+                        lambda track_num, success: track_ripped(jobs[track_num], success),
+                        progress_callback=lambda p: drive.logger.debug(f"Disc Progress: {p}%"),
+                        should_continue=lambda: self.running
+                    )
+                else:
+                    for track_info in cd_info.tracks:
+                        if not self.running:
+                            drive.logger.warning("Service wird beendet, breche Ripping ab")
+                            break
+                        
+                        track_num = track_info.number
+                        
+                        if track_num in resume:
+                            resume_track(track_info, resume[track_num])
+                            continue
+                        
+                        # Dateinamen erstellen
+                        track_name = sanitize_filename(track_info.title)
+                        wav_file = album_dir / f"track{track_num:02d}.wav"
+                        
+                        drive.logger.info(f"Rippe Track {track_num}/{total_tracks}: {track_name}")
+                        
+                        # Progress Update: Start Track
+                        progress = int((track_num - 1) / total_tracks * 100)
+                        self._update_progress('ripping', progress, track_num, total_tracks, drive)
+                        
+                        job = TrackJob(track_number=track_num, track_info=track_info)
+                        
+                        if rip_mode == 'stream':
+                            # cdparanoia → Encoder-stdin, ohne WAV-Zwischendatei
+                            job.output_file = str(output_file_for(track_info))
+                            success = self._rip_track_streaming(job, profile, verifier, checksum_sinks,
+                                                                       drive=drive)
+                        else:
+                            job.wav_file = str(wav_file)
+                            success = drive.ripper.rip_track(
+                                track_num,
+                                str(wav_file),
+                                progress_callback=lambda p, n=track_num: drive.logger.debug(f"Track {n} Progress: {p}%")
+                            )
+                        
+                        track_ripped(job, success)
                 
-                success = self.syncer.sync_directory(
-                    str(album_dir.parent),
+                # Zweite Stufe (adaptiv): betroffene Tracks komplett mit Paranoia
+                for job in retry_jobs:
+                    if not self.running:
+                        drive.logger.warning("Service wird beendet, breche Ripping ab")
+                        break
+                    
+                    drive.logger.info(f"Rippe Track {job.track_number}/{total_tracks} erneut (Paranoia)")
+                    if direct_encode:
+                        success = self._rip_track_streaming(job, profile, verifier, checksum_sinks,
+                                                            quality='paranoia', drive=drive)
+                    else:
+                        success = drive.ripper.rip_track(
+                            job.track_number,
+                            job.wav_file,
+                            progress_callback=lambda p, n=job.track_number: drive.logger.debug(f"Track {n} Progress: {p}%"),
+                            quality='paranoia'
+                        )
+                    track_ripped(job, success, retry_allowed=False)
+            finally:
+                ripping_done.set()
+                encoded_jobs, _ = pipeline.join()
+            
+            if not self.running:
+                drive.logger.warning("Service wird beendet, breche Verarbeitung ab")
+                return False
+            
+            if not ripped_count:
+                drive.logger.error("Keine Tracks erfolgreich gerippt")
+                return False
+            
+            counts = None
+            if verifier:
+                # Mit Journal auch die Ergebnisse früherer Durchläufe
+                counts = journal.verification_counts() if journal else verifier.summary()
+            if counts and sum(counts.values()):
+                drive.logger.info(f"AccurateRip: {counts['accurate']} bestätigt, "
+                                  f"{counts['mismatch']} abweichend, {counts['unknown']} unbekannt")
+            
+            if not encoded_jobs:
+                drive.logger.error("Keine Tracks erfolgreich encodiert")
+                return False
+            
+            # 8. Sync zum Server (bei Streaming-Sync nur noch Abgleich der fehlenden Dateien)
+            if uploaded_tracks:
+                drive.logger.info(f"{len(uploaded_tracks)}/{len(encoded_jobs)} Tracks bereits hochgeladen")
+            
+            # Nur vollständig verarbeitete CDs kommen in den Index
+            index_disc = bool(self.disc_index) and len(encoded_jobs) == len(cd_info.tracks)
+            if self.disc_index and not index_disc:
+                drive.logger.info("Nicht alle Tracks verarbeitet, CD wird nicht in den Index aufgenommen")
+            
+            sync_state = None
+            if self.config.get('sync', {}).get('enabled', True) and journal and journal.sync:
+                # Seit dem letzten Sync hat sich nichts geändert
+                drive.logger.info(f"Schritt 6/6: Server-Synchronisation laut Journal bereits erledigt ({journal.sync})")
+                sync_state = journal.sync
+            elif self.config.get('sync', {}).get('enabled', True) and self.config.get('sync', {}).get('background', True):
+                drive.logger.info("Schritt 6/6: Server-Synchronisation (Hintergrund)")
+                # Vor dem Einreihen, sonst könnte ein schneller Sync 'synced' überschreiben
+                sync_state = 'queued'
+                if journal:
+                    journal.set_sync(sync_state)
+                if index_disc:
+                    self._index_disc(cd_info, album_dir, profile, category_result.category,
+                                     verifier, journal, counts, sync_state)
+                    index_disc = False
+                self.sync_queue.enqueue(
+                    str(sync_path),
                     category_result.category,
-                    progress_callback=sync_progress_callback
+                    label=f"{album_metadata.get('artist', '')} - {album_metadata.get('album', '')}",
+                    disc_id=cd_info.disc_id,
+                    **sync_kwargs
                 )
+            elif self.config.get('sync', {}).get('enabled', True):
+                drive.logger.info("Schritt 6/6: Server-Synchronisation")
+                
+                # Progress callback mit shared_status Update (vom Syncer gedrosselt)
+                def sync_progress_callback(progress):
+                    self._update_progress('syncing', progress, 0, 0, drive)
+                
+                def sync_detail_callback(transfer):
+                    eta = f", noch {transfer.eta_seconds}s" if transfer.eta_seconds is not None else ""
+                    drive.logger.info(f"Sync Progress: {transfer.percent}% "
+                                      f"({transfer.bytes_transferred / (1024 * 1024):.1f} MB, "
+                                      f"{transfer.rate / (1024 * 1024):.2f} MB/s{eta})")
+                
+                with self._sync_lock:
+                    success = self.syncer.sync_directory(
+                        str(sync_path),
+                        category_result.category,
+                        progress_callback=sync_progress_callback,
+                        detail_callback=sync_detail_callback,
+                        **sync_kwargs
+                    )
                 
                 if success:
-                    self.logger.info("✓ Server-Sync erfolgreich")
+                    drive.logger.info("✓ Server-Sync erfolgreich")
+                    sync_state = 'synced'
+                    if journal:
+                        journal.set_sync(sync_state)
                 else:
-                    self.logger.error("✗ Server-Sync fehlgeschlagen")
+                    drive.logger.error("✗ Server-Sync fehlgeschlagen")
                     return False
             else:
-                self.logger.info("Server-Sync deaktiviert")
+                drive.logger.info("Server-Sync deaktiviert")
+            
+            if index_disc:
+                self._index_disc(cd_info, album_dir, profile, category_result.category,
+                                 verifier, journal, counts, sync_state)
+            
+            if journal:
+                journal.complete()
             
             # 9. CD auswerfen
             if self.config.get('sync', {}).get('auto_eject', True):
-                self.logger.info("Werfe CD aus...")
-                self.detector.eject_cd()
+                drive.logger.info("Werfe CD aus...")
+                drive.detector.eject_cd()
             
             # Shared Status aktualisieren
-            self.shared_status.set_processing(False)
-            self.shared_status.update_progress('complete', 100, 0, 0)
+            self.shared_status.set_processing(False, drive=drive.status_key)
+            self.shared_status.update_progress('complete', 100, 0, 0, drive=drive.status_key)
             
-            self.logger.info("=" * 60)
-            self.logger.info("✅ CD-Verarbeitung erfolgreich abgeschlossen!")
-            self.logger.info("=" * 60)
+            drive.logger.info("=" * 60)
+            drive.logger.info("✅ CD-Verarbeitung erfolgreich abgeschlossen!")
+            drive.logger.info("=" * 60)
             
             # Cover-Path zurücksetzen
-            self.current_cover_path = None
+            drive.cover_path = None
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Fehler bei CD-Verarbeitung: {e}", exc_info=True)
+            drive.logger.error(f"Fehler bei CD-Verarbeitung: {e}", exc_info=True)
             # Cover-Path zurücksetzen
-            self.current_cover_path = None
+            drive.cover_path = None
             return False
         finally:
-            self.processing = False
+            if journal:
+                self.journal.close(journal)
+            drive.processing = False
+    
+    def _handle_known_disc(self, drive: DriveWorker) -> Optional[bool]:
+        """
+        Behandelt eine bereits gerippte CD gemäß index.duplicate_action
+        
+        Die Erkennung braucht nur die TOC (Disc-ID) und eine Index-Abfrage.
+        
+        Args:
+            drive: Laufwerks-Worker
+            
+        Returns:
+            None wenn die CD normal verarbeitet werden soll, sonst das
+            Ergebnis (True bei Erfolg)
+        """
+        start = time.monotonic()
+        disc = drive.identifier.get_disc_info()
+        if not disc:
+            return None
+        entry = self.disc_index.lookup(disc.id)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        
+        if not entry:
+            drive.logger.debug(f"Disc {disc.id} nicht im Index ({elapsed_ms:.0f} ms)")
+            return None
+        
+        ripped_at = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.ripped_at))
+        destination = f" nach {entry.sync_destination}" if entry.sync_destination else ""
+        drive.logger.info(f"CD bereits gerippt am {ripped_at}: {entry.artist} - {entry.album} "
+                          f"(AccurateRip {entry.accurate}/{entry.track_count} bestätigt, "
+                          f"Sync: {entry.sync_state or '-'}{destination}, erkannt in {elapsed_ms:.0f} ms)")
+        
+        if self.duplicate_action == 'rerip':
+            drive.logger.info("index.duplicate_action 'rerip': CD wird erneut gerippt")
+            if self.journal:
+                self.journal.discard(disc.id)
+            return None
+        
+        # Status und Display wie bei einer neuen CD, Cover nur aus dem lokalen Cache
+        cover_path = None
+        cover_data = self.cover_cache.get(entry.musicbrainz_id) if entry.musicbrainz_id else None
+        if cover_data:
+            cover_path = self.shared_status.save_cover(cover_data, "/tmp", drive=drive.status_key)
+        drive.cover_path = cover_path
+        self.shared_status.update_cd(name=entry.album, artist=entry.artist,
+                                     cover_path=cover_path, drive=drive.status_key)
+        self.shared_status.set_processing(True, drive=drive.status_key)
+        if self._owns_display(drive):
+            self.display.show_cd_info({'name': entry.album, 'artist': entry.artist}, cover_path)
+        
+        success = True
+        if self.duplicate_action == 'verify':
+            success = self._reverify_disc(drive, disc, entry)
+        else:
+            drive.logger.info("index.duplicate_action 'skip': CD wird übersprungen")
+        
+        if self.config.get('sync', {}).get('auto_eject', True):
+            drive.logger.info("Werfe CD aus...")
+            drive.detector.eject_cd()
+        
+        self.shared_status.set_processing(False, drive=drive.status_key)
+        self.shared_status.update_progress('complete', 100, 0, 0, drive=drive.status_key)
+        drive.cover_path = None
+        return success
+    
+    def _reverify_disc(self, drive: DriveWorker, disc, entry: DiscRecord) -> bool:
+        """
+        Liest eine bereits gerippte CD erneut (ohne Encoding) und vergleicht
+        die Prüfsummen mit AccurateRip und dem ursprünglichen Rip
+        
+        Args:
+            drive: Laufwerks-Worker
+            disc: Disc-Objekt mit TOC-Daten
+            entry: Index-Eintrag der CD
+            
+        Returns:
+            True wenn alle Tracks lesbar sind und nichts abweicht
+        """
+        drive.logger.info("index.duplicate_action 'verify': lese CD erneut und prüfe die Prüfsummen")
+        cd_info = drive.identifier.toc_album_info(disc, entry.artist, entry.album)
+        total_tracks = len(cd_info.tracks)
+        verifier = self._create_verifier(cd_info, drive) or DiscVerifier(self.accuraterip, None, total_tracks)
+        
+        sinks = {}
+        results = {}
+        failed = []
+        changed = []
+        
+        def open_sink(track_num: int):
+            progress = int((track_num - 1) / total_tracks * 100)
+            self._update_progress('verifying', progress, track_num, total_tracks, drive)
+            sinks[track_num] = ChecksumSink(DiscardSink(), verifier.checksum(track_num))
+            return sinks[track_num]
+        
+        def track_done(track_num: int, success: bool):
+            sink = sinks.pop(track_num, None)
+            if not success or not sink or not sink.result:
+                failed.append(track_num)
+                drive.logger.error(f"✗ Track {track_num} nicht fehlerfrei lesbar")
+                return
+            crc = sink.result.crc32
+            results[track_num] = (crc, verifier.verify(track_num, sink.result).status)
+            expected = entry.track_crcs.get(track_num)
+            if expected is not None and expected != crc:
+                changed.append(track_num)
+                drive.logger.warning(f"✗ Track {track_num}: CRC32 {crc:08X} weicht vom "
+                                     f"ursprünglichen Rip ab ({expected:08X})")
+        
+        disc_layout = self._disc_layout(cd_info, drive.ripper)
+        if disc_layout:
+            drive.ripper.rip_disc_to_sinks(disc_layout, open_sink, track_done,
+                                           should_continue=lambda: self.running)
+        else:
+            for track in cd_info.tracks:
+                if not self.running:
+                    break
+                sink = open_sink(track.number)
+                success = drive.ripper.rip_track_to_sink(
+                    track.number, sink,
+                    expected_bytes=track.sectors * CD_SECTOR_BYTES if track.sectors else None
+                )
+                track_done(track.number, success)
+        
+        if not self.running:
+            drive.logger.warning("Service wird beendet, breche Verifikation ab")
+            return False
+        
+        counts = verifier.summary()
+        self.disc_index.record_verification(disc.id, counts, results)
+        drive.logger.info(f"Verifikation: AccurateRip {counts['accurate']} bestätigt, "
+                          f"{counts['mismatch']} abweichend, {counts['unknown']} unbekannt; "
+                          f"{len(changed)} Track(s) mit geänderter CRC32, {len(failed)} nicht lesbar")
+        return not failed and not changed and not counts['mismatch']
+    
+    def _index_disc(self, cd_info, album_dir: Path, profile: dict, category: int,
+                    verifier: Optional[DiscVerifier], journal, counts: Optional[dict],
+                    sync_state: Optional[str]):
+        """
+        Nimmt eine vollständig verarbeitete CD in den Index auf
+        
+        Args:
+            cd_info: AlbumInfo der CD
+            album_dir: Album-Verzeichnis
+            profile: Encoding-Profil
+            category: Kategorie (für das Sync-Ziel)
+            verifier: DiscVerifier des Rips (oder None)
+            journal: DiscJournal der CD (oder None)
+            counts: Anzahl Tracks pro AccurateRip-Status (oder None)
+            sync_state: queued, synced oder None
+        """
+        # Prüfsummen pro Track: aus dem Journal (inkl. früherer Durchläufe) oder vom Verifier
+        tracks = {}
+        if journal:
+            tracks = {number: (record.pcm_crc32, record.accuraterip)
+                      for number, record in journal.tracks.items()}
+        elif verifier:
+            tracks = {number: (result.checksums.crc32, result.status)
+                      for number, result in verifier.results.items()}
+        
+        counts = counts or {}
+        sync_destination = None
+        if sync_state:
+            sync_destination = f"{self.syncer.remote_host}:{self.syncer.get_remote_path(category)}"
+        
+        self.disc_index.record_rip(DiscRecord(
+            disc_id=cd_info.disc_id,
+            artist=cd_info.artist,
+            album=cd_info.album,
+            musicbrainz_id=cd_info.musicbrainz_id,
+            album_dir=str(album_dir),
+            output_format=profile['format'],
+            track_count=len(cd_info.tracks),
+            ripped_at=time.time(),
+            verified_at=time.time() if verifier else None,
+            accurate=counts.get('accurate', 0),
+            mismatch=counts.get('mismatch', 0),
+            unknown=counts.get('unknown', 0),
+            sync_destination=sync_destination,
+            sync_state=sync_state
+        ), tracks)
+    
+    def _sync_done(self, task, success: bool):
+        """
+        Hält einen abgeschlossenen Hintergrund-Sync im Journal und im
+        Disc-Index fest (Callback der Sync-Warteschlange)
+        
+        Args:
+            task: SyncTask des Auftrags
+            success: True wenn der Sync erfolgreich war
+        """
+        if not success or not task.disc_id:
+            return
+        if self.journal and self.journal.mark_synced(task.disc_id):
+            self.logger.debug(f"Journal: Disc {task.disc_id} synchronisiert")
+        if self.disc_index:
+            self.disc_index.update_sync(task.disc_id, 'synced')
+    
+    def _remove_leftover_wavs(self, album_dir: Path, journal, resume: dict, drive: DriveWorker):
+        """
+        Löscht WAV-Zwischendateien, die laut Journal nicht mehr gebraucht werden
+        (abgebrochene Rips oder bereits encodierte Tracks)
+        
+        Args:
+            album_dir: Album-Verzeichnis
+            journal: DiscJournal der CD
+            resume: Track-Nummer → letzter gültiger Schritt
+            drive: Laufwerks-Worker (für das Logging)
+        """
+        keep = {
+            journal.pending_wav(number)
+            for number, step in resume.items()
+            if step in ('ripped', 'verified')
+        }
+        for wav_file in album_dir.glob('track*.wav'):
+            if str(wav_file) in keep:
+                continue
+            try:
+                wav_file.unlink()
+                drive.logger.info(f"Verwaiste Zwischendatei gelöscht: {wav_file.name}")
+            except OSError as e:
+                drive.logger.warning(f"Zwischendatei {wav_file.name} konnte nicht gelöscht werden: {e}")
+    
+    def _rip_track_streaming(self, job: TrackJob, profile: dict,
+                             verifier: Optional[DiscVerifier] = None,
+                             checksum_sinks: Optional[dict] = None,
+                             quality: Optional[str] = None,
+                             drive: Optional[DriveWorker] = None) -> bool:
+        """
+        Rippt einen Track direkt in den Encoder (ohne WAV-Zwischendatei)
+        
+        Args:
+            job: Pipeline-Job mit gesetztem output_file
+            profile: Encoding-Profil
+            verifier: Optional DiscVerifier - Prüfsummen werden im Stream berechnet
+            checksum_sinks: Ablage der ChecksumSink pro Track (bei gesetztem verifier)
+            quality: Optional abweichende Qualitätsstufe (z.B. paranoia für einen Re-Rip)
+            drive: Laufwerks-Worker (Default: erstes Laufwerk)
+            
+        Returns:
+            True wenn Rippen und Encoding erfolgreich waren
+        """
+        drive = drive or self.drives[0]
+        stream = self.encoder.open_stream(job.output_file, profile)
+        if not stream:
+            return False
+        
+        if verifier is not None and checksum_sinks is not None:
+            stream = checksum_sinks[job.track_number] = ChecksumSink(
+                stream, verifier.checksum(job.track_number)
+            )
+        
+        expected_bytes = job.track_info.sectors * CD_SECTOR_BYTES if job.track_info.sectors else None
+        
+        return drive.ripper.rip_track_to_sink(
+            job.track_number,
+            stream,
+            expected_bytes=expected_bytes,
+            progress_callback=lambda p, n=job.track_number: drive.logger.debug(f"Track {n} Progress: {p}%"),
+            quality=quality,
+            first_sector=job.track_info.offset - 150 if job.track_info.offset else None
+        )
+    
+    def _create_verifier(self, cd_info, drive: Optional[DriveWorker] = None) -> Optional[DiscVerifier]:
+        """
+        Bereitet die Verifikation einer Disc vor (AccurateRip-Abfrage)
+        
+        Ohne vollständige TOC-Positionen werden nur CRC32-Prüfsummen berechnet.
+        
+        Args:
+            cd_info: AlbumInfo mit Tracks
+            drive: Laufwerks-Worker (Default: erstes Laufwerk)
+            
+        Returns:
+            DiscVerifier oder None, wenn die Verifikation deaktiviert ist
+        """
+        drive = drive or self.drives[0]
+        verify_config = self.config.get('verify', {})
+        if not verify_config.get('enabled', True):
+            return None
+        
+        tracks = sorted(cd_info.tracks, key=lambda t: t.number)
+        ids = None
+        if (verify_config.get('accuraterip', True) and cd_info.leadout
+                and [t.number for t in tracks] == list(range(1, len(tracks) + 1))
+                and all(t.offset for t in tracks)):
+            ids = accuraterip_ids([t.offset for t in tracks], cd_info.leadout, cd_info.freedb_id)
+            drive.logger.debug(f"AccurateRip-ID: {ids.filename}")
+        
+        return DiscVerifier(self.accuraterip, ids, len(tracks))
+    
+    def _disc_layout(self, cd_info, ripper: Optional[CDRipper] = None) -> Optional[List[Tuple[int, int]]]:
+        """
+        Ermittelt Track-Längen für das Single-Pass-Ripping
+        
+        Nutzt die TOC-Daten aus discid (TrackInfo.sectors) und fällt auf
+        cdparanoia -Q zurück, falls diese unvollständig sind.
+        
+        Args:
+            cd_info: AlbumInfo mit Tracks
+            ripper: Ripper des Laufwerks (Default: erstes Laufwerk)
+            
+        Returns:
+            Liste (Track-Nummer, Länge in Sektoren) oder None
+        """
+        numbers = [track.number for track in cd_info.tracks]
+        if numbers != list(range(1, len(numbers) + 1)):
+            # Lücken in der Track-Liste lassen sich nicht aus einem Stream schneiden
+            return None
+        
+        if all(track.sectors for track in cd_info.tracks):
+            return [(track.number, track.sectors) for track in cd_info.tracks]
+        
+        toc = (ripper or self.ripper).get_toc()
+        if not toc:
+            return None
+        
+        lengths = {number: sectors for number, _, sectors in toc}
+        if not all(number in lengths for number in numbers):
+            return None
+        
+        return [(number, lengths[number]) for number in numbers]
+    
+    def _update_progress(self, step: str, progress: int, current_track: int, total_tracks: int,
+                         drive: Optional[DriveWorker] = None):
+        """
+        Aktualisiert Fortschritt in Web-Interface und Display
+        
+        Args:
+            step: Phase (ripping, encoding, tagging, syncing)
+            progress: Fortschritt in Prozent (0-100)
+            current_track: Aktueller Track
+            total_tracks: Gesamt-Tracks
+            drive: Laufwerks-Worker (Default: erstes Laufwerk)
+        """
+        drive = drive or self.drives[0]
+        self.shared_status.update_progress(step, progress, current_track, total_tracks,
+                                           drive=drive.status_key)
+        if self._owns_display(drive):
+            self.display.show_progress(step, progress, current_track or None, total_tracks or None,
+                                       drive.cover_path)
     
     def _create_album_directory(self, cd_info) -> Path:
         """
@@ -374,52 +1143,91 @@ class CDRipperService:
     def run(self):
         """
         Hauptschleife des Services
+        
+        Mit mehreren Laufwerken läuft pro Laufwerk ein eigener Worker-Thread,
+        der Haupt-Thread wartet dann nur noch auf das Service-Ende.
         """
         self.logger.info("Service-Loop gestartet")
+        
+        if self.config.get('sync', {}).get('enabled', True):
+            self.sync_queue.start()
+        if self.journal:
+            self.journal.prune()
+        
+        if len(self.drives) == 1:
+            self._drive_loop(self.drives[0])
+        else:
+            for drive in self.drives:
+                drive.thread = threading.Thread(target=self._drive_loop, args=(drive,),
+                                                name=f"Drive-{drive.drive_id}", daemon=True)
+                drive.thread.start()
+            
+            try:
+                while self.running and any(drive.thread.is_alive() for drive in self.drives):
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                self.logger.info("Keyboard Interrupt empfangen")
+                self.running = False
+            
+            for drive in self.drives:
+                drive.thread.join()
+        
+        self.logger.info("Service-Loop beendet")
+    
+    def _drive_loop(self, drive: DriveWorker):
+        """
+        Erkennungs- und Verarbeitungsschleife eines Laufwerks
+        
+        Args:
+            drive: Laufwerks-Worker
+        """
         last_cd_present = False
         
         while self.running:
             try:
                 # CD erkennen
-                cd_info = self.detector.get_cd_info()
+                cd_info = drive.detector.get_cd_info()
                 
                 if cd_info.present and cd_info.is_audio and not last_cd_present:
                     # Neue Audio-CD erkannt
-                    self.logger.info("Neue Audio-CD erkannt")
+                    drive.logger.info(f"Neue Audio-CD erkannt ({drive.device})")
                     last_cd_present = True
                     
                     # CD verarbeiten
-                    success = self.process_cd()
+                    success = self.process_cd(drive)
                     
                     if success:
-                        self.display.show_done()
+                        if self._owns_display(drive):
+                            self.display.show_done()
                         time.sleep(3)  # "Fertig" kurz anzeigen
                     else:
-                        self.logger.error("CD-Verarbeitung fehlgeschlagen")
-                        self.display.show_error("CD-Verarbeitung fehlgeschlagen")
+                        drive.logger.error("CD-Verarbeitung fehlgeschlagen")
+                        if self._owns_display(drive):
+                            self.display.show_error("CD-Verarbeitung fehlgeschlagen")
                         # Warte vor erneutem Versuch
                         time.sleep(30)
+                    self._release_display(drive)
                 elif not cd_info.present and last_cd_present:
                     # CD wurde entfernt - Status zurücksetzen
-                    self.logger.info("CD wurde entfernt - Status wird zurückgesetzt")
+                    drive.logger.info("CD wurde entfernt - Status wird zurückgesetzt")
                     last_cd_present = False
                     
                     # Status für Web-Interface löschen
-                    self.shared_status.clear()
-                    self.display.show_idle()
-                    self.logger.info("Status erfolgreich zurückgesetzt")
+                    self.shared_status.clear(drive=drive.status_key)
+                    if self._owns_display(drive):
+                        self.display.show_idle()
+                        self._release_display(drive)
+                    drive.logger.info("Status erfolgreich zurückgesetzt")
                 
-                # Polling-Intervall
-                time.sleep(2)
+                # Auf Medienwechsel warten (kehrt bei Änderung sofort zurück)
+                drive.detector.wait_for_change(drive.detector.poll_interval)
                 
             except KeyboardInterrupt:
-                self.logger.info("Keyboard Interrupt empfangen")
+                drive.logger.info("Keyboard Interrupt empfangen")
                 break
             except Exception as e:
-                self.logger.error(f"Fehler in Service-Loop: {e}", exc_info=True)
+                drive.logger.error(f"Fehler in Service-Loop: {e}", exc_info=True)
                 time.sleep(10)
-        
-        self.logger.info("Service-Loop beendet")
     
     def shutdown(self):
         """
@@ -427,6 +1235,9 @@ class CDRipperService:
         """
         self.logger.info("Service wird heruntergefahren...")
         self.running = False
+        self.encoder.stop()
+        self.sync_queue.stop()
+        self.syncer.close()
         self.display.cleanup()
 
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+MusicBrainz Cache Module
+Persistenter SQLite-Cache für MusicBrainz-Releases, Schlüssel ist die Disc-ID
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+class MusicBrainzCache:
+    """
+    Speichert MusicBrainz-Antworten lokal, damit Re-Rips, Wiederholungen
+    nach Fehlern und Mehrfach-Kopien ohne Web-Service-Abfrage auskommen
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: int = 30 * 24 * 3600, max_entries: int = 2000):
+        """
+        Initialisiert den Cache
+
+        Args:
+            db_path: Pfad zur SQLite-Datenbank
+            ttl_seconds: Gültigkeitsdauer eines Eintrags
+            max_entries: Maximale Anzahl Einträge (älteste Zugriffe werden entfernt)
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logging.getLogger('cd_ripper.mb_cache')
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS releases ("
+                    " disc_id TEXT PRIMARY KEY,"
+                    " release_json TEXT NOT NULL,"
+                    " fetched_at REAL NOT NULL,"
+                    " accessed_at REAL NOT NULL)"
+                )
+        except Exception as e:
+            self.logger.warning(f"MusicBrainz-Cache nicht verfügbar: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Öffnet eine Verbindung (eine pro Aufruf, damit thread-sicher)"""
+        return sqlite3.connect(str(self.db_path), timeout=5)
+
+    def get(self, disc_id: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Liest ein Release aus dem Cache
+
+        Args:
+            disc_id: Disc-ID der CD
+            allow_stale: Auch abgelaufene Einträge liefern (Offline-Fallback)
+
+        Returns:
+            Release-Dictionary oder None
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT release_json, fetched_at FROM releases WHERE disc_id = ?",
+                    (disc_id,)
+                ).fetchone()
+
+                if not row:
+                    return None
+
+                release_json, fetched_at = row
+                if not allow_stale and time.time() - fetched_at > self.ttl_seconds:
+                    self.logger.debug(f"Cache-Eintrag abgelaufen: {disc_id}")
+                    return None
+
+                conn.execute(
+                    "UPDATE releases SET accessed_at = ? WHERE disc_id = ?",
+                    (time.time(), disc_id)
+                )
+                return json.loads(release_json)
+
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Lesen des MusicBrainz-Caches: {e}")
+            return None
+
+    def put(self, disc_id: str, release: Dict[str, Any]):
+        """
+        Speichert ein Release im Cache
+
+        Args:
+            disc_id: Disc-ID der CD
+            release: Release-Dictionary von MusicBrainz
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO releases (disc_id, release_json, fetched_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (disc_id, json.dumps(release), now, now)
+                )
+                # Größe begrenzen: am längsten nicht genutzte Einträge löschen
+                conn.execute(
+                    "DELETE FROM releases WHERE disc_id NOT IN ("
+                    " SELECT disc_id FROM releases ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+        except Exception as e:
+            self.logger.warning(f"Fehler beim Schreiben des MusicBrainz-Caches: {e}")
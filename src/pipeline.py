@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Track Pipeline Module
+Überlappende Verarbeitung von Tracks (Rippen → Encodieren → Taggen)
+über Worker-Threads mit begrenzten Queues zwischen den Stufen
+"""
+
+import itertools
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Optional, Callable, List, Any, Tuple
+
+
+# Markiert das Ende des Job-Stroms für eine Stufe
+_STOP = object()
+
+
+@dataclass
+class TrackJob:
+    """Ein Track auf dem Weg durch die Pipeline"""
+    track_number: int
+    track_info: Any
+    wav_file: Optional[str] = None
+    output_file: Optional[str] = None
+    failed_stage: Optional[str] = None
+
+
+@dataclass
+class PipelineStage:
+    """Eine Verarbeitungsstufe der Pipeline"""
+    name: str
+    handler: Callable[[TrackJob], bool]
+    workers: int = 1
+    priority: Optional[Callable[[TrackJob], Any]] = None   # Sortierschlüssel der Eingangs-Queue (kleinster zuerst)
+
+
+class TrackPipeline:
+    """
+    Verarbeitet Tracks stufenweise in Worker-Threads
+
+    Jede Stufe hat eine begrenzte Eingangs-Queue. Ist die Queue voll,
+    blockiert submit() bzw. die vorherige Stufe, bis wieder Platz ist.
+    Damit läuft z.B. das Encoding von Track N, während cdparanoia
+    bereits Track N+1 liest, ohne dass sich beliebig viele WAV-Dateien
+    ansammeln.
+    """
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 2,
+                 should_continue: Optional[Callable[[], bool]] = None):
+        """
+        Initialisiert die Pipeline
+
+        Args:
+            stages: Verarbeitungsstufen in Reihenfolge
+            queue_size: Maximale Anzahl wartender Jobs pro Stufe
+            should_continue: Optional Callback, False bricht die Verarbeitung ab
+        """
+        self.logger = logging.getLogger('cd_ripper.pipeline')
+        self.stages = stages
+        self.should_continue = should_continue or (lambda: True)
+
+        # Stufen mit Sortierschlüssel bekommen eine PriorityQueue
+        self._queues = [queue.PriorityQueue(maxsize=max(1, queue_size)) if stage.priority
+                        else queue.Queue(maxsize=max(1, queue_size)) for stage in stages]
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._remaining = [max(1, stage.workers) for stage in stages]
+        self._lock = threading.Lock()
+
+        self.completed: List[TrackJob] = []
+        self.failed: List[TrackJob] = []
+
+    def start(self):
+        """Startet die Worker-Threads aller Stufen"""
+        for index, stage in enumerate(self.stages):
+            for worker in range(max(1, stage.workers)):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(index,),
+                    daemon=True,
+                    name=f"Pipeline-{stage.name}-{worker + 1}"
+                )
+                thread.start()
+                self._threads.append(thread)
+
+        self.logger.debug(f"Pipeline gestartet: {[s.name for s in self.stages]}")
+
+    def submit(self, job: TrackJob):
+        """
+        Übergibt einen Job an die erste Stufe (blockiert bei voller Queue)
+
+        Args:
+            job: Zu verarbeitender Track
+        """
+        self._put(0, job)
+
+    def join(self) -> Tuple[List[TrackJob], List[TrackJob]]:
+        """
+        Signalisiert das Ende der Eingabe und wartet auf alle Stufen
+
+        Returns:
+            Tuple (erfolgreiche Jobs, fehlgeschlagene Jobs), nach Track-Nummer sortiert
+        """
+        for _ in range(max(1, self.stages[0].workers)):
+            self._put(0, _STOP)
+
+        for thread in self._threads:
+            thread.join()
+
+        self.completed.sort(key=lambda j: j.track_number)
+        self.failed.sort(key=lambda j: j.track_number)
+        return self.completed, self.failed
+
+    def _put(self, index: int, job: Any):
+        """Stellt einen Job (oder das Ende-Signal) in die Queue einer Stufe"""
+        priority = self.stages[index].priority
+        if not priority:
+            self._queues[index].put(job)
+        elif job is _STOP:
+            # Ende-Signal hinter allen wartenden Jobs einsortieren
+            self._queues[index].put((1, 0, next(self._sequence), job))
+        else:
+            self._queues[index].put((0, priority(job), next(self._sequence), job))
+
+    def _get(self, index: int) -> Any:
+        """Nimmt den nächsten Job aus der Queue einer Stufe (blockiert)"""
+        item = self._queues[index].get()
+        return item[-1] if self.stages[index].priority else item
+
+    def _worker(self, index: int):
+        """Worker-Schleife einer Stufe"""
+        stage = self.stages[index]
+
+        while True:
+            job = self._get(index)
+
+            if job is _STOP:
+                self._worker_finished(index)
+                return
+
+            if not self.should_continue():
+                # Abbruch: restliche Jobs nur noch durchreichen
+                job.failed_stage = job.failed_stage or stage.name
+                with self._lock:
+                    self.failed.append(job)
+                continue
+
+            try:
+                success = stage.handler(job)
+            except Exception as e:
+                self.logger.error(f"Fehler in Stufe '{stage.name}' bei Track {job.track_number}: {e}",
+                                  exc_info=True)
+                success = False
+
+            if not success:
+                job.failed_stage = stage.name
+                with self._lock:
+                    self.failed.append(job)
+            elif index + 1 < len(self.stages):
+                self._put(index + 1, job)
+            else:
+                with self._lock:
+                    self.completed.append(job)
+
+    def _worker_finished(self, index: int):
+        """Leitet das Ende-Signal weiter, sobald alle Worker einer Stufe fertig sind"""
+        with self._lock:
+            self._remaining[index] -= 1
+            last_worker = self._remaining[index] == 0
+
+        if last_worker and index + 1 < len(self.stages):
+            for _ in range(max(1, self.stages[index + 1].workers)):
+                self._put(index + 1, _STOP)
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Rip Journal Module
+Crash-sicheres Journal pro Disc (Schlüssel: Disc-ID). Hält fest, welche
+Tracks gerippt, verifiziert, encodiert, getaggt und hochgeladen sind,
+damit nach einem Neustart oder erneutem Einlegen nur die fehlenden
+Schritte nachgeholt werden.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+
+# Schritte eines Tracks in Pipeline-Reihenfolge
+TRACK_STEPS = ('ripped', 'verified', 'encoded', 'tagged', 'uploaded')
+
+
+def file_crc32(path: str, chunk_size: int = 1024 * 1024) -> Optional[int]:
+    """
+    CRC32 einer Datei
+
+    Args:
+        path: Dateipfad
+        chunk_size: Lesegröße
+
+    Returns:
+        CRC32 oder None, wenn die Datei nicht lesbar ist
+    """
+    crc = 0
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return crc
+                crc = zlib.crc32(chunk, crc)
+    except OSError:
+        return None
+
+
+@dataclass
+class TrackRecord:
+    """Stand eines Tracks im Journal"""
+    steps: Dict[str, float] = field(default_factory=dict)   # Schritt -> Zeitpunkt
+    wav_file: Optional[str] = None
+    wav_size: int = 0
+    wav_crc32: Optional[int] = None
+    output_file: Optional[str] = None
+    output_size: int = 0
+    output_crc32: Optional[int] = None
+    pcm_crc32: Optional[int] = None
+    accuraterip: Optional[str] = None                         # accurate, mismatch, unknown
+
+
+def _file_matches(path: Optional[str], size: int, crc: Optional[int]) -> bool:
+    """Prüft, ob eine Datei noch dem aufgezeichneten Stand entspricht"""
+    if not path or crc is None:
+        return False
+    try:
+        if os.path.getsize(path) != size:
+            return False
+    except OSError:
+        return False
+    return file_crc32(path) == crc
+
+
+class DiscJournal:
+    """
+    Journal einer Disc
+
+    Jede Änderung wird sofort atomar geschrieben (temporäre Datei, fsync,
+    os.replace), ein Stromausfall hinterlässt also immer einen gültigen Stand.
+    """
+
+    def __init__(self, path: Path, disc_id: str, album_dir: str, output_format: str,
+                 data: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            path: JSON-Datei des Journals
+            disc_id: Disc-ID
+            album_dir: Album-Verzeichnis
+            output_format: Ausgabeformat (flac, mp3)
+            data: Gelesener Stand (None für ein neues Journal)
+        """
+        self.path = path
+        self.disc_id = disc_id
+        self.album_dir = album_dir
+        self.output_format = output_format
+        self.logger = logging.getLogger('cd_ripper.journal')
+        self._lock = threading.Lock()
+
+        data = data or {}
+        self.created_at = data.get('created_at') or time.time()
+        self.completed_at: Optional[float] = data.get('completed_at')
+        self.sync: Optional[str] = data.get('sync')             # queued, synced
+        self.tracks: Dict[int, TrackRecord] = {}
+        for number, record in (data.get('tracks') or {}).items():
+            try:
+                self.tracks[int(number)] = TrackRecord(**record)
+            except TypeError:
+                continue
+
+    def _save(self):
+        """Schreibt das Journal atomar (Aufrufer hält den Lock)"""
+        data = {
+            'disc_id': self.disc_id,
+            'album_dir': self.album_dir,
+            'format': self.output_format,
+            'created_at': self.created_at,
+            'updated_at': time.time(),
+            'completed_at': self.completed_at,
+            'sync': self.sync,
+            'tracks': {str(number): asdict(record) for number, record in sorted(self.tracks.items())}
+        }
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Journal konnte nicht geschrieben werden: {e}")
+
+    def done(self, track_number: int, step: str) -> bool:
+        """Prüft, ob ein Schritt für einen Track erledigt ist"""
+        with self._lock:
+            record = self.tracks.get(track_number)
+            return bool(record and step in record.steps)
+
+    def mark(self, track_number: int, *steps: str, wav_file: Optional[str] = None,
+             output_file: Optional[str] = None, **fields):
+        """
+        Markiert einen oder mehrere Schritte als erledigt
+
+        Für übergebene Dateien werden Größe und CRC32 aufgezeichnet, damit
+        beim Fortsetzen erkannt wird, ob sie noch unverändert vorhanden sind.
+        Neue Ergebnisse (außer Uploads) machen einen früheren Album-Sync ungültig.
+
+        Args:
+            track_number: Track-Nummer
+            *steps: Schritte (siehe TRACK_STEPS)
+            wav_file: WAV-Zwischendatei des Tracks
+            output_file: Encodierte Datei des Tracks
+            **fields: Weitere Felder des TrackRecord (z.B. pcm_crc32, accuraterip)
+        """
+        # Prüfsummen außerhalb des Locks berechnen
+        wav_info = (os.path.getsize(wav_file), file_crc32(wav_file)) if wav_file else None
+        output_info = (os.path.getsize(output_file), file_crc32(output_file)) if output_file else None
+
+        with self._lock:
+            record = self.tracks.setdefault(track_number, TrackRecord())
+            now = time.time()
+            for step in steps:
+                record.steps[step] = now
+            if any(step != 'uploaded' for step in steps):
+                self.sync = None
+            if wav_info:
+                record.wav_file = wav_file
+                record.wav_size, record.wav_crc32 = wav_info
+            if output_info:
+                record.output_file = output_file
+                record.output_size, record.output_crc32 = output_info
+            for key, value in fields.items():
+                setattr(record, key, value)
+            self._save()
+
+    def resume_step(self, track_number: int) -> Optional[str]:
+        """
+        Ermittelt, ab wo ein Track fortgesetzt werden kann
+
+        Prüft die aufgezeichneten Dateien gegen Größe und CRC32 und verwirft
+        Schritte, deren Ergebnis fehlt oder verändert wurde.
+
+        Args:
+            track_number: Track-Nummer
+
+        Returns:
+            Letzter gültiger Schritt (ripped, encoded, tagged, uploaded) oder None
+        """
+        with self._lock:
+            record = self.tracks.get(track_number)
+        if not record or 'ripped' not in record.steps:
+            return None
+
+        output_ok = 'encoded' in record.steps and _file_matches(
+            record.output_file, record.output_size, record.output_crc32)
+        wav_ok = not output_ok and _file_matches(record.wav_file, record.wav_size, record.wav_crc32)
+
+        with self._lock:
+            if output_ok:
+                valid = [step for step in TRACK_STEPS if step in record.steps]
+            elif wav_ok:
+                valid = [step for step in ('ripped', 'verified') if step in record.steps]
+            else:
+                valid = []
+            if len(valid) != len(record.steps):
+                record.steps = {step: record.steps[step] for step in valid}
+                self._save()
+
+        return valid[-1] if valid else None
+
+    def pending_wav(self, track_number: int) -> Optional[str]:
+        """WAV-Datei eines gerippten, noch nicht encodierten Tracks"""
+        with self._lock:
+            record = self.tracks.get(track_number)
+            if record and 'ripped' in record.steps and 'encoded' not in record.steps:
+                return record.wav_file
+            return None
+
+    def output_file(self, track_number: int) -> Optional[str]:
+        """Encodierte Datei eines Tracks (falls aufgezeichnet)"""
+        with self._lock:
+            record = self.tracks.get(track_number)
+            return record.output_file if record else None
+
+    def reset_track(self, track_number: int):
+        """Verwirft den Stand eines Tracks (z.B. vor einem Re-Rip)"""
+        with self._lock:
+            if self.tracks.pop(track_number, None) is not None:
+                self._save()
+
+    def set_sync(self, state: Optional[str]):
+        """
+        Hält den Sync-Stand des Albums fest
+
+        Args:
+            state: queued (an die Sync-Warteschlange übergeben), synced oder None
+        """
+        with self._lock:
+            self.sync = state
+            self._save()
+
+    def set_synced(self):
+        """Hält einen abgeschlossenen Album-Sync fest: alle encodierten Tracks sind hochgeladen"""
+        with self._lock:
+            now = time.time()
+            for record in self.tracks.values():
+                if 'encoded' in record.steps:
+                    record.steps.setdefault('uploaded', now)
+            self.sync = 'synced'
+            self._save()
+
+    def verification_counts(self) -> Dict[str, int]:
+        """Anzahl Tracks pro AccurateRip-Status (auch aus früheren Durchläufen)"""
+        counts = {'accurate': 0, 'mismatch': 0, 'unknown': 0}
+        with self._lock:
+            for record in self.tracks.values():
+                if record.accuraterip in counts:
+                    counts[record.accuraterip] += 1
+        return counts
+
+    def complete(self):
+        """Markiert die Disc als vollständig verarbeitet"""
+        with self._lock:
+            self.completed_at = time.time()
+            self._save()
+
+
+class RipJournal:
+    """
+    Verwaltet die Journale aller Discs im State-Verzeichnis
+    """
+
+    def __init__(self, journal_dir: str, keep_days: int = 30):
+        """
+        Initialisiert die Journal-Verwaltung
+
+        Args:
+            journal_dir: Verzeichnis für die Journal-Dateien
+            keep_days: Journale werden nach so vielen Tagen ohne Änderung gelöscht
+        """
+        self.journal_dir = Path(journal_dir)
+        self.keep_seconds = keep_days * 24 * 3600
+        self.logger = logging.getLogger('cd_ripper.journal')
+        self._lock = threading.Lock()
+        self._open: Dict[str, DiscJournal] = {}
+
+        try:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Journal-Verzeichnis nicht verfügbar: {e}")
+
+    def _path(self, disc_id: str) -> Path:
+        # MusicBrainz Disc-IDs enthalten nur [A-Za-z0-9._-]
+        safe_id = ''.join(c if c.isalnum() or c in '._-' else '_' for c in disc_id)
+        return self.journal_dir / f"{safe_id}.json"
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Liest eine Journal-Datei (None wenn nicht vorhanden oder unlesbar)"""
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Journal {path.name} unlesbar, beginne neu: {e}")
+            return None
+
+    def open(self, disc_id: str, album_dir: str, output_format: str) -> Optional[DiscJournal]:
+        """
+        Öffnet das Journal einer Disc (legt es bei Bedarf an)
+
+        Ein vorhandenes Journal für ein anderes Album-Verzeichnis oder Format
+        (z.B. nach geänderten Metadaten oder Profilen) wird verworfen.
+
+        Args:
+            disc_id: Disc-ID
+            album_dir: Album-Verzeichnis
+            output_format: Ausgabeformat
+
+        Returns:
+            DiscJournal oder None, wenn die Disc bereits in einem anderen
+            Laufwerk verarbeitet wird
+        """
+        with self._lock:
+            if disc_id in self._open:
+                return None
+
+            path = self._path(disc_id)
+            data = self._load(path)
+
+            if data and (data.get('album_dir') != album_dir or data.get('format') != output_format):
+                self.logger.info("Journal gehört zu anderem Album-Verzeichnis oder Format, beginne neu")
+                data = None
+
+            journal = DiscJournal(path, disc_id, album_dir, output_format, data)
+            if data is None:
+                with journal._lock:
+                    journal._save()
+            self._open[disc_id] = journal
+            return journal
+
+    def close(self, journal: DiscJournal):
+        """Gibt ein geöffnetes Journal wieder frei"""
+        with self._lock:
+            if self._open.get(journal.disc_id) is journal:
+                del self._open[journal.disc_id]
+
+    def mark_synced(self, disc_id: str) -> bool:
+        """
+        Hält einen abgeschlossenen Hintergrund-Sync fest, auch wenn die Disc
+        gerade nicht verarbeitet wird
+
+        Args:
+            disc_id: Disc-ID
+
+        Returns:
+            True wenn ein Journal aktualisiert wurde
+        """
+        with self._lock:
+            journal = self._open.get(disc_id)
+            if journal is None:
+                # Unter dem Lock, damit open() nicht gleichzeitig dieselbe Datei liest
+                data = self._load(self._path(disc_id))
+                if not data:
+                    return False
+                DiscJournal(self._path(disc_id), disc_id, data.get('album_dir'),
+                            data.get('format'), data).set_synced()
+                return True
+        journal.set_synced()
+        return True
+
+    def discard(self, disc_id: str):
+        """Löscht das Journal einer Disc (z.B. vor einem vollständigen Re-Rip)"""
+        with self._lock:
+            try:
+                self._path(disc_id).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Journal konnte nicht gelöscht werden: {e}")
+
+    def prune(self) -> List[str]:
+        """
+        Löscht Journale, die länger als keep_days nicht geändert wurden
+
+        Returns:
+            Liste der gelöschten Disc-IDs
+        """
+        removed = []
+        cutoff = time.time() - self.keep_seconds
+        for path in self.journal_dir.glob('*.json'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed.append(path.stem)
+            except OSError:
+                continue
+        if removed:
+            self.logger.info(f"{len(removed)} alte Journal(e) gelöscht")
+        return removed
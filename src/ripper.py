@@ -6,12 +6,65 @@ Extrahiert Audio-Tracks von CDs mit cdparanoia
 
 import logging
 import subprocess
+import tempfile
+import threading
 import re
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
 from dataclasses import dataclass
 
 
+# Bytes pro CD-Sektor (588 Stereo-Samples à 16 bit)
+CD_SECTOR_BYTES = 2352
+
+# Lesegröße beim Streaming (64 Sektoren)
+STREAM_CHUNK_BYTES = 64 * CD_SECTOR_BYTES
+
+# cdparanoia -e meldet Positionen in 16-bit Worten (1176 pro Sektor)
+CD_FRAME_WORDS = CD_SECTOR_BYTES // 2
+
+# Callback-Codes von cdparanoia -e, die auf unsichere Sektoren hinweisen
+SUSPECT_EVENTS = {
+    3: 'correction',
+    4: 'scratch',
+    5: 'scratch repair',
+    6: 'skip',
+    10: 'dropped',
+    11: 'duped',
+    12: 'transport error',
+    13: 'cache error',
+}
+
+# "##: 4 [scratch] @ 1234567"
+_EVENT_RE = re.compile(r'^##:\s*(-?\d+)\s+\[[^\]]*\]\s+@\s+(-?\d+)')
+_RIP_FROM_RE = re.compile(r'Ripping from sector\s+(-?\d+)')
+_RIP_TO_RE = re.compile(r'to sector\s+(-?\d+)')
+
+
+class TrackSink(ABC):
+    """
+    Empfänger für rohe PCM-Daten eines Tracks
+    (16-bit signed, little-endian, Stereo, 44.1 kHz)
+    """
+    
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Nimmt den nächsten Block PCM-Daten entgegen"""
+    
+    @abstractmethod
+    def close(self, success: bool = True) -> bool:
+        """
+        Schließt den Empfänger ab
+        
+        Args:
+            success: False wenn das Rippen fehlgeschlagen ist
+            
+        Returns:
+            True wenn die Daten vollständig verarbeitet wurden
+        """
+
+
 @dataclass
 class RipProgress:
     """Progress-Info während des Rippings"""
@@ -26,24 +79,181 @@ class CDRipper:
     Rippt Audio-CDs zu WAV-Dateien
     """
     
-    def __init__(self, device: str = "/dev/sr0", quality: str = "paranoia"):
+    def __init__(self, device: str = "/dev/sr0", quality: str = "paranoia", read_offset: int = 0,
+                 reread_margin: int = 8, spool_dir: Optional[str] = None, spool_memory_mb: int = 64):
         """
         Initialisiert den CD-Ripper
         
         Args:
             device: CD-ROM Device-Pfad
-            quality: Ripping-Qualität (paranoia, fast, normal)
+            quality: Ripping-Qualität (paranoia, fast, normal, adaptive)
+            read_offset: Lese-Offset des Laufwerks in Samples (für AccurateRip)
+            reread_margin: Adaptive: zusätzliche Sektoren vor/nach unsicheren Bereichen
+            spool_dir: Adaptive: Verzeichnis für Zwischenspeicher (Default: System-Temp)
+            spool_memory_mb: Adaptive: Track-Daten bis zu dieser Größe im RAM halten
         """
         self.device = device
         self.quality = quality
+        self.read_offset = read_offset
+        self.reread_margin = reread_margin
+        self.spool_dir = spool_dir
+        self.spool_bytes = spool_memory_mb * 1024 * 1024
         self.logger = logging.getLogger('cd_ripper.ripper')
         
         # Quality-Mapping zu cdparanoia-Flags
+        # Volle Paranoia ist der Standard von cdparanoia (-Z würde sie abschalten)
+        # adaptive: schneller erster Durchlauf, unsichere Bereiche mit voller Paranoia neu lesen
         self.quality_flags = {
-            'paranoia': '-Z',  # Maximum paranoia/overlap
-            'fast': '-Y',      # Disable extra paranoia
+            'paranoia': '',    # Volle Paranoia (Verifikation und Korrektur)
+            'fast': '-Y',      # Nur Overlap-Prüfung
+            'adaptive': '-Y',
             'normal': ''       # Standard
         }
+    
+    def _quality_args(self, quality: Optional[str] = None) -> List[str]:
+        """
+        cdparanoia-Optionen für eine Qualitätsstufe
+        
+        Args:
+            quality: Qualitätsstufe (Default: self.quality)
+            
+        Returns:
+            Liste von Optionen (adaptive zusätzlich mit -e für Ereignis-Meldungen)
+        """
+        quality = quality or self.quality
+        args = []
+        quality_flag = self.quality_flags.get(quality, '')
+        if quality_flag:
+            args.append(quality_flag)
+        if quality == 'adaptive':
+            args.append('-e')
+        return args
+    
+    def _suspect_sectors(self, lines: List[str]) -> Tuple[Optional[int], set]:
+        """
+        Wertet die Ereignis-Meldungen von cdparanoia -e aus
+        
+        Args:
+            lines: stderr-Zeilen von cdparanoia
+            
+        Returns:
+            Tuple (erster gerippter Sektor oder None, Menge unsicherer Sektoren absolut)
+        """
+        first_sector = None
+        sectors = set()
+        for line in lines:
+            if first_sector is None:
+                match = _RIP_FROM_RE.search(line)
+                if match:
+                    first_sector = int(match.group(1))
+                    continue
+            match = _EVENT_RE.match(line)
+            if match and int(match.group(1)) in SUSPECT_EVENTS:
+                sectors.add(int(match.group(2)) // CD_FRAME_WORDS)
+        return first_sector, sectors
+    
+    def _suspect_ranges(self, sectors: set, first_sector: int, track_sectors: int) -> List[Tuple[int, int]]:
+        """
+        Fasst unsichere Sektoren zu Bereichen (relativ zum Track) zusammen
+        
+        Args:
+            sectors: Unsichere Sektoren (absolut)
+            first_sector: Erster Sektor des Tracks (absolut)
+            track_sectors: Länge des Tracks in Sektoren
+            
+        Returns:
+            Liste (Start-Sektor, Anzahl) relativ zum Track-Anfang
+        """
+        ranges: List[Tuple[int, int]] = []
+        for sector in sorted(sectors):
+            start = max(0, sector - first_sector - self.reread_margin)
+            end = min(track_sectors, sector - first_sector + self.reread_margin + 1)
+            if start >= end:
+                continue
+            if ranges and start <= ranges[-1][0] + ranges[-1][1]:
+                previous_start, _ = ranges[-1]
+                ranges[-1] = (previous_start, max(end, previous_start + ranges[-1][1]) - previous_start)
+            else:
+                ranges.append((start, end - start))
+        return ranges
+    
+    def reread_range(self, track_number: int, start: int, count: int) -> Optional[bytes]:
+        """
+        Liest einen Sektor-Bereich eines Tracks mit voller Paranoia neu
+        
+        Args:
+            track_number: Track-Nummer (1-basiert)
+            start: Erster Sektor relativ zum Track-Anfang
+            count: Anzahl Sektoren
+            
+        Returns:
+            PCM-Daten (count Sektoren) oder None bei Fehler
+        """
+        # Ein Sektor mehr anfordern: funktioniert mit inklusivem wie exklusivem Span-Ende
+        span = f"{track_number}[.{start}]-{track_number}[.{start + count}]"
+        cmd = ['cdparanoia'] + self._quality_args('paranoia')
+        if self.read_offset:
+            cmd.extend(['-O', str(self.read_offset)])
+        cmd.extend(['-r', '-d', self.device, span, '-'])
+        self.logger.debug(f"Kommando: {' '.join(cmd)}")
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=60 + count)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.logger.warning(f"⚠️  Track {track_number}: Neu-Lesen fehlgeschlagen: {e}")
+            return None
+        
+        needed = count * CD_SECTOR_BYTES
+        if result.returncode != 0 or len(result.stdout) < needed:
+            self.logger.warning(f"⚠️  Track {track_number}: Neu-Lesen von Sektor {start} "
+                                f"fehlgeschlagen (Exit-Code {result.returncode})")
+            return None
+        return result.stdout[:needed]
+    
+    def _repair(self, track_number: int, output, data_offset: int,
+                stderr_lines: List[str], track_sectors: int,
+                first_sector: Optional[int] = None) -> bool:
+        """
+        Liest unsichere Bereiche eines schnell gerippten Tracks neu und
+        ersetzt sie in der Ausgabe
+        
+        Args:
+            track_number: Track-Nummer (1-basiert)
+            output: Beschreibbares, seekbares Datei-Objekt mit den PCM-Daten
+            data_offset: Position der PCM-Daten in output (z.B. WAV-Header)
+            stderr_lines: stderr-Zeilen des schnellen Durchlaufs (cdparanoia -e)
+            track_sectors: Länge des Tracks in Sektoren
+            first_sector: Erster Sektor des Tracks (falls nicht aus stderr ersichtlich)
+            
+        Returns:
+            True wenn alle unsicheren Bereiche ersetzt wurden
+        """
+        parsed_first, sectors = self._suspect_sectors(stderr_lines)
+        if not sectors:
+            return True
+        
+        first_sector = parsed_first if parsed_first is not None else first_sector
+        if first_sector is None:
+            self.logger.warning(f"⚠️  Track {track_number}: Position unbekannt, Bereiche nicht reparierbar")
+            return False
+        
+        ranges = self._suspect_ranges(sectors, first_sector, track_sectors)
+        total = sum(count for _, count in ranges)
+        self.logger.info(f"Track {track_number}: {len(sectors)} unsichere Sektoren, "
+                         f"lese {len(ranges)} Bereich(e) ({total} Sektoren) mit Paranoia neu")
+        
+        all_ok = True
+        for start, count in ranges:
+            data = self.reread_range(track_number, start, count)
+            if data is None:
+                all_ok = False
+                continue
+            output.seek(data_offset + start * CD_SECTOR_BYTES)
+            output.write(data)
+        
+        if all_ok:
+            self.logger.info(f"✓ Track {track_number}: unsichere Bereiche ersetzt")
+        return all_ok
         
     def _parse_progress(self, line: str) -> Optional[int]:
         """
@@ -66,7 +276,8 @@ class CDRipper:
         return None
     
     def rip_track(self, track_number: int, output_file: str,
-                  progress_callback: Optional[Callable[[int], None]] = None) -> bool:
+                  progress_callback: Optional[Callable[[int], None]] = None,
+                  quality: Optional[str] = None) -> bool:
         """
         Rippt einen einzelnen Track
         
@@ -74,6 +285,7 @@ class CDRipper:
             track_number: Track-Nummer (1-basiert)
             output_file: Ausgabe-Datei (WAV)
             progress_callback: Optional Callback für Progress-Updates
+            quality: Optional abweichende Qualitätsstufe (z.B. paranoia für einen Re-Rip)
             
         Returns:
             True bei Erfolg
@@ -81,14 +293,14 @@ class CDRipper:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        quality = quality or self.quality
         self.logger.info(f"Rippe Track {track_number} → {output_path.name}")
         
         # cdparanoia-Kommando
-        quality_flag = self.quality_flags.get(self.quality, '')
-        cmd = ['cdparanoia']
+        cmd = ['cdparanoia'] + self._quality_args(quality)
         
-        if quality_flag:
-            cmd.append(quality_flag)
+        if self.read_offset:
+            cmd.extend(['-O', str(self.read_offset)])
         
         cmd.extend([
             '-d', self.device,
@@ -109,6 +321,8 @@ class CDRipper:
             )
             
             last_percent = -1
+            output_lines: List[str] = []
+            span: List[int] = []
             
             # Output lesen
             for line in process.stdout:
@@ -116,9 +330,12 @@ class CDRipper:
                 
                 if line:
                     self.logger.debug(f"cdparanoia: {line}")
+                    output_lines.append(line)
                     
-                    # Progress parsen
+                    # Progress parsen (mit -e aus den "wrote"-Positionen)
                     percent = self._parse_progress(line)
+                    if quality == 'adaptive':
+                        percent = self._parse_event_progress(line, span)
                     if percent is not None and percent != last_percent:
                         last_percent = percent
                         if progress_callback:
@@ -134,6 +351,13 @@ class CDRipper:
             if returncode == 0:
                 # Prüfe ob Datei existiert und Größe > 0
                 if output_path.exists() and output_path.stat().st_size > 0:
+                    if quality == 'adaptive':
+                        # Unsichere Bereiche direkt in der WAV-Datei ersetzen (44 Byte Header)
+                        track_sectors = (output_path.stat().st_size - 44) // CD_SECTOR_BYTES
+                        with open(output_path, 'r+b') as wav:
+                            if not self._repair(track_number, wav, 44, output_lines, track_sectors):
+                                self.logger.error(f"❌ Track {track_number}: unsichere Bereiche nicht reparierbar")
+                                return False
                     size_mb = output_path.stat().st_size / (1024 * 1024)
                     self.logger.info(f"✅ Track {track_number} erfolgreich gerippt ({size_mb:.1f} MB)")
                     return True
@@ -151,6 +375,372 @@ class CDRipper:
             self.logger.error(f"❌ Unerwarteter Fehler bei Track {track_number}: {e}")
             return False
     
+    def _parse_event_progress(self, line: str, span: List[int]) -> Optional[int]:
+        """
+        Progress aus cdparanoia -e Meldungen ("wrote"-Position im gerippten Bereich)
+        
+        Args:
+            line: Ausgabe-Zeile von cdparanoia
+            span: Liste, in der erster und letzter Sektor gesammelt werden
+            
+        Returns:
+            Prozent-Wert oder None
+        """
+        for pattern in (_RIP_FROM_RE, _RIP_TO_RE):
+            match = pattern.search(line)
+            if match and len(span) < 2:
+                span.append(int(match.group(1)))
+                return None
+        
+        match = _EVENT_RE.match(line)
+        if not match or int(match.group(1)) != -2 or len(span) < 2 or span[1] <= span[0]:
+            return None
+        sector = int(match.group(2)) // CD_FRAME_WORDS
+        return max(0, min(100, (sector - span[0]) * 100 // (span[1] - span[0])))
+    
+    def _build_stream_command(self, span: str, quality: Optional[str] = None) -> List[str]:
+        """
+        Baut das cdparanoia-Kommando für rohe PCM-Ausgabe auf stdout
+        
+        Args:
+            span: cdparanoia Span (z.B. "3" oder "1-")
+            quality: Optional abweichende Qualitätsstufe
+            
+        Returns:
+            Kommando als Liste
+        """
+        cmd = ['cdparanoia'] + self._quality_args(quality)
+        
+        if self.read_offset:
+            # Laufwerks-Offset korrigieren (Voraussetzung für AccurateRip-Treffer)
+            cmd.extend(['-O', str(self.read_offset)])
+        
+        cmd.extend([
+            '-r',  # Headerless PCM, little-endian
+            '-d', self.device,
+            span,
+            '-'    # Ausgabe auf stdout
+        ])
+        return cmd
+    
+    def _collect_stderr(self, process: subprocess.Popen, lines: List[str]):
+        """Liest stderr von cdparanoia im Hintergrund (verhindert Pipe-Blockaden)"""
+        for raw_line in process.stderr:
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if line:
+                lines.append(line)
+                self.logger.debug(f"cdparanoia: {line}")
+    
+    def rip_track_to_sink(self, track_number: int, sink: TrackSink,
+                          expected_bytes: Optional[int] = None,
+                          progress_callback: Optional[Callable[[int], None]] = None,
+                          quality: Optional[str] = None,
+                          first_sector: Optional[int] = None) -> bool:
+        """
+        Rippt einen Track und streamt die PCM-Daten direkt in einen Empfänger
+        (z.B. den stdin eines Encoders), ohne WAV-Zwischendatei
+        
+        Im adaptiven Modus wird der Track schnell in einen Zwischenspeicher
+        gerippt, unsichere Bereiche werden mit Paranoia neu gelesen und
+        ersetzt, erst dann gehen die Daten an den Empfänger.
+        
+        Args:
+            track_number: Track-Nummer (1-basiert)
+            sink: Empfänger der PCM-Daten
+            expected_bytes: Erwartete Datenmenge (für Progress), optional
+            progress_callback: Optional Callback für Progress-Updates
+            quality: Optional abweichende Qualitätsstufe (z.B. paranoia für einen Re-Rip)
+            first_sector: Optional erster Sektor des Tracks (absolut, für den adaptiven Modus)
+            
+        Returns:
+            True bei Erfolg
+        """
+        quality = quality or self.quality
+        cmd = self._build_stream_command(str(track_number), quality)
+        self.logger.info(f"Rippe Track {track_number} (Streaming)")
+        self.logger.debug(f"Kommando: {' '.join(cmd)}")
+        
+        process = None
+        stderr_lines: List[str] = []
+        bytes_read = 0
+        spool = None
+        if quality == 'adaptive':
+            spool = tempfile.SpooledTemporaryFile(max_size=self.spool_bytes, dir=self.spool_dir)
+        target = spool if spool is not None else sink
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            
+            stderr_thread = threading.Thread(
+                target=self._collect_stderr,
+                args=(process, stderr_lines),
+                daemon=True
+            )
+            stderr_thread.start()
+            
+            last_percent = -1
+            
+            while True:
+                chunk = process.stdout.read(STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                
+                target.write(chunk)
+                bytes_read += len(chunk)
+                
+                if expected_bytes:
+                    percent = min(100, bytes_read * 100 // expected_bytes)
+                    if percent != last_percent:
+                        last_percent = percent
+                        if progress_callback:
+                            progress_callback(percent)
+                        
+                        # Nur alle 10% loggen
+                        if percent % 10 == 0:
+                            self.logger.info(f"  Track {track_number}: {percent}%")
+            
+            returncode = process.wait()
+            stderr_thread.join(timeout=5)
+            
+            if returncode != 0:
+                self.logger.error(f"❌ Track {track_number}: cdparanoia Exit-Code {returncode}")
+                if stderr_lines:
+                    self.logger.error(f"   {stderr_lines[-1]}")
+                sink.close(success=False)
+                return False
+            
+            if bytes_read == 0:
+                self.logger.error(f"❌ Track {track_number}: keine Audio-Daten gelesen")
+                sink.close(success=False)
+                return False
+            
+            if spool is not None:
+                if not self._repair(track_number, spool, 0, stderr_lines,
+                                    bytes_read // CD_SECTOR_BYTES, first_sector):
+                    self.logger.error(f"❌ Track {track_number}: unsichere Bereiche nicht reparierbar")
+                    sink.close(success=False)
+                    return False
+                
+                # Reparierte Daten an den eigentlichen Empfänger weitergeben
+                spool.seek(0)
+                while True:
+                    chunk = spool.read(STREAM_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    sink.write(chunk)
+            
+            if not sink.close(success=True):
+                self.logger.error(f"❌ Track {track_number}: Verarbeitung des Streams fehlgeschlagen")
+                return False
+            
+            size_mb = bytes_read / (1024 * 1024)
+            self.logger.info(f"✅ Track {track_number} erfolgreich gerippt ({size_mb:.1f} MB PCM gestreamt)")
+            return True
+            
+        except (BrokenPipeError, OSError) as e:
+            self.logger.error(f"❌ Stream von Track {track_number} abgebrochen: {e}")
+            if process and process.poll() is None:
+                process.kill()
+                process.wait()
+            sink.close(success=False)
+            return False
+        except Exception as e:
+            self.logger.error(f"❌ Unerwarteter Fehler bei Track {track_number}: {e}")
+            if process and process.poll() is None:
+                process.kill()
+                process.wait()
+            sink.close(success=False)
+            return False
+        finally:
+            if spool is not None:
+                spool.close()
+    
+    def rip_disc_to_sinks(self, track_layout: List[Tuple[int, int]],
+                          open_sink: Callable[[int], Optional[TrackSink]],
+                          on_track_done: Callable[[int, bool], None],
+                          progress_callback: Optional[Callable[[int], None]] = None,
+                          should_continue: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Rippt alle Tracks in einem einzigen cdparanoia-Durchlauf ("1-") und
+        teilt den PCM-Stream anhand der TOC-Längen auf die Tracks auf.
+        Spart Prozessstart, Seek und Spin-Up an jeder Track-Grenze.
+        
+        Im adaptiven Modus belegt der Durchlauf das Laufwerk, Bereiche lassen
+        sich daher nicht sofort neu lesen: Tracks mit unsicheren Sektoren
+        werden als fehlgeschlagen gemeldet und können danach einzeln
+        (z.B. mit Paranoia) neu gerippt werden.
+        
+        Args:
+            track_layout: Liste (Track-Nummer, Länge in Sektoren) in Disc-Reihenfolge
+            open_sink: Liefert den Empfänger für einen Track (None bei Fehler)
+            on_track_done: Wird nach jedem Track mit (Track-Nummer, Erfolg) aufgerufen
+            progress_callback: Optional Callback für Gesamt-Progress der Disc
+            should_continue: Optional Callback, False bricht das Rippen ab
+            
+        Returns:
+            True wenn alle Tracks erfolgreich gerippt wurden
+        """
+        if not track_layout:
+            self.logger.error("Keine TOC-Daten für Single-Pass-Ripping")
+            return False
+        
+        cmd = self._build_stream_command('1-')
+        total_bytes = sum(sectors for _, sectors in track_layout) * CD_SECTOR_BYTES
+        self.logger.info(f"Rippe komplette Disc in einem Durchlauf ({len(track_layout)} Tracks)")
+        self.logger.debug(f"Kommando: {' '.join(cmd)}")
+        
+        index = 0
+        sink = None
+        sink_ok = False
+        remaining = 0
+        all_ok = True
+        process = None
+        stderr_lines: List[str] = []
+        
+        def start_track() -> None:
+            nonlocal sink, sink_ok, remaining
+            track_number, sectors = track_layout[index]
+            remaining = sectors * CD_SECTOR_BYTES
+            sink = open_sink(track_number)
+            sink_ok = sink is not None
+        
+        adaptive = self.quality == 'adaptive'
+        track_start = 0
+        
+        def finish_track(success: bool) -> None:
+            nonlocal index, all_ok, track_start
+            track_number, sectors = track_layout[index]
+            if success and adaptive:
+                disc_start, suspect = self._suspect_sectors(stderr_lines)
+                if disc_start is not None:
+                    first = disc_start + track_start
+                    hits = [s for s in suspect if first <= s < first + sectors]
+                    if hits:
+                        self.logger.warning(f"⚠️  Track {track_number}: {len(hits)} unsichere Sektoren "
+                                            f"im schnellen Durchlauf")
+                        success = False
+            track_start += sectors
+            if sink_ok:
+                success = sink.close(success=success) and success
+            else:
+                success = False
+            if not success:
+                all_ok = False
+            on_track_done(track_number, success)
+            index += 1
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            
+            stderr_thread = threading.Thread(
+                target=self._collect_stderr,
+                args=(process, stderr_lines),
+                daemon=True
+            )
+            stderr_thread.start()
+            
+            start_track()
+            bytes_read = 0
+            last_percent = -1
+            
+            while index < len(track_layout):
+                if should_continue and not should_continue():
+                    self.logger.warning("Single-Pass-Ripping abgebrochen")
+                    process.kill()
+                    break
+                
+                chunk = process.stdout.read(STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                bytes_read += len(chunk)
+                
+                # Chunk kann über eine oder mehrere Track-Grenzen reichen
+                view = memoryview(chunk)
+                while view and index < len(track_layout):
+                    part = view[:remaining]
+                    if sink_ok:
+                        try:
+                            sink.write(bytes(part))
+                        except (BrokenPipeError, OSError) as e:
+                            self.logger.error(f"❌ Stream von Track {track_layout[index][0]} abgebrochen: {e}")
+                            sink.close(success=False)
+                            sink_ok = False
+                    remaining -= len(part)
+                    view = view[len(part):]
+                    
+                    if remaining == 0:
+                        finish_track(True)
+                        if index < len(track_layout):
+                            start_track()
+                
+                percent = min(100, bytes_read * 100 // total_bytes)
+                if percent != last_percent:
+                    last_percent = percent
+                    if progress_callback:
+                        progress_callback(percent)
+            
+            if index < len(track_layout):
+                # Restliche Daten verwerfen, damit cdparanoia nicht blockiert
+                process.stdout.read()
+            returncode = process.wait()
+            stderr_thread.join(timeout=5)
+            
+            if returncode != 0:
+                self.logger.error(f"❌ cdparanoia Exit-Code {returncode}")
+                if stderr_lines:
+                    self.logger.error(f"   {stderr_lines[-1]}")
+            
+        except Exception as e:
+            self.logger.error(f"❌ Fehler beim Single-Pass-Ripping: {e}")
+            if process and process.poll() is None:
+                process.kill()
+                process.wait()
+        
+        # Unvollständige bzw. nicht erreichte Tracks als fehlgeschlagen melden
+        while index < len(track_layout):
+            finish_track(False)
+            sink_ok = False
+        
+        self.logger.info("✅ Single-Pass-Ripping abgeschlossen" if all_ok
+                         else "⚠️  Single-Pass-Ripping mit Fehlern abgeschlossen")
+        return all_ok
+    
+    def get_toc(self) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Liest die TOC der CD über cdparanoia -Q
+        
+        Returns:
+            Liste (Track-Nummer, Start-Sektor, Länge in Sektoren) oder None
+        """
+        try:
+            result = subprocess.run(
+                ['cdparanoia', '-d', self.device, '-Q'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            
+            # Zeilen wie: "  1.    16503 [03:40.03]        0 [00:00.00]    no   no  2"
+            toc = []
+            for line in result.stderr.split('\n'):
+                match = re.match(r'^\s+(\d+)\.\s+(\d+)\s+\[[^\]]*\]\s+(\d+)', line)
+                if match:
+                    toc.append((int(match.group(1)), int(match.group(3)), int(match.group(2))))
+            
+            return toc or None
+            
+        except Exception as e:
+            self.logger.error(f"Fehler beim Lesen der TOC: {e}")
+            return None
+    
     def rip_all_tracks(self, track_count: int, output_dir: str,
                        filename_pattern: str = "track_{:02d}.wav",
                        progress_callback: Optional[Callable[[RipProgress], None]] = None) -> List[str]:
@@ -1,86 +1,445 @@
 #!/usr/bin/env python3
 """
 Shared Status Module
-Ermöglicht Kommunikation zwischen Main Service und Web Interface via Datei
+Ermöglicht Kommunikation zwischen Main Service und Web Interface
+
+Standard-Backend ist ein memory-mapped Datensatz mit fester Struktur
+(Seqlock + Versionszähler), alternativ eine JSON-Datei mit atomarem Ersetzen.
 """
 
 import json
-import base64
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 from datetime import datetime
 import fcntl
 
 
-class SharedStatus:
+DEFAULT_MMAP_PATH = "/dev/shm/cd-ripper-status"
+DEFAULT_JSON_PATH = "/tmp/cd-ripper-status.json"
+
+# Header: Magic, Sequenz (ungerade = Schreibvorgang läuft), Länge, CRC32 der Nutzdaten
+_MAGIC = b'CDRSTAT1'
+_HEADER = struct.Struct('<8sQII')
+_SEQ = struct.Struct('<Q')
+_SEQ_OFFSET = 8
+_PAYLOAD_INFO = struct.Struct('<II')
+_PAYLOAD_INFO_OFFSET = 16
+DEFAULT_CAPACITY = 64 * 1024
+
+
+class MmapStatusStore:
     """
-    Thread-sicherer Status-Speicher via JSON-Datei
+    Status als JSON-Nutzdaten in einem memory-mapped Datensatz fester Größe
+    
+    Schreiber erhöhen die Sequenz vor und nach dem Schreiben (Seqlock),
+    Leser prüfen Sequenz und CRC und lesen bei Überschneidung erneut.
+    Die Version lässt sich ohne Parsen direkt aus dem Header lesen.
     """
     
-    def __init__(self, status_file: str = "/tmp/cd-ripper-status.json"):
-        self.status_file = Path(status_file)
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        """
+        Öffnet oder erstellt den Status-Datensatz
         
-    def _read_status(self) -> Dict[str, Any]:
-        """Liest Status aus Datei"""
-        if not self.status_file.exists():
-            return {}
+        Args:
+            path: Pfad der Datei (idealerweise auf tmpfs, z.B. /dev/shm)
+            capacity: Maximale Größe der JSON-Nutzdaten in Bytes
+        """
+        self.path = Path(path)
+        self.capacity = capacity
+        size = _HEADER.size + capacity
+        
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+        except Exception:
+            os.close(self._fd)
+            raise
+        
+        self._lock = threading.Lock()
+        self._cache_version = -1
+        self._cache_data: Dict[str, Any] = {}
+    
+    # Header-Felder nur über Slice-Kopien (memcpy) lesen und schreiben:
+    # struct.pack_into setzt den Bereich vorher auf 0, unpack_from liest
+    # byteweise - ein anderer Prozess könnte sonst eine Sequenz 0 sehen
+    def _read_header(self) -> Tuple[bytes, int, int, int]:
+        """Liest Magic, Sequenz, Länge und CRC32"""
+        return _HEADER.unpack(self._map[:_HEADER.size])
+    
+    def _read_seq(self) -> int:
+        """Liest die Sequenz"""
+        return _SEQ.unpack(self._map[_SEQ_OFFSET:_SEQ_OFFSET + _SEQ.size])[0]
+    
+    def _write_seq(self, seq: int):
+        """Schreibt die Sequenz in einem Stück"""
+        self._map[_SEQ_OFFSET:_SEQ_OFFSET + _SEQ.size] = _SEQ.pack(seq)
+    
+    def version(self) -> int:
+        """Aktuelle Version (gerade Zahl, steigt mit jedem Schreibvorgang)"""
+        if self._map[:len(_MAGIC)] != _MAGIC:
+            return 0
+        return self._read_seq() & ~1
+    
+    def read(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Liest einen konsistenten Stand
+        
+        Returns:
+            Tuple (Version, Status-Dictionary)
+        """
+        for _ in range(200):
+            magic, seq, length, crc = self._read_header()
+            if magic != _MAGIC:
+                return 0, {}
+            
+            if seq & 1:
+                # Schreibvorgang läuft gerade
+                time.sleep(0.0005)
+                continue
+            
+            with self._lock:
+                if seq == self._cache_version:
+                    return seq, dict(self._cache_data)
+            
+            payload = self._map[_HEADER.size:_HEADER.size + min(length, self.capacity)]
+            if self._read_seq() != seq or zlib.crc32(payload) != crc:
+                continue
+            
+            try:
+                data = json.loads(payload) if payload else {}
+            except ValueError:
+                continue
+            
+            with self._lock:
+                self._cache_version = seq
+                self._cache_data = data
+            return seq, dict(data)
+        
+        # Schreiber hängt (z.B. abgestürzt) - letzten bekannten Stand liefern
+        with self._lock:
+            return max(self._cache_version, 0), dict(self._cache_data)
+    
+    def update(self, modify: Callable[[Dict[str, Any]], None]):
+        """
+        Ändert den Status atomar (Read-Modify-Write unter Lock)
+        
+        Args:
+            modify: Funktion, die das Status-Dictionary in-place ändert
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                magic, seq, length, crc = self._read_header()
+                data: Dict[str, Any] = {}
+                if magic == _MAGIC:
+                    payload = self._map[_HEADER.size:_HEADER.size + min(length, self.capacity)]
+                    if payload and zlib.crc32(payload) == crc:
+                        try:
+                            data = json.loads(payload)
+                        except ValueError:
+                            data = {}
+                else:
+                    seq = 0
+                
+                modify(data)
+                payload = json.dumps(data).encode('utf-8')
+                if len(payload) > self.capacity:
+                    raise ValueError(f"Status zu groß ({len(payload)} > {self.capacity} Bytes)")
+                
+                # Ungerade nach abgebrochenem Schreibvorgang → auf gerade aufrunden
+                seq += seq & 1
+                self._write_seq(seq + 1)
+                if magic != _MAGIC:
+                    self._map[:len(_MAGIC)] = _MAGIC
+                self._map[_HEADER.size:_HEADER.size + len(payload)] = payload
+                self._map[_PAYLOAD_INFO_OFFSET:_HEADER.size] = _PAYLOAD_INFO.pack(len(payload), zlib.crc32(payload))
+                self._write_seq(seq + 2)
+                
+                self._cache_version = seq + 2
+                self._cache_data = data
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class JsonStatusStore:
+    """
+    Status als JSON-Datei, geschrieben über temporäre Datei + os.replace
+    
+    Die Version ist die Änderungszeit der Datei (ns), geparst wird nur
+    nach einer Änderung.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Pfad der JSON-Datei
+        """
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(self.path.name + '.lock')
+        self._lock = threading.Lock()
+        self._cache_key = None
+        self._cache_data: Dict[str, Any] = {}
+    
+    def version(self) -> int:
+        """Aktuelle Version (Änderungszeit in ns, 0 wenn nicht vorhanden)"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def read(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Liest den aktuellen Stand
+        
+        Returns:
+            Tuple (Version, Status-Dictionary)
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return 0, {}
+        
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key == self._cache_key:
+                return stat.st_mtime_ns, dict(self._cache_data)
         
         try:
-            with open(self.status_file, 'r') as f:
-                fcntl.flock(f, fcntl.LOCK_SH)
+            with open(self.path, 'r') as f:
                 data = json.load(f)
-                fcntl.flock(f, fcntl.LOCK_UN)
-                return data
-        except:
+        except (OSError, ValueError):
+            return stat.st_mtime_ns, {}
+        
+        with self._lock:
+            self._cache_key = key
+            self._cache_data = data
+        return stat.st_mtime_ns, dict(data)
+    
+    def update(self, modify: Callable[[Dict[str, Any]], None]):
+        """
+        Ändert den Status atomar (Read-Modify-Write unter Lock)
+        
+        Args:
+            modify: Funktion, die das Status-Dictionary in-place ändert
+        """
+        with self._lock_path.open('a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Frisch parsen: read() teilt verschachtelte Objekte mit dem Cache
+                # und bereits ausgelieferten Ständen, modify() ändert in-place
+                try:
+                    with open(self.path, 'r') as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    data = {}
+                modify(data)
+                
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class SharedStatus:
+    """
+    Prozess- und thread-sicherer Status-Speicher
+    """
+    
+    def __init__(self, status_file: Optional[str] = None, backend: str = "mmap"):
+        """
+        Initialisiert den Status-Speicher
+        
+        Args:
+            status_file: Pfad der Status-Datei (Default je nach Backend)
+            backend: mmap (Default) oder json
+        """
+        self._store = None
+        
+        if backend == "mmap":
+            path = status_file or DEFAULT_MMAP_PATH
+            if not status_file and not Path(path).parent.is_dir():
+                path = "/tmp/cd-ripper-status"
+            try:
+                self._store = MmapStatusStore(path)
+            except Exception as e:
+                print(f"mmap-Status nicht verfügbar, verwende JSON-Datei: {e}")
+                status_file = None
+        
+        if self._store is None:
+            self._store = JsonStatusStore(status_file or DEFAULT_JSON_PATH)
+        
+        self.status_file = self._store.path
+    
+    def _read_status(self) -> Dict[str, Any]:
+        """Liest Status"""
+        try:
+            return self._store.read()[1]
+        except Exception:
             return {}
     
-    def _write_status(self, data: Dict[str, Any]):
-        """Schreibt Status in Datei"""
+    def _update_status(self, modify: Callable[[Dict[str, Any]], None]):
+        """Ändert Status atomar"""
         try:
-            with open(self.status_file, 'w') as f:
-                fcntl.flock(f, fcntl.LOCK_EX)
-                json.dump(data, f)
-                fcntl.flock(f, fcntl.LOCK_UN)
+            self._store.update(modify)
         except Exception as e:
             print(f"Fehler beim Status-Schreiben: {e}")
     
-    def update_cd(self, name: str, artist: str, cover_path: Optional[str] = None):
-        """Aktualisiert CD-Informationen"""
-        status = self._read_status()
-        status['current_cd'] = {
-            'name': name,
-            'artist': artist,
-            'cover_path': cover_path,
-            'cover_url': '/api/cover' if cover_path else None
-        }
-        status['last_update'] = datetime.now().isoformat()
-        self._write_status(status)
-    
-    def update_progress(self, step: str, progress: int, current_track: int = 0, total_tracks: int = 0):
-        """Aktualisiert Progress"""
-        status = self._read_status()
-        status['processing'] = True
-        status['current_step'] = step
-        status['progress'] = progress
-        status['current_track'] = current_track
-        status['total_tracks'] = total_tracks
-        status['last_update'] = datetime.now().isoformat()
-        self._write_status(status)
-    
-    def set_processing(self, processing: bool):
-        """Setzt Processing-Status"""
-        status = self._read_status()
-        status['processing'] = processing
-        status['last_update'] = datetime.now().isoformat()
-        self._write_status(status)
+    def _write_status(self, data: Dict[str, Any]):
+        """Ersetzt den kompletten Status"""
+        def replace(status):
+            status.clear()
+            status.update(data)
+        self._update_status(replace)
+    
+    def get_version(self) -> int:
+        """
+        Liefert die Status-Version ohne die Daten zu parsen
+        
+        Returns:
+            Versionszähler (ändert sich bei jedem Schreibvorgang)
+        """
+        try:
+            return self._store.version()
+        except Exception:
+            return 0
+    
+    def _apply(self, status: Dict[str, Any], fields: Dict[str, Any], drive: Optional[str] = None):
+        """
+        Schreibt Felder in den Status
+        
+        Mit Laufwerk landen die Felder unter status['drives'][drive]. Die
+        bisherigen Felder auf oberster Ebene spiegeln das Laufwerk im Fokus,
+        damit ältere Clients weiter funktionieren. Ein aktives Laufwerk
+        übernimmt den Fokus, sobald das bisherige nicht mehr arbeitet.
+        
+        Args:
+            status: Status-Dictionary (wird in-place geändert)
+            fields: Zu setzende Felder
+            drive: Laufwerks-ID oder None (Einzel-Laufwerk-Betrieb)
+        """
+        if drive is None:
+            status.update(fields)
+            return
+        
+        drives = status.setdefault('drives', {})
+        entry = drives.setdefault(drive, {})
+        entry.update(fields)
+        
+        focus = status.get('focus_drive')
+        focus_idle = focus not in drives or not drives[focus].get('processing')
+        if focus == drive or (focus_idle and entry.get('processing')):
+            self._focus(status, drive)
+    
+    def _focus(self, status: Dict[str, Any], drive: Optional[str]):
+        """Setzt das Laufwerk im Fokus und spiegelt dessen Eintrag auf die oberste Ebene"""
+        status['focus_drive'] = drive
+        entry = status.get('drives', {}).get(drive, {}) if drive else {}
+        for key in ('current_cd', 'processing', 'current_step', 'progress',
+                    'current_track', 'total_tracks', 'last_update'):
+            status[key] = entry.get(key)
+    
+    def set_drives(self, devices: Dict[str, str]):
+        """
+        Legt die Status-Einträge der Laufwerke an (Multi-Laufwerk-Betrieb)
+        
+        Einträge nicht mehr konfigurierter Laufwerke werden entfernt.
+        
+        Args:
+            devices: Laufwerks-ID (z.B. sr1) → Device-Pfad
+        """
+        def modify(status):
+            status['drives'] = {
+                drive: {
+                    'device': device,
+                    'current_cd': None,
+                    'processing': False,
+                    'current_step': None,
+                    'progress': 0,
+                    'current_track': 0,
+                    'total_tracks': 0,
+                    'last_update': datetime.now().isoformat()
+                }
+                for drive, device in devices.items()
+            }
+            status['focus_drive'] = None
+        self._update_status(modify)
+    
+    def update_cd(self, name: str, artist: str, cover_path: Optional[str] = None,
+                  drive: Optional[str] = None):
+        """Aktualisiert CD-Informationen (optional für ein Laufwerk)"""
+        def modify(status):
+            cover_url = None
+            if cover_path:
+                cover_url = f'/api/cover?drive={drive}' if drive else '/api/cover'
+            self._apply(status, {
+                'current_cd': {
+                    'name': name,
+                    'artist': artist,
+                    'cover_path': cover_path,
+                    'cover_url': cover_url
+                },
+                'last_update': datetime.now().isoformat()
+            }, drive)
+        self._update_status(modify)
+    
+    def update_progress(self, step: str, progress: int, current_track: int = 0, total_tracks: int = 0,
+                        drive: Optional[str] = None):
+        """Aktualisiert Progress (optional für ein Laufwerk)"""
+        def modify(status):
+            self._apply(status, {
+                'processing': True,
+                'current_step': step,
+                'progress': progress,
+                'current_track': current_track,
+                'total_tracks': total_tracks,
+                'last_update': datetime.now().isoformat()
+            }, drive)
+        self._update_status(modify)
+    
+    def set_processing(self, processing: bool, drive: Optional[str] = None):
+        """Setzt Processing-Status (optional für ein Laufwerk)"""
+        def modify(status):
+            self._apply(status, {
+                'processing': processing,
+                'last_update': datetime.now().isoformat()
+            }, drive)
+        self._update_status(modify)
+    
+    def update_sync(self, sync_info: Dict[str, Any]):
+        """
+        Aktualisiert den Stand der Sync-Warteschlange
+        
+        Args:
+            sync_info: pending, active, progress, last_error
+        """
+        def modify(status):
+            status['sync'] = sync_info
+        self._update_status(modify)
     
     def get_status(self) -> Dict[str, Any]:
         """Liest kompletten Status"""
         return self._read_status()
     
-    def clear(self):
-        """Setzt Status zurück (löscht CD-Info und Progress)"""
-        self._write_status({
+    def get_status_with_version(self) -> Tuple[int, Dict[str, Any]]:
+        """Liest kompletten Status zusammen mit der zugehörigen Version"""
+        try:
+            return self._store.read()
+        except Exception:
+            return 0, {}
+    
+    def clear(self, drive: Optional[str] = None):
+        """Setzt Status zurück (löscht CD-Info und Progress, optional nur für ein Laufwerk)"""
+        empty = {
             'current_cd': None,
             'processing': False,
             'current_step': None,
@@ -88,18 +447,41 @@ class SharedStatus:
             'current_track': 0,
             'total_tracks': 0,
             'last_update': datetime.now().isoformat()
-        })
+        }
+        if drive is None:
+            def replace(status):
+                # Stand der Sync-Warteschlange bleibt erhalten
+                kept = {key: status[key] for key in ('sync',) if key in status}
+                status.clear()
+                status.update(empty)
+                status.update(kept)
+            self._update_status(replace)
+            return
+        
+        def modify(status):
+            drives = status.setdefault('drives', {})
+            drives.setdefault(drive, {}).update(empty)
+            if status.get('focus_drive') in (None, drive):
+                # Fokus an ein anderes aktives Laufwerk abgeben
+                active = [key for key, entry in drives.items() if entry.get('processing')]
+                self._focus(status, active[0] if active else None)
+                if not active:
+                    status.update(empty)
+        self._update_status(modify)
     
     def reset(self):
         """Alias für clear() - für Abwärtskompatibilität"""
         self.clear()
     
-    def save_cover(self, cover_data: bytes, output_dir: str = "/tmp"):
-        """Speichert Cover-Datei"""
+    def save_cover(self, cover_data: bytes, output_dir: str = "/tmp", drive: Optional[str] = None):
+        """Speichert Cover-Datei (pro Laufwerk eine eigene Datei)"""
         try:
-            cover_path = Path(output_dir) / "current-cover.jpg"
-            with open(cover_path, 'wb') as f:
+            name = f"current-cover-{drive}.jpg" if drive else "current-cover.jpg"
+            cover_path = Path(output_dir) / name
+            tmp_path = cover_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
                 f.write(cover_data)
+            os.replace(tmp_path, cover_path)
             return str(cover_path)
         except Exception as e:
             print(f"Fehler beim Cover-Speichern: {e}")
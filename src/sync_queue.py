@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Sync Queue Module
+Persistente Warteschlange für Server-Syncs mit Hintergrund-Worker
+und Wiederholungen mit exponentiellem Backoff
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Callable, List, Dict, Any
+
+
+@dataclass
+class SyncTask:
+    """Ein ausstehender Sync-Auftrag (eine Datei pro Auftrag im Queue-Verzeichnis)"""
+    task_id: str
+    local_path: str
+    category: int
+    label: str = ""
+    created_at: float = 0.0
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    last_error: Optional[str] = None
+    local_root: Optional[str] = None
+    disc_id: Optional[str] = None           # Für Journal und Disc-Index nach dem Sync
+
+
+def load_tasks(queue_dir: Path) -> List[SyncTask]:
+    """
+    Liest alle Aufträge aus dem Queue-Verzeichnis (auch aus anderen Prozessen)
+
+    Args:
+        queue_dir: Verzeichnis der Warteschlange
+
+    Returns:
+        Aufträge, älteste zuerst
+    """
+    tasks = []
+    for path in Path(queue_dir).glob('*.json'):
+        try:
+            with open(path) as f:
+                tasks.append(SyncTask(**json.load(f)))
+        except (OSError, ValueError, TypeError):
+            continue
+    tasks.sort(key=lambda t: t.created_at)
+    return tasks
+
+
+class SyncQueue:
+    """
+    Arbeitet Sync-Aufträge im Hintergrund ab
+
+    Aufträge werden vor dem Auswerfen der CD auf Disk geschrieben und
+    überleben damit Neustarts. Fehlgeschlagene Syncs werden mit
+    exponentiellem Backoff wiederholt, bis sie erfolgreich sind.
+    """
+
+    def __init__(self, queue_dir: str, sync_func: Callable[..., bool],
+                 base_delay: float = 30, max_delay: float = 3600,
+                 on_change: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 on_done: Optional[Callable[[SyncTask, bool], None]] = None):
+        """
+        Initialisiert die Warteschlange
+
+        Args:
+            queue_dir: Verzeichnis für die Auftragsdateien
+            sync_func: Sync-Funktion (local_path, category, progress_callback=...,
+                       detail_callback=..., local_root=...) -> bool
+            base_delay: Wartezeit nach dem ersten Fehlschlag in Sekunden
+            max_delay: Maximale Wartezeit zwischen Versuchen
+            on_change: Optional Callback mit Zusammenfassung bei jeder Änderung
+            on_done: Optional Callback (Auftrag, erfolgreich) nach jedem Versuch
+        """
+        self.queue_dir = Path(queue_dir)
+        self.sync_func = sync_func
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_change = on_change
+        self.on_done = on_done
+        self.logger = logging.getLogger('cd_ripper.sync_queue')
+
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+
+        self._condition = threading.Condition()
+        self._tasks: Dict[str, SyncTask] = {t.task_id: t for t in load_tasks(self.queue_dir)}
+        self._active: Optional[str] = None
+        self._progress = 0
+        self._transfer: Optional[Dict[str, Any]] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        if self._tasks:
+            self.logger.info(f"{len(self._tasks)} ausstehende Sync-Aufträge aus Warteschlange geladen")
+
+    def _task_path(self, task_id: str) -> Path:
+        return self.queue_dir / f"{task_id}.json"
+
+    def _save(self, task: SyncTask):
+        """Schreibt einen Auftrag atomar"""
+        path = self._task_path(task.task_id)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(asdict(task), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def enqueue(self, local_path: str, category: int, label: str = "",
+                local_root: Optional[str] = None, disc_id: Optional[str] = None) -> SyncTask:
+        """
+        Fügt einen Sync-Auftrag hinzu (sofort persistent)
+
+        Args:
+            local_path: Lokaler Pfad, der synchronisiert werden soll
+            category: Kategorie für Remote-Pfad-Auswahl
+            label: Anzeigename (z.B. "Artist - Album")
+            local_root: Optional Basisverzeichnis für den Album-Sync (siehe sync_directory)
+            disc_id: Optional Disc-ID, wird an on_done durchgereicht
+
+        Returns:
+            Der neue Auftrag
+        """
+        now = time.time()
+        task = SyncTask(
+            task_id=f"{int(now * 1000)}-{uuid.uuid4().hex[:8]}",
+            local_path=str(local_path),
+            category=category,
+            label=label,
+            created_at=now,
+            next_attempt_at=now,
+            local_root=str(local_root) if local_root else None,
+            disc_id=disc_id
+        )
+
+        with self._condition:
+            self._save(task)
+            self._tasks[task.task_id] = task
+            self._condition.notify_all()
+
+        self.logger.info(f"Sync in Warteschlange: {label or local_path} ({len(self._tasks)} ausstehend)")
+        self._notify()
+        return task
+
+    def start(self):
+        """Startet den Worker-Thread"""
+        if self._thread:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True, name="SyncQueue")
+        self._thread.start()
+        self._notify()
+
+    def stop(self, timeout: float = 5):
+        """
+        Stoppt den Worker (laufende Aufträge bleiben in der Warteschlange)
+
+        Args:
+            timeout: Maximale Wartezeit auf den Worker
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Zusammenfassung für Status und Web-API
+
+        Returns:
+            Dictionary mit pending, active, progress, transfer (Bytes, Rate, Restzeit) und Aufträgen
+        """
+        with self._condition:
+            tasks = sorted(self._tasks.values(), key=lambda t: t.created_at)
+            active = self._tasks.get(self._active) if self._active else None
+            return {
+                'pending': len(tasks),
+                'active': (active.label or active.local_path) if active else None,
+                'progress': self._progress if active else 0,
+                'transfer': self._transfer if active else None,
+                'last_error': next((t.last_error for t in reversed(tasks) if t.last_error), None),
+                'tasks': [asdict(t) for t in tasks]
+            }
+
+    def _notify(self):
+        """Meldet den aktuellen Stand an on_change"""
+        if not self.on_change:
+            return
+        try:
+            self.on_change(self.summary())
+        except Exception as e:
+            self.logger.debug(f"Sync-Status konnte nicht gemeldet werden: {e}")
+
+    def _next_due(self) -> Optional[SyncTask]:
+        """Ältester fälliger Auftrag (unter Lock aufrufen)"""
+        now = time.time()
+        due = [t for t in self._tasks.values() if t.next_attempt_at <= now]
+        return min(due, key=lambda t: t.created_at) if due else None
+
+    def _worker(self):
+        """Arbeitet fällige Aufträge nacheinander ab"""
+        while True:
+            with self._condition:
+                task = None
+                while self._running:
+                    task = self._next_due()
+                    if task:
+                        break
+                    # Bis zum nächsten fälligen Auftrag oder einem neuen Auftrag warten
+                    wait = min((t.next_attempt_at for t in self._tasks.values()), default=None)
+                    self._condition.wait(None if wait is None else max(0.1, wait - time.time()))
+
+                if not self._running:
+                    return
+                self._active = task.task_id
+                self._progress = 0
+                self._transfer = None
+
+            self._run_task(task)
+
+    def _run_task(self, task: SyncTask):
+        """Führt einen Auftrag aus und plant bei Fehlschlag die Wiederholung"""
+        self.logger.info(f"Starte Sync: {task.label or task.local_path} (Versuch {task.attempts + 1})")
+        self._notify()
+
+        last_reported = [0]
+
+        def progress_callback(progress):
+            self._progress = progress
+            if progress - last_reported[0] >= 5 or progress == 100:
+                last_reported[0] = progress
+                self._notify()
+
+        def detail_callback(transfer):
+            # Wird vor progress_callback aufgerufen, die Meldung übernimmt progress_callback
+            self._transfer = {
+                'bytes': transfer.bytes_transferred,
+                'rate': transfer.rate,
+                'eta': transfer.eta_seconds
+            }
+
+        synced = False
+        try:
+            if not Path(task.local_path).exists():
+                self.logger.warning(f"Lokaler Pfad existiert nicht mehr, verwerfe Auftrag: {task.local_path}")
+                success = True
+            else:
+                kwargs = {'local_root': task.local_root} if task.local_root else {}
+                success = self.sync_func(task.local_path, task.category,
+                                         progress_callback=progress_callback,
+                                         detail_callback=detail_callback, **kwargs)
+                synced = success
+            error = None if success else "Sync fehlgeschlagen"
+        except Exception as e:
+            self.logger.error(f"Fehler beim Sync: {e}", exc_info=True)
+            success = False
+            error = str(e)
+
+        with self._condition:
+            self._active = None
+            if success:
+                self._tasks.pop(task.task_id, None)
+                try:
+                    self._task_path(task.task_id).unlink()
+                except FileNotFoundError:
+                    pass
+            else:
+                task.attempts += 1
+                delay = min(self.max_delay, self.base_delay * (2 ** (task.attempts - 1)))
+                task.next_attempt_at = time.time() + delay
+                task.last_error = error
+                self._save(task)
+
+        if success:
+            self.logger.info(f"✓ Sync abgeschlossen: {task.label or task.local_path}")
+        else:
+            self.logger.warning(f"✗ Sync fehlgeschlagen: {task.label or task.local_path}, "
+                                f"neuer Versuch in {int(delay)}s")
+        self._notify()
+
+        if self.on_done:
+            try:
+                self.on_done(task, synced)
+            except Exception as e:
+                self.logger.error(f"Fehler nach dem Sync: {e}", exc_info=True)
@@ -5,10 +5,58 @@ Synchronisiert gerippte Audio-Dateien mit Remote-Server via rsync
 """
 
 import logging
+import os
+import select
+import shutil
 import subprocess
 import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
+
+from transfer_tuning import TransferTuner, LinkProfile
+from utils import get_state_dir
+
+
+# Gemeinsame SSH-Optionen (ohne Multiplexing und Cipher)
+_SSH_BASE_OPTIONS = [
+    '-o', 'StrictHostKeyChecking=no',
+    '-o', 'UserKnownHostsFile=/dev/null',
+    '-o', 'LogLevel=ERROR',
+]
+
+# "12,345,678  45%  1.23MB/s    0:00:12" (mit -h: "12.35M  45%  1.23MB/s  0:00:12")
+_PROGRESS2_RE = re.compile(
+    r'^\s*(?P<bytes>[\d.,]+[kKMGT]?)\s+(?P<percent>\d+)%\s+'
+    r'(?P<rate>[\d.,]+[kKMGT]?)B/s\s+(?P<eta>\d+:\d{2}:\d{2})?'
+)
+
+# rsync -h: Einheiten zur Basis 1000
+_SIZE_UNITS = {'K': 1000, 'M': 1000 ** 2, 'G': 1000 ** 3, 'T': 1000 ** 4}
+
+
+def _parse_size(text: str) -> int:
+    """Wandelt rsync-Größenangaben ("1,234,567", "12.35M", "1.23k") in Bytes um"""
+    text = text.replace(',', '')
+    factor = _SIZE_UNITS.get(text[-1:].upper(), 1)
+    if factor != 1:
+        text = text[:-1]
+    try:
+        return int(float(text) * factor)
+    except ValueError:
+        return 0
+
+
+@dataclass
+class TransferProgress:
+    """Fortschritt einer laufenden rsync-Übertragung"""
+    percent: int
+    bytes_transferred: int
+    rate: int                           # Bytes pro Sekunde
+    eta_seconds: Optional[int] = None
 
 
 class ServerSyncer:
@@ -34,6 +82,38 @@ class ServerSyncer:
         self.method = sync_config.get('method', 'rsync')
         self.compression = sync_config.get('compression', True)
         self.delete_after_sync = sync_config.get('cleanup', sync_config.get('cleanup_temp', True))
+        # album: nur das neue Album übertragen/löschen, artist: kompletter Artist-Ordner
+        self.scope = sync_config.get('scope', 'album')
+        
+        # SSH-Multiplexing: eine authentifizierte Master-Verbindung für mkdir, rsync usw.
+        self.multiplex = sync_config.get('multiplex', True)
+        self.control_persist = sync_config.get('control_persist', 600)
+        self._control_dir: Optional[str] = None
+        self._master_lock = threading.Lock()
+        
+        # rsync-Timeout: Grundzeit + Datenmenge / Mindestrate, Progress-Drosselung
+        self.timeout_base = sync_config.get('timeout_base', 60)
+        self.min_rate_kbps = max(1, sync_config.get('min_rate_kbps', 200))
+        self.progress_interval = sync_config.get('progress_interval', 0.5)
+        
+        # Transfer-Tuning: Kompression nach Dateityp, Cipher nach Messung pro Ziel
+        self.tuning = sync_config.get('tuning', 'auto')
+        self.cipher = sync_config.get('cipher', 'auto')
+        self.tuning_sample_mb = sync_config.get('tuning_sample_mb', 8)
+        self.tuning_retry = sync_config.get('tuning_retry', 300)
+        self._link_profile: Optional[LinkProfile] = None
+        self._tune_failed_at: Optional[float] = None
+        self._tune_lock = threading.Lock()
+        self._tuner: Optional[TransferTuner] = None
+        if self.tuning == 'auto':
+            self._tuner = TransferTuner(
+                str(get_state_dir(config) / 'transfer_tuning.json'),
+                ttl_seconds=sync_config.get('tuning_ttl_days', 7) * 24 * 3600
+            )
+        
+        # Streaming-Sync: einzelne Tracks direkt nach dem Taggen hochladen
+        self.streaming = sync_config.get('streaming', False)
+        self._remote_dirs_ready = set()
         
         # Remote-Pfade pro Kategorie aus Config
         remote_paths_config = sync_config.get('remote_paths', {})
@@ -64,15 +144,219 @@ class ServerSyncer:
         """
         return self.remote_paths.get(category, self.remote_paths[3])
     
+    @property
+    def remote_host(self) -> str:
+        """SSH-Ziel user@host"""
+        return f"{self.user}@{self.server}"
+    
+    def _control_path(self) -> str:
+        """Pfad des Control-Sockets (privates Verzeichnis, %C = Hash der Verbindung)"""
+        if not self._control_dir:
+            self._control_dir = tempfile.mkdtemp(prefix='cd-ripper-ssh-')
+        return f"{self._control_dir}/%C"
+    
+    def _ssh_options(self) -> List[str]:
+        """
+        Gemeinsame SSH-Optionen für ssh und rsync
+        
+        Returns:
+            Liste von Kommandozeilen-Argumenten
+        """
+        options = list(_SSH_BASE_OPTIONS)
+        cipher = self._selected_cipher()
+        if cipher:
+            # Bei Multiplexing gilt der Cipher der Master-Verbindung
+            options.extend(['-c', cipher])
+        if self.multiplex:
+            options.extend([
+                '-o', 'ControlMaster=auto',
+                '-o', f'ControlPath={self._control_path()}',
+                '-o', f'ControlPersist={self.control_persist}',
+            ])
+        return options
+    
+    def _selected_cipher(self) -> Optional[str]:
+        """Konfigurierter oder gemessener SSH-Cipher (None = SSH-Standard)"""
+        if self.cipher and self.cipher != 'auto':
+            return self.cipher
+        if self._link_profile:
+            return self._link_profile.cipher
+        return None
+    
+    def _tune(self):
+        """
+        Lädt das Tuning-Ergebnis für das Ziel oder misst es einmalig
+        
+        Muss vor dem Aufbau der Master-Verbindung laufen, da deren
+        Cipher für alle gemultiplexten Sitzungen gilt. Nach einer
+        fehlgeschlagenen Messung (z.B. Server nicht erreichbar) wird
+        erst nach tuning_retry Sekunden erneut gemessen.
+        """
+        if not self._tuner or self._link_profile:
+            return
+        
+        with self._tune_lock:
+            if self._link_profile:
+                return
+            if self._tune_failed_at is not None and time.monotonic() - self._tune_failed_at < self.tuning_retry:
+                return
+            
+            profile = self._tuner.cached_profile(self.remote_host)
+            if profile is None:
+                ciphers = [self.cipher] if self.cipher and self.cipher != 'auto' else None
+                profile = self._tuner.benchmark(self.remote_host, self._measure_link, ciphers)
+            if profile is None:
+                self._tune_failed_at = time.monotonic()
+                self.logger.debug(f"Transfer-Tuning: nächster Versuch in {self.tuning_retry} s")
+                return
+            self._link_profile = profile
+            self._tune_failed_at = None
+    
+    def _measure_link(self, cipher: str) -> Optional[float]:
+        """
+        Misst den Durchsatz zum Server mit einem Cipher (eigene Verbindung)
+        
+        Zwei Übertragungen unterschiedlicher Größe, die Differenz
+        rechnet Verbindungsaufbau und Authentifizierung heraus.
+        
+        Args:
+            cipher: SSH-Cipher
+            
+        Returns:
+            Bytes/s oder None, wenn der Cipher nicht nutzbar ist
+        """
+        size = int(self.tuning_sample_mb * 1024 * 1024)
+        small = 64 * 1024
+        data = os.urandom(size)
+        cmd = self._with_password(
+            ['ssh', '-o', 'ControlPath=none', '-o', 'ConnectTimeout=10', '-c', cipher]
+            + _SSH_BASE_OPTIONS + [self.remote_host, 'cat > /dev/null']
+        )
+        
+        timings = []
+        for payload in (data[:small], data):
+            start = time.monotonic()
+            try:
+                result = subprocess.run(cmd, input=payload, capture_output=True, timeout=120)
+            except (subprocess.TimeoutExpired, OSError):
+                return None
+            if result.returncode != 0:
+                return None
+            timings.append(time.monotonic() - start)
+        
+        elapsed = timings[1] - timings[0]
+        if elapsed <= 0:
+            return None
+        return (size - small) / elapsed
+    
+    def _with_password(self, cmd: List[str]) -> List[str]:
+        """Stellt sshpass voran, falls ein Passwort konfiguriert ist"""
+        if self.password:
+            return ['sshpass', '-p', self.password] + cmd
+        return cmd
+    
+    def _master_alive(self) -> bool:
+        """Health-Check der Master-Verbindung (ssh -O check)"""
+        try:
+            result = subprocess.run(
+                ['ssh', '-o', f'ControlPath={self._control_path()}', '-O', 'check', self.remote_host],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+    
+    def ensure_connection(self) -> bool:
+        """
+        Stellt sicher, dass eine Master-Verbindung besteht (Aufbau bei Bedarf)
+        
+        Returns:
+            True wenn die Master-Verbindung bereit ist (oder Multiplexing aus ist)
+        """
+        self._tune()
+        
+        if not self.multiplex:
+            return True
+        
+        with self._master_lock:
+            if self._master_alive():
+                return True
+            
+            self.logger.debug(f"Baue SSH-Master-Verbindung zu {self.remote_host} auf")
+            cmd = self._with_password(
+                ['ssh', '-M', '-N', '-f', '-o', 'ConnectTimeout=15'] + self._ssh_options() + [self.remote_host]
+            )
+            
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Timeout beim Aufbau der SSH-Master-Verbindung")
+                return False
+            except FileNotFoundError as e:
+                self.logger.error(f"SSH-Master-Verbindung nicht möglich: {e}")
+                return False
+            
+            if result.returncode != 0:
+                self.logger.warning(f"SSH-Master-Verbindung fehlgeschlagen: {result.stderr.strip()}")
+                return False
+            
+            self.logger.info(f"✓ SSH-Master-Verbindung zu {self.remote_host} aufgebaut")
+            return True
+    
+    def run_remote(self, command: str, timeout: int = 30) -> subprocess.CompletedProcess:
+        """
+        Führt ein Kommando auf dem Server aus (über die Master-Verbindung)
+        
+        Args:
+            command: Shell-Kommando auf dem Server
+            timeout: Timeout in Sekunden
+            
+        Returns:
+            CompletedProcess (Text-Modus)
+        """
+        self.ensure_connection()
+        cmd = self._with_password(['ssh'] + self._ssh_options() + [self.remote_host, command])
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    
+    def close(self):
+        """Beendet die Master-Verbindung und entfernt den Control-Socket"""
+        if not self._control_dir:
+            return
+        
+        with self._master_lock:
+            try:
+                subprocess.run(
+                    ['ssh', '-o', f'ControlPath={self._control_path()}', '-O', 'exit', self.remote_host],
+                    capture_output=True,
+                    timeout=10
+                )
+            except Exception:
+                pass
+            
+            shutil.rmtree(self._control_dir, ignore_errors=True)
+            self._control_dir = None
+            self.logger.debug("SSH-Master-Verbindung geschlossen")
+    
     def sync_directory(self, local_path: str, category: int,
-                       progress_callback: Optional[Callable[[int], None]] = None) -> bool:
+                       progress_callback: Optional[Callable[[int], None]] = None,
+                       local_root: Optional[str] = None,
+                       detail_callback: Optional[Callable[[TransferProgress], None]] = None) -> bool:
         """
         Synchronisiert lokales Verzeichnis mit Remote-Server
         
+        Ohne local_root wird das Verzeichnis selbst unter dem Remote-Pfad
+        abgelegt. Mit local_root werden genau die Dateien dieses Verzeichnisses
+        mit ihrem Pfad relativ zu local_root übertragen (rsync --files-from)
+        und nach dem Sync nur dieses Verzeichnis gelöscht.
+        
         Args:
             local_path: Lokaler Pfad zum Verzeichnis
             category: Kategorie für Remote-Pfad-Auswahl
             progress_callback: Optional callback für Progress-Updates (0-100)
+            local_root: Optional lokales Verzeichnis, das dem Remote-Pfad entspricht
+            detail_callback: Optional callback mit Bytes, Rate und Restzeit
             
         Returns:
             True bei Erfolg, False bei Fehler
@@ -87,6 +371,21 @@ class ServerSyncer:
             self.logger.error(f"Pfad ist kein Verzeichnis: {local_path}")
             return False
         
+        files = None
+        if local_root:
+            try:
+                files = sorted(
+                    str(path.relative_to(local_root))
+                    for path in local_dir.rglob('*') if path.is_file()
+                )
+            except ValueError:
+                self.logger.error(f"{local_path} liegt nicht unter {local_root}")
+                return False
+            
+            if not files:
+                self.logger.warning(f"Keine Dateien zum Synchronisieren in {local_path}")
+                return True
+        
         # Remote-Pfad ermitteln
         remote_path = self.get_remote_path(category)
         remote_target = f"{self.user}@{self.server}:{remote_path}/"
@@ -95,12 +394,20 @@ class ServerSyncer:
         
         # rsync-Befehl zusammenbauen
         if self.method == 'rsync':
-            success = self._sync_with_rsync(str(local_dir), remote_target, progress_callback)
+            if files is not None:
+                success = self._sync_with_rsync(local_root, remote_target, progress_callback,
+                                                files=files, detail_callback=detail_callback)
+            else:
+                success = self._sync_with_rsync(str(local_dir), remote_target, progress_callback,
+                                                detail_callback=detail_callback)
             
             # Lokale Dateien nach erfolgreichem Sync löschen
             if success and self.delete_after_sync:
                 self.logger.info("Sync erfolgreich, lösche lokale Dateien...")
-                cleanup_success = self.cleanup_local(str(local_dir))
+                if files is not None:
+                    cleanup_success = self.cleanup_album(str(local_dir), local_root)
+                else:
+                    cleanup_success = self.cleanup_local(str(local_dir))
                 if not cleanup_success:
                     self.logger.warning("Cleanup fehlgeschlagen, aber Sync war erfolgreich")
             
@@ -109,6 +416,102 @@ class ServerSyncer:
             self.logger.error(f"Unbekannte Sync-Methode: {self.method}")
             return False
     
+    def sync_file(self, local_file: str, local_root: str, category: int) -> bool:
+        """
+        Überträgt eine einzelne fertige Datei sofort (Streaming-Sync)
+        
+        Der Pfad relativ zu local_root bleibt auf dem Server erhalten
+        (rsync -R), die Datei landet also dort, wo sie auch der spätere
+        Abgleich per sync_directory ablegt. Lokal wird nichts gelöscht.
+        
+        Args:
+            local_file: Lokale Datei (z.B. fertig getaggter Track)
+            local_root: Lokales Verzeichnis, das dem Remote-Pfad entspricht
+            category: Kategorie für Remote-Pfad-Auswahl
+            
+        Returns:
+            True bei Erfolg
+        """
+        file_path = Path(local_file)
+        try:
+            relative = file_path.relative_to(local_root)
+        except ValueError:
+            self.logger.error(f"{local_file} liegt nicht unter {local_root}")
+            return False
+        
+        if not file_path.is_file():
+            self.logger.error(f"Lokale Datei nicht gefunden: {local_file}")
+            return False
+        
+        remote_path = self.get_remote_path(category)
+        remote_target = f"{self.remote_host}:{remote_path}/"
+        
+        # Remote-Basisverzeichnis nur einmal pro Kategorie anlegen
+        if category not in self._remote_dirs_ready:
+            if not self._ensure_remote_directory(remote_target):
+                return False
+            self._remote_dirs_ready.add(category)
+        
+        # "root/./Artist/Album/Track" → Zwischenverzeichnisse legt rsync selbst an
+        rsync_cmd = self._rsync_command([file_path]) + ['-R', f"{local_root}/./{relative}", remote_target]
+        self.logger.debug(f"rsync Befehl: {self._mask_password(rsync_cmd)}")
+        
+        try:
+            result = subprocess.run(rsync_cmd, capture_output=True, text=True, timeout=120)
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Timeout beim Upload von {relative}")
+            return False
+        except Exception as e:
+            self.logger.warning(f"Upload von {relative} fehlgeschlagen: {e}")
+            return False
+        
+        if result.returncode != 0:
+            self.logger.warning(f"Upload von {relative} fehlgeschlagen (Code {result.returncode}): "
+                                f"{result.stderr.strip()}")
+            return False
+        
+        self.logger.info(f"✓ Hochgeladen: {relative}")
+        return True
+    
+    def _rsync_command(self, paths: Optional[List[Path]] = None) -> List[str]:
+        """
+        Basis-Kommando für rsync (sshpass, SSH-Optionen, Kompression)
+        
+        Args:
+            paths: Optional zu übertragende Dateien (für das Transfer-Tuning)
+            
+        Returns:
+            Liste von Kommandozeilen-Argumenten ohne Quelle und Ziel
+        """
+        rsync_cmd = []
+        
+        # sshpass für Passwort-Auth verwenden, falls Passwort gesetzt
+        if self.password:
+            rsync_cmd.extend(['sshpass', '-p', self.password])
+        
+        rsync_cmd.extend(['rsync', '-avh'])  # archive, verbose, human-readable
+        
+        # SSH-Optionen für rsync (wichtig für sshpass, Master-Verbindung wiederverwenden)
+        ssh_opts = ' '.join(['ssh'] + self._ssh_options())
+        rsync_cmd.extend(['-e', ssh_opts])
+        
+        if self.compression:
+            if self._tuner and paths is not None:
+                # Kein -z für FLAC/MP3/JPEG, sonst nur wenn es schneller ist als die Leitung
+                rsync_cmd.extend(self._tuner.compression_args(paths, self._link_profile))
+            else:
+                rsync_cmd.append('-z')  # compression
+        
+        return rsync_cmd
+    
+    def _mask_password(self, cmd: List[str]) -> str:
+        """Kommandozeile für das Log, Passwort maskiert"""
+        log_cmd = cmd.copy()
+        if self.password and 'sshpass' in log_cmd:
+            pwd_idx = log_cmd.index('-p') + 1
+            log_cmd[pwd_idx] = '***'
+        return ' '.join(log_cmd)
+    
     def _ensure_remote_directory(self, remote_target: str) -> bool:
         """
         Stellt sicher, dass das Remote-Verzeichnis existiert
@@ -130,28 +533,9 @@ class ServerSyncer:
         
         self.logger.debug(f"Erstelle Remote-Verzeichnis: {remote_path} auf {remote_host}")
         
-        # SSH-Kommando zum Erstellen des Verzeichnisses
-        ssh_cmd = []
-        
-        if self.password:
-            ssh_cmd.extend(['sshpass', '-p', self.password])
-        
-        ssh_cmd.extend([
-            'ssh',
-            '-o', 'StrictHostKeyChecking=no',
-            '-o', 'UserKnownHostsFile=/dev/null',
-            '-o', 'LogLevel=ERROR',
-            remote_host,
-            f'mkdir -p "{remote_path}"'
-        ])
-        
         try:
-            result = subprocess.run(
-                ssh_cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # SSH-Kommando zum Erstellen des Verzeichnisses (über die Master-Verbindung)
+            result = self.run_remote(f'mkdir -p "{remote_path}"', timeout=30)
             
             if result.returncode == 0:
                 self.logger.debug(f"Remote-Verzeichnis bereit: {remote_path}")
@@ -168,7 +552,9 @@ class ServerSyncer:
             return False
     
     def _sync_with_rsync(self, local_path: str, remote_target: str,
-                         progress_callback: Optional[Callable[[int], None]] = None) -> bool:
+                         progress_callback: Optional[Callable[[int], None]] = None,
+                         files: Optional[List[str]] = None,
+                         detail_callback: Optional[Callable[[TransferProgress], None]] = None) -> bool:
         """
         Führt rsync-Sync durch
         
@@ -176,6 +562,8 @@ class ServerSyncer:
             local_path: Lokaler Pfad
             remote_target: Remote-Ziel (user@host:path)
             progress_callback: Optional callback für Progress
+            files: Optional Dateiliste relativ zu local_path (nur diese übertragen)
+            detail_callback: Optional callback mit TransferProgress
             
         Returns:
             True bei Erfolg
@@ -185,21 +573,10 @@ class ServerSyncer:
             self.logger.error("Konnte Remote-Verzeichnis nicht erstellen")
             return False
         
-        # rsync-Optionen
-        rsync_cmd = []
-        
-        # sshpass für Passwort-Auth verwenden, falls Passwort gesetzt
-        if self.password:
-            rsync_cmd.extend(['sshpass', '-p', self.password])
-        
-        rsync_cmd.extend(['rsync', '-avh'])  # archive, verbose, human-readable
-        
-        # SSH-Optionen für rsync (wichtig für sshpass)
-        ssh_opts = 'ssh -o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null -o LogLevel=ERROR'
-        rsync_cmd.extend(['-e', ssh_opts])
+        transfer_paths = self._transfer_paths(local_path, files)
         
-        if self.compression:
-            rsync_cmd.append('-z')  # compression
+        # rsync-Optionen
+        rsync_cmd = self._rsync_command(transfer_paths)
         
         # Progress-Option
         rsync_cmd.append('--info=progress2')  # Gesamt-Progress statt per-File
@@ -210,52 +587,41 @@ class ServerSyncer:
         ])
         
         # Quelle und Ziel
-        # KEIN trailing slash - damit wird der Artist-Ordner selbst übertragen
-        rsync_cmd.append(local_path)
+        if files is not None:
+            # Explizite Dateiliste über stdin, Pfade relativ zur Quelle (impliziert -R)
+            rsync_cmd.append('--files-from=-')
+            rsync_cmd.append(f"{local_path.rstrip('/')}/")
+        else:
+            # KEIN trailing slash - damit wird der Artist-Ordner selbst übertragen
+            rsync_cmd.append(local_path)
         rsync_cmd.append(remote_target)
         
-        # Maskiere Passwort im Log
-        log_cmd = rsync_cmd.copy()
-        if self.password and 'sshpass' in log_cmd:
-            pwd_idx = log_cmd.index('-p') + 1
-            log_cmd[pwd_idx] = '***'
-        self.logger.info(f"rsync Befehl: {' '.join(log_cmd)}")
+        self.logger.info(f"rsync Befehl: {self._mask_password(rsync_cmd)}")
+        
+        # Timeout wächst mit der Datenmenge statt fester 5 Minuten
+        total_bytes = sum(path.stat().st_size for path in transfer_paths if path.exists())
+        timeout = self.timeout_base + total_bytes / (self.min_rate_kbps * 1024)
+        self.logger.debug(f"rsync Timeout: {int(timeout)}s für {total_bytes / (1024 * 1024):.1f} MB")
         
         try:
-            # rsync ausführen
-            result = subprocess.run(
+            returncode = self._run_rsync(
                 rsync_cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 Minuten Timeout
+                '\n'.join(files) + '\n' if files is not None else None,
+                timeout,
+                progress_callback,
+                detail_callback
             )
             
-            # Output loggen
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        self.logger.debug(f"rsync stdout: {line}")
-                        
-                        # Progress parsen
-                        progress = self._parse_rsync_progress(line)
-                        if progress is not None and progress_callback:
-                            progress_callback(progress)
-            
-            if result.stderr:
-                for line in result.stderr.strip().split('\n'):
-                    if line.strip() and not line.startswith('Warning:'):
-                        self.logger.warning(f"rsync stderr: {line}")
-            
             # Return-Code prüfen
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"Sync erfolgreich abgeschlossen")
                 return True
             else:
-                self.logger.error(f"rsync fehlgeschlagen (Code {result.returncode})")
+                self.logger.error(f"rsync fehlgeschlagen (Code {returncode})")
                 return False
                 
         except subprocess.TimeoutExpired:
-            self.logger.error("rsync Timeout nach 5 Minuten")
+            self.logger.error(f"rsync Timeout nach {int(timeout)}s")
             return False
         except FileNotFoundError as e:
             if 'sshpass' in str(e):
@@ -267,6 +633,137 @@ class ServerSyncer:
             self.logger.error(f"Fehler beim Sync: {e}", exc_info=True)
             return False
     
+    def _transfer_paths(self, local_path: str, files: Optional[List[str]] = None) -> List[Path]:
+        """
+        Dateien, die rsync höchstens übertragen muss
+        
+        Args:
+            local_path: Quelle (Verzeichnis bzw. Basis der Dateiliste)
+            files: Optional Dateiliste relativ zu local_path
+            
+        Returns:
+            Liste vorhandener Dateien
+        """
+        base = Path(local_path)
+        paths = (base / name for name in files) if files is not None else base.rglob('*')
+        return [path for path in paths if path.is_file()]
+    
+    def _run_rsync(self, rsync_cmd: List[str], stdin_data: Optional[str], timeout: float,
+                   progress_callback: Optional[Callable[[int], None]] = None,
+                   detail_callback: Optional[Callable[[TransferProgress], None]] = None) -> int:
+        """
+        Führt rsync aus und wertet die Ausgabe während der Übertragung aus
+        
+        --info=progress2 überschreibt seine Zeile mit \\r, daher wird stdout
+        blockweise gelesen und an \\r und \\n getrennt. Callbacks werden auf
+        progress_interval gedrosselt (100% wird immer gemeldet).
+        
+        Args:
+            rsync_cmd: Kommandozeile
+            stdin_data: Optional Daten für stdin (z.B. --files-from=-)
+            timeout: Maximale Laufzeit in Sekunden
+            progress_callback: Optional callback mit Prozent (0-100)
+            detail_callback: Optional callback mit TransferProgress
+            
+        Returns:
+            Return-Code von rsync
+            
+        Raises:
+            subprocess.TimeoutExpired: rsync wurde nach timeout beendet
+        """
+        process = subprocess.Popen(
+            rsync_cmd,
+            stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        
+        # stderr in eigenem Thread lesen, damit keine Pipe volläuft
+        stderr_lines: List[str] = []
+        
+        def read_stderr():
+            for raw in process.stderr:
+                line = raw.decode('utf-8', errors='replace').strip()
+                if line:
+                    stderr_lines.append(line)
+        
+        stderr_thread = threading.Thread(target=read_stderr, daemon=True, name="rsync-stderr")
+        stderr_thread.start()
+        
+        if stdin_data is not None:
+            try:
+                process.stdin.write(stdin_data.encode('utf-8'))
+            except BrokenPipeError:
+                pass
+            finally:
+                process.stdin.close()
+        
+        deadline = time.monotonic() + timeout
+        last_report = 0.0
+        last_percent = -1
+        buffer = b''
+        
+        def handle_line(line: str):
+            nonlocal last_report, last_percent
+            transfer = self._parse_rsync_transfer(line)
+            if transfer is None:
+                self.logger.debug(f"rsync stdout: {line}")
+                return
+            
+            now = time.monotonic()
+            if transfer.percent == last_percent and transfer.percent != 100:
+                return
+            if now - last_report < self.progress_interval and transfer.percent != 100:
+                return
+            last_report = now
+            last_percent = transfer.percent
+            
+            if detail_callback:
+                detail_callback(transfer)
+            if progress_callback:
+                progress_callback(transfer.percent)
+        
+        try:
+            fd = process.stdout.fileno()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(rsync_cmd, timeout)
+                
+                ready, _, _ = select.select([fd], [], [], min(remaining, 1.0))
+                if not ready:
+                    continue
+                
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                
+                buffer += chunk
+                parts = re.split(rb'[\r\n]', buffer)
+                buffer = parts.pop()
+                for part in parts:
+                    line = part.decode('utf-8', errors='replace').strip()
+                    if line:
+                        handle_line(line)
+            
+            if buffer.strip():
+                handle_line(buffer.decode('utf-8', errors='replace').strip())
+            
+            returncode = process.wait(timeout=max(1.0, deadline - time.monotonic()))
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            stderr_thread.join(timeout=5)
+            process.stdout.close()
+        
+        for line in stderr_lines:
+            if not line.startswith('Warning:'):
+                self.logger.warning(f"rsync stderr: {line}")
+        
+        return returncode
+    
     def _parse_rsync_progress(self, line: str) -> Optional[int]:
         """
         Parst Progress aus rsync-Output
@@ -285,6 +782,32 @@ class ServerSyncer:
             return min(100, percent)  # Cap bei 100%
         return None
     
+    def _parse_rsync_transfer(self, line: str) -> Optional[TransferProgress]:
+        """
+        Parst eine --info=progress2 Zeile vollständig
+        
+        Args:
+            line: rsync-Output-Zeile, z.B. "12.58M  45%  1.23MB/s    0:00:12 (xfr#1, to-chk=3/5)"
+            
+        Returns:
+            TransferProgress oder None, wenn die Zeile kein Fortschritt ist
+        """
+        match = _PROGRESS2_RE.match(line)
+        if not match:
+            return None
+        
+        eta = None
+        if match.group('eta'):
+            hours, minutes, seconds = (int(part) for part in match.group('eta').split(':'))
+            eta = hours * 3600 + minutes * 60 + seconds
+        
+        return TransferProgress(
+            percent=min(100, int(match.group('percent'))),
+            bytes_transferred=_parse_size(match.group('bytes')),
+            rate=_parse_size(match.group('rate')),
+            eta_seconds=eta
+        )
+    
     def test_connection(self) -> bool:
         """
         Testet Verbindung zum Remote-Server
@@ -369,6 +892,41 @@ class ServerSyncer:
             return False
 
 
+    def cleanup_album(self, album_path: str, local_root: str) -> bool:
+        """
+        Löscht ein synchronisiertes Album-Verzeichnis und danach leere
+        Elternverzeichnisse bis local_root (andere Alben bleiben unberührt)
+        
+        Args:
+            album_path: Album-Verzeichnis
+            local_root: Obergrenze, wird selbst nie gelöscht
+            
+        Returns:
+            True bei Erfolg
+        """
+        album_dir = Path(album_path)
+        root = Path(local_root)
+        
+        try:
+            if album_dir.exists():
+                shutil.rmtree(album_dir)
+            self.logger.info(f"Lokales Cleanup abgeschlossen: {album_dir.name} gelöscht")
+            
+            parent = album_dir.parent
+            while parent != root and root in parent.parents:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    # Nicht leer - z.B. weiteres Album desselben Artists
+                    break
+                self.logger.debug(f"Leeres Verzeichnis gelöscht: {parent.name}")
+                parent = parent.parent
+            return True
+        except Exception as e:
+            self.logger.error(f"Fehler beim Cleanup: {e}")
+            return False
+
+
 def main():
     """Test-Funktion"""
     import yaml
@@ -5,7 +5,6 @@ Schreibt Metadaten (ID3/FLAC) und Cover-Art in Audio-Dateien
 """
 
 import logging
-import requests
 from pathlib import Path
 from typing import Optional, Dict, Any
 from mutagen.flac import FLAC, Picture
@@ -13,25 +12,60 @@ from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TRCK, APIC
 from mutagen.id3 import ID3NoHeaderError
 
+from cover_cache import CoverCache, detect_image_mime
+from utils import get_state_dir
+
 
 class AudioTagger:
     """
     Schreibt Metadaten und Cover-Art in Audio-Dateien
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cover_cache: Optional[CoverCache] = None):
         """
         Initialisiert den Tagger
         
         Args:
             config: Konfigurations-Dictionary
+            cover_cache: Optional gemeinsamer Cover-Cache (sonst eigener aus Config)
         """
         self.config = config
         self.logger = logging.getLogger('cd_ripper.tagger')
-        self.timeout = config.get('tagger', {}).get('timeout', 10)
+        tagger_config = config.get('tagger', {})
+        self.timeout = tagger_config.get('timeout', 10)
+        
+        if cover_cache is None:
+            cover_cache = CoverCache(
+                str(get_state_dir(config) / 'covers'),
+                max_bytes=tagger_config.get('cover_cache_mb', 50) * 1024 * 1024,
+                timeout=self.timeout
+            )
+        self.cover_cache = cover_cache
+    
+    def _resolve_cover(self, metadata: Dict[str, Any], cover_url: Optional[str],
+                       cover_data: Optional[bytes]) -> Optional[bytes]:
+        """
+        Liefert die Cover-Daten: übergebene Bytes, sonst aus dem Cache
+        (Download nur, wenn das Release noch nicht im Cache ist)
+        
+        Args:
+            metadata: Metadaten (musicbrainz_id als Cache-Schlüssel)
+            cover_url: URL zum Cover-Bild
+            cover_data: Bereits geladene Bilddaten
+            
+        Returns:
+            Bilddaten oder None
+        """
+        if cover_data:
+            return cover_data
+        if not cover_url:
+            return None
+        
+        key = metadata.get('musicbrainz_id') or cover_url
+        return self.cover_cache.fetch(key, cover_url)
         
     def tag_file(self, audio_file: str, metadata: Dict[str, Any], 
-                 cover_url: Optional[str] = None) -> bool:
+                 cover_url: Optional[str] = None, cover_data: Optional[bytes] = None) -> bool:
         """
         Schreibt Metadaten in Audio-Datei
         
@@ -39,6 +73,7 @@ class AudioTagger:
             audio_file: Pfad zur Audio-Datei
             metadata: Dictionary mit Metadaten
             cover_url: URL zum Cover-Bild (optional)
+            cover_data: Bereits geladene Cover-Bilddaten (optional, ohne Netzwerkzugriff)
             
         Returns:
             True bei Erfolg, False bei Fehler
@@ -53,10 +88,12 @@ class AudioTagger:
         ext = file_path.suffix.lower()
         
         try:
+            cover = self._resolve_cover(metadata, cover_url, cover_data)
+            
             if ext == '.flac':
-                return self._tag_flac(str(file_path), metadata, cover_url)
+                return self._tag_flac(str(file_path), metadata, cover)
             elif ext == '.mp3':
-                return self._tag_mp3(str(file_path), metadata, cover_url)
+                return self._tag_mp3(str(file_path), metadata, cover)
             else:
                 self.logger.error(f"Nicht unterstütztes Format: {ext}")
                 return False
@@ -65,14 +102,14 @@ class AudioTagger:
             return False
     
     def _tag_flac(self, file_path: str, metadata: Dict[str, Any], 
-                  cover_url: Optional[str] = None) -> bool:
+                  cover_data: Optional[bytes] = None) -> bool:
         """
         Schreibt Metadaten in FLAC-Datei
         
         Args:
             file_path: Pfad zur FLAC-Datei
             metadata: Metadaten-Dictionary
-            cover_url: URL zum Cover-Bild
+            cover_data: Cover-Bilddaten
             
         Returns:
             True bei Erfolg
@@ -111,8 +148,8 @@ class AudioTagger:
             audio['DISCNUMBER'] = str(metadata['disc_number'])
         
         # Cover-Art hinzufügen
-        if cover_url:
-            self._add_flac_cover(audio, cover_url)
+        if cover_data:
+            self._add_flac_cover(audio, cover_data)
         
         # Speichern
         audio.save()
@@ -120,14 +157,14 @@ class AudioTagger:
         return True
     
     def _tag_mp3(self, file_path: str, metadata: Dict[str, Any], 
-                 cover_url: Optional[str] = None) -> bool:
+                 cover_data: Optional[bytes] = None) -> bool:
         """
         Schreibt Metadaten in MP3-Datei
         
         Args:
             file_path: Pfad zur MP3-Datei
             metadata: Metadaten-Dictionary
-            cover_url: URL zum Cover-Bild
+            cover_data: Cover-Bilddaten
             
         Returns:
             True bei Erfolg
@@ -161,36 +198,32 @@ class AudioTagger:
             audio.tags.add(TRCK(encoding=3, text=track_str))
         
         # Cover-Art hinzufügen
-        if cover_url:
-            self._add_mp3_cover(audio, cover_url)
+        if cover_data:
+            self._add_mp3_cover(audio, cover_data)
         
         # Speichern
         audio.save()
         self.logger.info(f"MP3 erfolgreich getaggt: {file_path}")
         return True
     
-    def _add_flac_cover(self, audio: FLAC, cover_url: str) -> bool:
+    def _add_flac_cover(self, audio: FLAC, cover_data: bytes) -> bool:
         """
         Fügt Cover-Art zu FLAC-Datei hinzu
         
         Args:
             audio: FLAC-Objekt
-            cover_url: URL zum Cover-Bild
+            cover_data: Cover-Bilddaten
             
         Returns:
             True bei Erfolg
         """
         try:
-            self.logger.debug(f"Lade Cover von: {cover_url}")
-            response = requests.get(cover_url, timeout=self.timeout)
-            response.raise_for_status()
-            
             # Picture erstellen
             picture = Picture()
             picture.type = 3  # Cover (front)
-            picture.mime = response.headers.get('Content-Type', 'image/jpeg')
+            picture.mime = detect_image_mime(cover_data)
             picture.desc = 'Cover'
-            picture.data = response.content
+            picture.data = cover_data
             
             # Cover hinzufügen
             audio.clear_pictures()
@@ -200,45 +233,41 @@ class AudioTagger:
             return True
             
         except Exception as e:
-            self.logger.warning(f"Fehler beim Cover-Download: {e}")
+            self.logger.warning(f"Fehler beim Hinzufügen des Covers: {e}")
             return False
     
-    def _add_mp3_cover(self, audio: MP3, cover_url: str) -> bool:
+    def _add_mp3_cover(self, audio: MP3, cover_data: bytes) -> bool:
         """
         Fügt Cover-Art zu MP3-Datei hinzu
         
         Args:
             audio: MP3-Objekt
-            cover_url: URL zum Cover-Bild
+            cover_data: Cover-Bilddaten
             
         Returns:
             True bei Erfolg
         """
         try:
-            self.logger.debug(f"Lade Cover von: {cover_url}")
-            response = requests.get(cover_url, timeout=self.timeout)
-            response.raise_for_status()
-            
             # APIC Frame erstellen
             audio.tags.add(
                 APIC(
                     encoding=3,  # UTF-8
-                    mime=response.headers.get('Content-Type', 'image/jpeg'),
+                    mime=detect_image_mime(cover_data),
                     type=3,  # Cover (front)
                     desc='Cover',
-                    data=response.content
+                    data=cover_data
                 )
             )
             
-            self.logger.info(f"Cover erfolgreich hinzugefügt ({len(response.content)} bytes)")
+            self.logger.info(f"Cover erfolgreich hinzugefügt ({len(cover_data)} bytes)")
             return True
             
         except Exception as e:
-            self.logger.warning(f"Fehler beim Cover-Download: {e}")
+            self.logger.warning(f"Fehler beim Hinzufügen des Covers: {e}")
             return False
     
     def tag_album(self, audio_files: list[str], album_metadata: Dict[str, Any],
-                  cover_url: Optional[str] = None) -> Dict[str, bool]:
+                  cover_url: Optional[str] = None, cover_data: Optional[bytes] = None) -> Dict[str, bool]:
         """
         Tagged mehrere Dateien mit Album-Metadaten
         
@@ -246,12 +275,16 @@ class AudioTagger:
             audio_files: Liste von Audio-Dateien
             album_metadata: Basis-Metadaten (Artist, Album, Date, etc.)
             cover_url: URL zum Cover-Bild
+            cover_data: Bereits geladene Cover-Bilddaten (optional)
             
         Returns:
             Dictionary mit Dateinamen und Erfolgs-Status
         """
         results = {}
         
+        # Cover nur einmal pro Album laden
+        cover_data = self._resolve_cover(album_metadata, cover_url, cover_data)
+        
         for audio_file in audio_files:
             # Track-spezifische Metadaten extrahieren
             # Annahme: Dateiname Format "01 - Title.ext"
@@ -271,7 +304,7 @@ class AudioTagger:
                 track_metadata['title'] = filename
             
             # Taggen
-            success = self.tag_file(audio_file, track_metadata, cover_url)
+            success = self.tag_file(audio_file, track_metadata, cover_data=cover_data)
             results[audio_file] = success
             
             if not success:
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Transfer Tuning Module
+Wählt rsync-Kompression und SSH-Cipher passend zu Dateitypen, CPU und
+Verbindung. Die Messergebnisse werden pro Ziel im State-Verzeichnis gespeichert.
+"""
+
+import json
+import logging
+import os
+import time
+import zlib
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Optional, Callable, List, Dict
+
+
+# Bereits komprimierte Formate - zlib spart hier praktisch nichts
+COMPRESSED_EXTENSIONS = {
+    'flac', 'mp3', 'ogg', 'opus', 'm4a', 'aac', 'wma',
+    'jpg', 'jpeg', 'png', 'gif', 'webp',
+    'zip', 'gz', 'bz2', 'xz', '7z',
+}
+
+# Kandidaten für den SSH-Cipher (AES-GCM ist mit ARMv8-Crypto schneller,
+# ChaCha20 ohne Hardware-AES, z.B. Raspberry Pi 3/4)
+CIPHER_CANDIDATES = [
+    'aes128-gcm@openssh.com',
+    'chacha20-poly1305@openssh.com',
+    'aes128-ctr',
+]
+
+# rsync komprimiert auf Standard-Level 6
+ZLIB_LEVEL = 6
+
+
+@dataclass
+class LinkProfile:
+    """Messergebnis für ein Ziel"""
+    destination: str
+    cipher: Optional[str]
+    link_rate: float                                    # Bytes/s mit dem gewählten Cipher
+    cipher_rates: Dict[str, float] = field(default_factory=dict)
+    zlib_rate: float = 0.0                              # Bytes/s, lokale CPU
+    measured_at: float = 0.0
+
+
+def measure_zlib(sample: bytes, level: int = ZLIB_LEVEL) -> tuple:
+    """
+    Misst zlib-Durchsatz und Kompressionsrate auf einer Stichprobe
+
+    Args:
+        sample: Zu komprimierende Daten
+        level: zlib-Level
+
+    Returns:
+        Tuple (Bytes/s, komprimierte Größe / Originalgröße)
+    """
+    if not sample:
+        return 0.0, 1.0
+
+    start = time.perf_counter()
+    compressed = zlib.compress(sample, level)
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    return len(sample) / elapsed, len(compressed) / len(sample)
+
+
+def read_sample(path: Path, size: int = 256 * 1024) -> bytes:
+    """Liest eine Stichprobe aus der Mitte einer Datei (Header sind untypisch)"""
+    try:
+        with open(path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, file_size // 2 - size // 2))
+            return f.read(size)
+    except OSError:
+        return b''
+
+
+class TransferTuner:
+    """
+    Entscheidet über Kompression und Cipher für einen Transfer
+
+    Kompression lohnt nur, wenn zlib schneller ist als die Leitung und
+    dabei genug einspart: effektiver Durchsatz min(zlib, Leitung / Ratio)
+    muss über dem unkomprimierten Durchsatz liegen.
+    """
+
+    def __init__(self, cache_path: str, ttl_seconds: int = 7 * 24 * 3600):
+        """
+        Initialisiert den Tuner
+
+        Args:
+            cache_path: JSON-Datei mit Messergebnissen pro Ziel
+            ttl_seconds: Gültigkeitsdauer einer Messung
+        """
+        self.cache_path = Path(cache_path)
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger('cd_ripper.transfer_tuning')
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _store(self, profile: LinkProfile):
+        """Speichert ein Messergebnis atomar"""
+        profiles = self._load()
+        profiles[profile.destination] = asdict(profile)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(profiles, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Tuning-Ergebnis konnte nicht gespeichert werden: {e}")
+
+    def cached_profile(self, destination: str) -> Optional[LinkProfile]:
+        """
+        Liefert ein gültiges gespeichertes Messergebnis
+
+        Args:
+            destination: Ziel (user@host)
+
+        Returns:
+            LinkProfile oder None, wenn keins vorhanden bzw. abgelaufen
+        """
+        data = self._load().get(destination)
+        if not data:
+            return None
+        try:
+            profile = LinkProfile(**data)
+        except TypeError:
+            return None
+        if time.time() - profile.measured_at > self.ttl_seconds:
+            return None
+        return profile
+
+    def benchmark(self, destination: str, measure_link: Callable[[str], Optional[float]],
+                  ciphers: Optional[List[str]] = None) -> Optional[LinkProfile]:
+        """
+        Misst Leitung (pro Cipher) und lokale zlib-Geschwindigkeit
+
+        Args:
+            destination: Ziel (user@host)
+            measure_link: Funktion cipher -> Bytes/s (None wenn nicht unterstützt)
+            ciphers: Zu testende Cipher (Default: CIPHER_CANDIDATES)
+
+        Returns:
+            LinkProfile oder None, wenn keine Messung gelang
+        """
+        self.logger.info(f"Messe Verbindung zu {destination} (Transfer-Tuning)...")
+
+        cipher_rates = {}
+        for cipher in ciphers or CIPHER_CANDIDATES:
+            rate = measure_link(cipher)
+            if rate:
+                cipher_rates[cipher] = rate
+                self.logger.info(f"  {cipher}: {rate / (1024 * 1024):.1f} MB/s")
+            else:
+                self.logger.debug(f"  {cipher}: nicht verfügbar")
+
+        if not cipher_rates:
+            self.logger.warning("⚠️ Transfer-Tuning: keine Messung möglich, verwende Standardwerte")
+            return None
+
+        # Referenzwert für die lokale CPU (die Entscheidung misst später am echten Inhalt)
+        zlib_rate, _ = measure_zlib(os.urandom(1024 * 1024))
+
+        cipher = max(cipher_rates, key=cipher_rates.get)
+        profile = LinkProfile(
+            destination=destination,
+            cipher=cipher,
+            link_rate=cipher_rates[cipher],
+            cipher_rates=cipher_rates,
+            zlib_rate=zlib_rate,
+            measured_at=time.time()
+        )
+        self._store(profile)
+
+        self.logger.info(f"✓ Transfer-Tuning: Cipher {cipher}, Leitung {profile.link_rate / (1024 * 1024):.1f} MB/s, "
+                         f"zlib {zlib_rate / (1024 * 1024):.1f} MB/s")
+        return profile
+
+    def compression_args(self, paths: List[Path], profile: Optional[LinkProfile]) -> List[str]:
+        """
+        rsync-Optionen für Kompression passend zu den Dateien
+
+        Args:
+            paths: Zu übertragende Dateien
+            profile: Messergebnis für das Ziel (oder None)
+
+        Returns:
+            [] (keine Kompression) oder ['-z', '--skip-compress=...']
+        """
+        compressible = [p for p in paths if p.suffix.lower().lstrip('.') not in COMPRESSED_EXTENSIONS]
+        if not compressible:
+            self.logger.debug("Nur bereits komprimierte Dateien, übertrage ohne -z")
+            return []
+
+        skip = ['--skip-compress=' + '/'.join(sorted(COMPRESSED_EXTENSIONS))]
+        if profile is None:
+            return ['-z'] + skip
+
+        # Stichprobe aus der größten komprimierbaren Datei
+        largest = max(compressible, key=lambda p: p.stat().st_size if p.exists() else 0)
+        rate, ratio = measure_zlib(read_sample(largest))
+        if not rate:
+            return ['-z'] + skip
+
+        compressed_rate = min(rate, profile.link_rate / max(ratio, 0.01))
+        if compressed_rate > profile.link_rate:
+            self.logger.debug(f"Kompression lohnt sich ({largest.name}: Ratio {ratio:.2f})")
+            return ['-z'] + skip
+
+        self.logger.debug(f"Kompression lohnt sich nicht ({largest.name}: Ratio {ratio:.2f}, "
+                          f"zlib {rate / (1024 * 1024):.1f} MB/s)")
+        return []
@@ -96,6 +96,25 @@ def load_config(config_path: str = "/root/projects/cd-ripper/config/config.yaml"
     return config
 
 
+def get_state_dir(config: Dict[str, Any]) -> Path:
+    """
+    Gibt das Verzeichnis für persistente Zustandsdaten (Caches, Journale) zurück
+    
+    Args:
+        config: Konfigurations-Dictionary
+        
+    Returns:
+        Pfad zum State-Verzeichnis (relative Pfade bezogen auf das Projekt-Root)
+    """
+    state_path = Path(config.get('state', {}).get('path', 'state'))
+    
+    if not state_path.is_absolute():
+        state_path = Path(__file__).parent.parent / state_path
+    
+    state_path.mkdir(parents=True, exist_ok=True)
+    return state_path
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Bereinigt Dateinamen von ungültigen Zeichen
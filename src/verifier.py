@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Verifier Module
+Prüft gerippte Tracks gegen die AccurateRip-Datenbank
+
+CRC32 sowie AccurateRip v1/v2 werden während des Rippens direkt auf dem
+PCM-Stream berechnet (kein zweiter Durchlauf über die Dateien). Die
+Datenbank-Antworten werden lokal zwischengespeichert; alternativ kann ein
+lokales Verzeichnis mit dBAR-Dateien die Datenbank ersetzen (Tests, offline).
+"""
+
+import logging
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+
+import requests
+
+from ripper import TrackSink, CD_SECTOR_BYTES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Am Disc-Anfang und -Ende werden je 5 Sektoren nicht geprüft (Laufwerks-Offsets)
+SKIP_SAMPLES = 5 * 588
+LEAD_IN_SECTORS = 150
+
+ACCURATERIP_URL = "http://www.accuraterip.com/accuraterip"
+
+_MASK32 = 0xFFFFFFFF
+_BLOCK_WORDS = 65536
+
+_DBAR_HEADER = struct.Struct('<BIII')
+_DBAR_TRACK = struct.Struct('<BII')
+
+
+@dataclass
+class TrackChecksums:
+    """Prüfsummen eines Tracks"""
+    crc32: int
+    accuraterip_v1: int
+    accuraterip_v2: int
+    samples: int
+
+
+@dataclass
+class TrackVerification:
+    """Ergebnis des Abgleichs mit der AccurateRip-Datenbank"""
+    track_number: int
+    status: str                 # accurate, mismatch, unknown
+    checksums: TrackChecksums
+    confidence: int = 0
+    version: Optional[int] = None
+
+
+@dataclass
+class AccurateRipIds:
+    """Disc-Kennungen für die AccurateRip-Datenbank"""
+    id1: int
+    id2: int
+    cddb: int
+    track_count: int
+
+    @property
+    def filename(self) -> str:
+        return f"dBAR-{self.track_count:03d}-{self.id1:08x}-{self.id2:08x}-{self.cddb:08x}.bin"
+
+    @property
+    def url(self) -> str:
+        return (f"{ACCURATERIP_URL}/{self.id1 & 0xF:x}/{self.id1 >> 4 & 0xF:x}/"
+                f"{self.id1 >> 8 & 0xF:x}/{self.filename}")
+
+
+def _cddb_id(offsets: List[int], leadout: int) -> int:
+    """freedb-Disc-ID aus Track-Offsets und Lead-Out (jeweils inkl. Lead-In)"""
+    digit_sum = 0
+    for offset in offsets:
+        seconds = offset // 75
+        while seconds:
+            digit_sum += seconds % 10
+            seconds //= 10
+    length = leadout // 75 - offsets[0] // 75
+    return ((digit_sum % 0xFF) << 24) | (length << 8) | len(offsets)
+
+
+def accuraterip_ids(offsets: List[int], leadout: int, freedb_id: Optional[str] = None) -> AccurateRipIds:
+    """
+    Berechnet die AccurateRip-Disc-IDs
+
+    Args:
+        offsets: Start-Sektoren aller Tracks (inkl. 150 Sektoren Lead-In, wie discid)
+        leadout: Lead-Out-Sektor (inkl. Lead-In)
+        freedb_id: Optional freedb-ID von discid (sonst berechnet)
+
+    Returns:
+        AccurateRipIds
+    """
+    id1 = id2 = 0
+    for number, offset in enumerate(offsets, start=1):
+        lba = offset - LEAD_IN_SECTORS
+        id1 += lba
+        id2 += max(lba, 1) * number
+    lba_leadout = leadout - LEAD_IN_SECTORS
+    id1 += lba_leadout
+    id2 += lba_leadout * (len(offsets) + 1)
+
+    cddb = int(freedb_id, 16) if freedb_id else _cddb_id(offsets, leadout)
+    return AccurateRipIds(id1 & _MASK32, id2 & _MASK32, cddb & _MASK32, len(offsets))
+
+
+def parse_dbar(data: bytes) -> List[List[Tuple[int, int]]]:
+    """
+    Zerlegt eine dBAR-Antwort der AccurateRip-Datenbank
+
+    Args:
+        data: Binärdaten (ein Block pro Pressung)
+
+    Returns:
+        Pro Pressung eine Liste (Konfidenz, CRC) pro Track
+    """
+    pressings = []
+    pos = 0
+    while pos + _DBAR_HEADER.size <= len(data):
+        track_count = data[pos]
+        pos += _DBAR_HEADER.size
+        end = pos + track_count * _DBAR_TRACK.size
+        if end > len(data):
+            break
+        tracks = []
+        for _ in range(track_count):
+            confidence, crc, _frame450 = _DBAR_TRACK.unpack_from(data, pos)
+            tracks.append((confidence, crc))
+            pos += _DBAR_TRACK.size
+        pressings.append(tracks)
+    return pressings
+
+
+def build_dbar(ids: AccurateRipIds, pressings: List[List[Tuple[int, int]]]) -> bytes:
+    """
+    Erzeugt eine dBAR-Antwort (z.B. als lokaler Ersatz der Datenbank)
+
+    Args:
+        ids: Disc-IDs
+        pressings: Pro Pressung eine Liste (Konfidenz, CRC) pro Track
+
+    Returns:
+        Binärdaten im Format der AccurateRip-Datenbank
+    """
+    data = bytearray()
+    for tracks in pressings:
+        data += _DBAR_HEADER.pack(len(tracks), ids.id1, ids.id2, ids.cddb)
+        for confidence, crc in tracks:
+            data += _DBAR_TRACK.pack(min(confidence, 255), crc & _MASK32, 0)
+    return bytes(data)
+
+
+class TrackChecksum:
+    """
+    Berechnet CRC32 und AccurateRip v1/v2 schrittweise über den PCM-Stream
+
+    AccurateRip multipliziert jedes Stereo-Sample (32 bit) mit seiner
+    Position (ab 1): v1 summiert die unteren 32 Bit der Produkte,
+    v2 zusätzlich die oberen. Mit NumPy blockweise vektorisiert.
+    """
+
+    def __init__(self, is_first: bool = False, is_last: bool = False):
+        """
+        Args:
+            is_first: Erster Track der Disc (Anfang wird übersprungen)
+            is_last: Letzter Track der Disc (Ende wird übersprungen)
+        """
+        self.is_first = is_first
+        self.is_last = is_last
+        self._crc32 = 0
+        self._v1 = 0
+        self._v2 = 0
+        self._position = 0      # Anzahl bereits verrechneter Samples
+        self._pending = b''     # Unvollständiges Sample bzw. zurückgehaltenes Ende
+
+    def update(self, data: bytes):
+        """Verrechnet den nächsten Block PCM-Daten"""
+        self._crc32 = zlib.crc32(data, self._crc32)
+
+        data = self._pending + bytes(data)
+        usable = len(data) - len(data) % 4
+        if self.is_last:
+            # Die letzten 5 Sektoren erst am Ende kennen - bis dahin zurückhalten
+            usable = max(0, usable - SKIP_SAMPLES * 4)
+        self._pending = data[usable:]
+        if usable:
+            self._accumulate(data[:usable])
+
+    def _accumulate(self, data: bytes):
+        """Verrechnet vollständige Samples ab der aktuellen Position"""
+        count = len(data) // 4
+        start = self._position + 1
+        self._position += count
+
+        # Erster Track: Multiplikatoren unter 5 * 588 - 1 zählen nicht
+        skip = 0
+        if self.is_first and start < SKIP_SAMPLES - 1:
+            skip = min(count, SKIP_SAMPLES - 1 - start)
+        if skip == count:
+            return
+
+        if numpy is not None:
+            words = numpy.frombuffer(data, dtype='<u4')[skip:].astype(numpy.uint64)
+            for offset in range(0, len(words), _BLOCK_WORDS):
+                block = words[offset:offset + _BLOCK_WORDS]
+                first = start + skip + offset
+                products = block * numpy.arange(first, first + len(block), dtype=numpy.uint64)
+                low = int((products & numpy.uint64(_MASK32)).sum(dtype=numpy.uint64))
+                high = int((products >> numpy.uint64(32)).sum(dtype=numpy.uint64))
+                self._v1 = (self._v1 + low) & _MASK32
+                self._v2 = (self._v2 + low + high) & _MASK32
+        else:
+            words = array('I', data[skip * 4:])
+            if words.itemsize != 4:
+                words = array('L', data[skip * 4:])
+            v1 = self._v1
+            v2 = self._v2
+            for multiplier, word in enumerate(words, start=start + skip):
+                product = word * multiplier
+                low = product & _MASK32
+                v1 += low
+                v2 += low + (product >> 32)
+            self._v1 = v1 & _MASK32
+            self._v2 = v2 & _MASK32
+
+    def finalize(self) -> TrackChecksums:
+        """
+        Schließt die Berechnung ab (zurückgehaltenes Ende des letzten Tracks entfällt)
+
+        Returns:
+            TrackChecksums
+        """
+        samples = self._position + len(self._pending) // 4
+        return TrackChecksums(
+            crc32=self._crc32 & _MASK32,
+            accuraterip_v1=self._v1,
+            accuraterip_v2=self._v2,
+            samples=samples
+        )
+
+
+class ChecksumSink(TrackSink):
+    """
+    Reicht PCM-Daten an einen anderen Empfänger weiter und berechnet
+    dabei die Prüfsummen
+    """
+
+    def __init__(self, sink: TrackSink, checksum: TrackChecksum):
+        self.sink = sink
+        self.checksum = checksum
+        self.result: Optional[TrackChecksums] = None
+
+    def write(self, data: bytes) -> None:
+        self.sink.write(data)
+        self.checksum.update(data)
+
+    def close(self, success: bool = True) -> bool:
+        if success:
+            self.result = self.checksum.finalize()
+        return self.sink.close(success=success)
+
+
+class DiscardSink(TrackSink):
+    """Verwirft die PCM-Daten (Verifikation ohne Ausgabe-Datei)"""
+
+    def write(self, data: bytes) -> None:
+        pass
+
+    def close(self, success: bool = True) -> bool:
+        return success
+
+
+def checksum_file(path: str, checksum: TrackChecksum, header_bytes: int = 44) -> TrackChecksums:
+    """
+    Berechnet die Prüfsummen einer WAV-Datei (für den WAV-Modus, in dem
+    cdparanoia selbst in die Datei schreibt)
+
+    Args:
+        path: WAV-Datei
+        checksum: Vorbereitete Berechnung (erster/letzter Track)
+        header_bytes: Größe des WAV-Headers von cdparanoia
+
+    Returns:
+        TrackChecksums
+    """
+    with open(path, 'rb') as f:
+        f.seek(header_bytes)
+        while True:
+            chunk = f.read(64 * CD_SECTOR_BYTES)
+            if not chunk:
+                break
+            checksum.update(chunk)
+    return checksum.finalize()
+
+
+class AccurateRipDatabase:
+    """
+    Zugriff auf die AccurateRip-Datenbank mit lokalem Cache
+
+    Ist local_dir gesetzt, werden die dBAR-Dateien nur dort gesucht
+    (lokaler Ersatz der Datenbank, z.B. für Tests oder ohne Netzwerk).
+    """
+
+    def __init__(self, cache_dir: str, local_dir: Optional[str] = None, timeout: int = 10):
+        """
+        Args:
+            cache_dir: Verzeichnis für zwischengespeicherte Antworten
+            local_dir: Optional Verzeichnis mit dBAR-Dateien statt der Online-Datenbank
+            timeout: Timeout für Datenbank-Abfragen in Sekunden
+        """
+        self.cache_dir = Path(cache_dir)
+        self.local_dir = Path(local_dir) if local_dir else None
+        self.timeout = timeout
+        self.logger = logging.getLogger('cd_ripper.verifier')
+
+    def lookup(self, ids: AccurateRipIds) -> Optional[List[List[Tuple[int, int]]]]:
+        """
+        Liefert die Einträge der Disc
+
+        Args:
+            ids: Disc-IDs
+
+        Returns:
+            Pressungen (siehe parse_dbar), [] wenn die Disc unbekannt ist,
+            None wenn die Datenbank nicht erreichbar ist
+        """
+        if self.local_dir:
+            path = self.local_dir / ids.filename
+            if not path.exists():
+                return []
+            return parse_dbar(path.read_bytes())
+
+        cache_path = self.cache_dir / ids.filename
+        if cache_path.exists():
+            self.logger.debug(f"AccurateRip-Antwort aus Cache: {ids.filename}")
+            return parse_dbar(cache_path.read_bytes())
+
+        try:
+            response = requests.get(ids.url, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.logger.warning(f"⚠️ AccurateRip nicht erreichbar: {e}")
+            return None
+
+        if response.status_code == 404:
+            self.logger.info("Disc ist nicht in der AccurateRip-Datenbank")
+            return []
+        if response.status_code != 200:
+            self.logger.warning(f"⚠️ AccurateRip-Abfrage fehlgeschlagen (HTTP {response.status_code})")
+            return None
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(response.content)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            self.logger.debug(f"AccurateRip-Antwort nicht gespeichert: {e}")
+
+        return parse_dbar(response.content)
+
+
+class DiscVerifier:
+    """
+    Verifiziert die Tracks einer Disc gegen AccurateRip
+    """
+
+    def __init__(self, database: AccurateRipDatabase, ids: Optional[AccurateRipIds],
+                 track_count: int):
+        """
+        Args:
+            database: AccurateRip-Datenbank
+            ids: Disc-IDs (None wenn keine vollständige TOC vorliegt)
+            track_count: Anzahl Tracks der Disc
+        """
+        self.ids = ids
+        self.track_count = track_count
+        self.logger = logging.getLogger('cd_ripper.verifier')
+        self.results: Dict[int, TrackVerification] = {}
+
+        self.pressings = database.lookup(ids) if ids else None
+        if self.pressings:
+            self.logger.info(f"AccurateRip: {len(self.pressings)} Pressung(en) in der Datenbank")
+
+    def checksum(self, track_number: int) -> TrackChecksum:
+        """Neue Prüfsummen-Berechnung für einen Track"""
+        return TrackChecksum(is_first=track_number == 1, is_last=track_number == self.track_count)
+
+    def verify(self, track_number: int, checksums: TrackChecksums) -> TrackVerification:
+        """
+        Gleicht die Prüfsummen eines Tracks mit der Datenbank ab
+
+        Args:
+            track_number: Track-Nummer (1-basiert)
+            checksums: Berechnete Prüfsummen
+
+        Returns:
+            TrackVerification
+        """
+        result = TrackVerification(track_number, 'unknown', checksums)
+
+        entries = [tracks[track_number - 1] for tracks in (self.pressings or [])
+                   if len(tracks) >= track_number]
+        if entries:
+            result.status = 'mismatch'
+            for confidence, crc in entries:
+                version = 2 if crc == checksums.accuraterip_v2 else 1 if crc == checksums.accuraterip_v1 else None
+                if version and confidence >= result.confidence:
+                    result.status = 'accurate'
+                    result.confidence = confidence
+                    result.version = version
+
+        self.results[track_number] = result
+
+        if result.status == 'accurate':
+            self.logger.info(f"✓ Track {track_number}: AccurateRip v{result.version} bestätigt "
+                             f"(Konfidenz {result.confidence}, CRC32 {checksums.crc32:08X})")
+        elif result.status == 'mismatch':
+            self.logger.warning(f"✗ Track {track_number}: AccurateRip stimmt nicht überein "
+                                f"(v1 {checksums.accuraterip_v1:08X}, v2 {checksums.accuraterip_v2:08X})")
+        else:
+            self.logger.info(f"Track {track_number}: nicht in AccurateRip (CRC32 {checksums.crc32:08X})")
+        return result
+
+    def summary(self) -> Dict[str, int]:
+        """Anzahl Tracks pro Status"""
+        counts = {'accurate': 0, 'mismatch': 0, 'unknown': 0}
+        for result in self.results.values():
+            counts[result.status] += 1
+        return counts
@@ -7,6 +7,7 @@ Status-Anzeige und Konfigurations-Editor
 from flask import Flask, render_template, jsonify, request, send_from_directory, send_file
 from flask_cors import CORS
 import yaml
+import json
 import logging
 import os
 from pathlib import Path
@@ -15,8 +16,13 @@ import threading
 import time
 from datetime import datetime
 import io
+from collections import deque
+from dataclasses import asdict
 
 from shared_status import SharedStatus
+from log_tail import tail_lines, read_since
+from sync_queue import load_tasks
+from utils import get_state_dir
 
 app = Flask(__name__, 
             template_folder='../web/templates',
@@ -26,6 +32,10 @@ CORS(app)
 # Shared Status
 shared_status = SharedStatus()
 
+# Zuletzt ausgelieferte /api/status Antwort, gültig solange die Version gleich bleibt
+_status_response_cache = {'version': None, 'body': None}
+_status_response_lock = threading.Lock()
+
 # Globaler Status
 class ServiceStatus:
     def __init__(self):
@@ -98,21 +108,42 @@ def settings():
     return render_template('settings.html')
 
 
-@app.route('/api/status')
-def get_status():
-    """API: Aktueller Service-Status"""
-    status_data = shared_status.get_status()
-    
-    # Kompatibilität mit Frontend herstellen
-    return jsonify({
+def _public_status(status_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Status-Felder für das Frontend (Kompatibilität mit Frontend herstellen)"""
+    return {
         'current_cd': status_data.get('current_cd'),
         'processing': status_data.get('processing', False),
         'current_step': status_data.get('current_step'),
         'progress': status_data.get('progress', 0),
         'current_track': status_data.get('current_track', 0),
         'total_tracks': status_data.get('total_tracks', 0),
-        'last_update': status_data.get('last_update')
-    })
+        'last_update': status_data.get('last_update'),
+        'sync': status_data.get('sync'),
+        'drives': status_data.get('drives'),
+        'focus_drive': status_data.get('focus_drive')
+    }
+
+
+@app.route('/api/status')
+def get_status():
+    """API: Aktueller Service-Status"""
+    # Nur die Version prüfen - geparst wird erst nach einer Änderung
+    version = shared_status.get_version()
+    
+    with _status_response_lock:
+        body = _status_response_cache['body'] if _status_response_cache['version'] == version else None
+    
+    if body is None:
+        version, status_data = shared_status.get_status_with_version()
+        body = json.dumps(_public_status(status_data))
+        
+        with _status_response_lock:
+            _status_response_cache['version'] = version
+            _status_response_cache['body'] = body
+    
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(str(version))
+    return response.make_conditional(request)
 
 
 @app.route('/api/logs')
@@ -124,41 +155,267 @@ def get_logs():
     })
 
 
+def _parse_log_line(line: str) -> Dict[str, str]:
+    """Parst eine Log-Zeile: 2025-11-03 00:15:52 - cd_ripper - INFO - Message"""
+    parts = line.split(' - ', 3)
+    if len(parts) >= 4:
+        return {
+            'timestamp': parts[0].strip(),
+            'logger': parts[1].strip(),
+            'level': parts[2].strip(),
+            'message': parts[3].strip()
+        }
+    return {
+        'timestamp': '',
+        'logger': '',
+        'level': 'INFO',
+        'message': line.strip()
+    }
+
+
+def _read_log_tail(lines: int) -> list:
+    """Liest die letzten Zeilen der Log-Datei (geparst, rückwärts blockweise)"""
+    tail, _ = tail_lines(LOG_FILE, lines)
+    return [_parse_log_line(line) for line in tail]
+
+
 @app.route('/api/logs/tail')
 def get_logs_tail():
-    """API: Letzte Zeilen aus Log-Datei"""
-    lines = request.args.get('lines', 50, type=int)
+    """
+    API: Letzte Zeilen aus Log-Datei
     
-    if not LOG_FILE.exists():
-        return jsonify({'logs': []})
+    Ohne Cursor werden die letzten `lines` Zeilen geliefert, mit Cursor
+    (aus der vorherigen Antwort) nur die seitdem neuen Zeilen.
+    """
+    lines = request.args.get('lines', 50, type=int)
+    cursor = request.args.get('cursor')
     
     try:
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            tail_lines = all_lines[-lines:]
+        new_lines, new_cursor, reset = read_since(LOG_FILE, cursor, lines)
+        return jsonify({
+            'logs': [_parse_log_line(line) for line in new_lines],
+            'cursor': new_cursor,
+            'reset': reset
+        })
+    except Exception as e:
+        return jsonify({'error': str(e), 'logs': []}), 500
+
+
+def _sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Formatiert ein Server-Sent Event"""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class EventHub(threading.Thread):
+    """
+    Beobachtet Status-Version und Log-Datei in einem einzigen Thread und
+    verteilt Änderungen an alle SSE-Clients
+    
+    Jedes Event wird einmal serialisiert und in einem Ringpuffer abgelegt;
+    Clients warten auf einer Condition und lesen nur neue Events. Die Last
+    hängt damit nicht von der Anzahl offener Dashboards ab.
+    """
+    
+    def __init__(self, log_file: Path, interval: float = 0.25, buffer_size: int = 256, log_lines: int = 100):
+        super().__init__(daemon=True, name="EventHub")
+        self.log_file = log_file
+        self.interval = interval
+        self.running = True
+        
+        self._condition = threading.Condition()
+        self._events = deque(maxlen=buffer_size)
+        self._last_id = 0
+        self._start_lock = threading.Lock()
+        self._hub_started = False
+        
+        # Zustand, den neue Clients als Snapshot erhalten
+        self._status_version = None
+        self._status: Dict[str, Any] = {}
+        self._logs = deque(maxlen=log_lines)
+        
+        self._log_handle = None
+        self._log_inode = None
+        self._log_partial = b''
+    
+    def ensure_started(self):
+        """Startet den Thread beim ersten Bedarf"""
+        with self._start_lock:
+            if not self._hub_started:
+                self._hub_started = True
+                self.start()
+    
+    def subscribe(self):
+        """
+        Liefert den aktuellen Snapshot für einen neuen Client
+        
+        Returns:
+            Tuple (letzte Event-ID, Status, Log-Einträge)
+        """
+        with self._condition:
+            return self._last_id, dict(self._status), list(self._logs)
+    
+    def wait(self, after_id: int, timeout: float):
+        """
+        Wartet auf Events nach after_id
+        
+        Returns:
+            Tuple (Liste serialisierter Events, neue letzte ID, Events verpasst)
+        """
+        with self._condition:
+            if self._last_id <= after_id:
+                self._condition.wait(timeout)
             
-            logs = []
-            for line in tail_lines:
-                # Parse Log-Zeile: 2025-11-03 00:15:52 - cd_ripper - INFO - Message
-                parts = line.split(' - ', 3)
-                if len(parts) >= 4:
-                    logs.append({
-                        'timestamp': parts[0].strip(),
-                        'logger': parts[1].strip(),
-                        'level': parts[2].strip(),
-                        'message': parts[3].strip()
-                    })
-                else:
-                    logs.append({
-                        'timestamp': '',
-                        'logger': '',
-                        'level': 'INFO',
-                        'message': line.strip()
-                    })
+            missed = bool(self._events) and self._events[0][0] > after_id + 1
+            events = [text for event_id, text in self._events if event_id > after_id]
+            return events, self._last_id, missed
+    
+    def _publish(self, event: str, data: Any):
+        """Legt ein Event im Ringpuffer ab und weckt alle Clients"""
+        with self._condition:
+            self._last_id += 1
+            self._events.append((self._last_id, _sse(event, data, self._last_id)))
+            self._condition.notify_all()
+    
+    def run(self):
+        """Prüft Status-Version und Log-Datei im festen Intervall"""
+        try:
+            with self._condition:
+                self._logs.extend(_read_log_tail(self._logs.maxlen))
+        except Exception:
+            pass
+        self._open_log(seek_end=True)
+        
+        while self.running:
+            try:
+                self._check_status()
+                self._check_log()
+            except Exception as e:
+                logging.getLogger('cd_ripper.web').debug(f"EventHub Fehler: {e}")
+            time.sleep(self.interval)
+    
+    def _check_status(self):
+        """Sendet geänderte Status-Felder (nur bei neuer Version)"""
+        if shared_status.get_version() == self._status_version:
+            return
+        
+        version, status_data = shared_status.get_status_with_version()
+        current = _public_status(status_data)
+        changes = {key: value for key, value in current.items()
+                   if key not in self._status or self._status[key] != value}
+        
+        with self._condition:
+            self._status_version = version
+            self._status = current
+        
+        if changes:
+            self._publish('status', {'full': False, 'changes': changes})
+    
+    def _open_log(self, seek_end: bool = False):
+        """Öffnet die Log-Datei (neu), z.B. nach Rotation"""
+        if self._log_handle:
+            self._log_handle.close()
+            self._log_handle = None
+        
+        try:
+            self._log_handle = open(self.log_file, 'rb')
+            self._log_inode = os.fstat(self._log_handle.fileno()).st_ino
+            if seek_end:
+                self._log_handle.seek(0, 2)
+            self._log_partial = b''
+        except OSError:
+            self._log_handle = None
+            self._log_inode = None
+    
+    def _check_log(self):
+        """Liest neue Log-Zeilen und sendet sie gebündelt"""
+        if not self._log_handle:
+            self._open_log()
+            if not self._log_handle:
+                return
+        
+        chunk = self._log_handle.read()
+        
+        try:
+            stat = os.stat(self.log_file)
+            rotated = stat.st_ino != self._log_inode or stat.st_size < self._log_handle.tell()
+        except OSError:
+            rotated = False
+        
+        data = self._log_partial + chunk
+        lines = data.split(b'\n')
+        partial = lines.pop()
+        
+        if rotated:
+            # Rest der alten Datei ist gelesen - eine unvollständige letzte Zeile
+            # gehört noch zu ihr, danach mit neuer Datei von vorne beginnen
+            lines.append(partial)
+            self._open_log()
+        else:
+            self._log_partial = partial
+        
+        entries = [_parse_log_line(line.decode('utf-8', errors='replace'))
+                   for line in lines if line.strip()]
+        if not entries:
+            return
+        
+        with self._condition:
+            self._logs.extend(entries)
+        self._publish('logs', {'reset': False, 'entries': entries})
+
+
+event_hub = EventHub(LOG_FILE)
+
+
+@app.route('/api/events')
+def get_events():
+    """API: Server-Sent Events mit Status-Änderungen und neuen Log-Zeilen"""
+    event_hub.ensure_started()
+    
+    def stream():
+        last_id, status_data, logs = event_hub.subscribe()
+        yield "retry: 3000\n\n"
+        yield _sse('status', {'full': True, 'changes': status_data})
+        yield _sse('logs', {'reset': True, 'entries': logs})
+        
+        while True:
+            events, new_id, missed = event_hub.wait(last_id, timeout=15)
+            
+            if missed:
+                # Client war zu langsam - neuer Snapshot statt Lücke
+                last_id, status_data, logs = event_hub.subscribe()
+                yield _sse('status', {'full': True, 'changes': status_data})
+                yield _sse('logs', {'reset': True, 'entries': logs})
+                continue
             
-            return jsonify({'logs': logs})
+            last_id = new_id
+            if events:
+                yield ''.join(events)
+            else:
+                yield ": keepalive\n\n"
+    
+    return app.response_class(
+        stream(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/sync/queue')
+def get_sync_queue():
+    """API: Ausstehende Sync-Aufträge (Hintergrund-Warteschlange)"""
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            config = yaml.safe_load(f) or {}
+        tasks = load_tasks(get_state_dir(config) / 'sync_queue')
+        
+        return jsonify({
+            'pending': len(tasks),
+            'status': shared_status.get_status().get('sync'),
+            'tasks': [asdict(task) for task in tasks]
+        })
     except Exception as e:
-        return jsonify({'error': str(e), 'logs': []}), 500
+        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/config', methods=['GET'])
@@ -206,10 +463,18 @@ def save_config():
 
 @app.route('/api/eject', methods=['POST'])
 def eject_cd():
-    """API: CD manuell auswerfen"""
+    """API: CD manuell auswerfen (optional {"drive": "sr1"} im Multi-Laufwerk-Betrieb)"""
     try:
         from cd_detector import CDDetector
-        detector = CDDetector()
+        drive = (request.get_json(silent=True) or {}).get('drive')
+        if drive:
+            # Nur bekannte Laufwerke - kein beliebiger Device-Pfad von außen
+            entry = (shared_status.get_status().get('drives') or {}).get(drive)
+            if not entry:
+                return jsonify({'error': f'Unbekanntes Laufwerk: {drive}'}), 404
+            detector = CDDetector(device=entry['device'])
+        else:
+            detector = CDDetector()
         success = detector.eject_cd()
         
         if success:
@@ -224,9 +489,13 @@ def eject_cd():
 
 @app.route('/api/cover')
 def get_cover():
-    """API: Aktuelles CD-Cover als Bilddatei"""
+    """API: Aktuelles CD-Cover als Bilddatei (?drive=sr1 für ein bestimmtes Laufwerk)"""
     status_data = shared_status.get_status()
     
+    drive = request.args.get('drive')
+    if drive:
+        status_data = (status_data.get('drives') or {}).get(drive) or {}
+    
     if not status_data.get('current_cd') or not status_data['current_cd'].get('cover_path'):
         return jsonify({'error': 'Kein Cover verfügbar'}), 404
     
@@ -336,6 +605,9 @@ def start_web_interface(host='0.0.0.0', port=5000):
     watcher = LogWatcher(LOG_FILE)
     watcher.start()
     
+    # Event-Hub für Server-Sent Events starten
+    event_hub.ensure_started()
+    
     # Flask-App starten
     app.run(host=host, port=port, debug=False, threaded=True)
 
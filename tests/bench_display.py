@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark für das Display-Rendering
+Misst show_idle, show_cd_with_cover und show_progress pro Frame mit einem
+Headless-Backend (kein Pi / ST7789 nötig)
+
+Aufruf:
+    python3 tests/bench_display.py
+    python3 tests/bench_display.py --backend framebuffer --rotation 90 --frames 500
+    python3 tests/bench_display.py --max-progress-ms 5   # Exit-Code 1 bei Regression
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from PIL import Image, ImageDraw
+
+from display_manager import DisplayManager
+
+
+def make_cover(path: Path, seed: int, size: int = 1000):
+    """Erzeugt ein Test-Cover (JPEG, ähnlich groß wie CoverArtArchive 1000px)"""
+    img = Image.new('RGB', (size, size), color=(seed * 37 % 256, seed * 91 % 256, seed * 53 % 256))
+    draw = ImageDraw.Draw(img)
+    for i in range(0, size, 40):
+        draw.line([(0, i), (size, size - i)], fill=(255 - seed % 256, i % 256, 128), width=6)
+    img.save(path, quality=90)
+
+
+def measure(name, frames, func):
+    """Führt func(i) frames-mal aus und gibt die Zeiten in ms zurück"""
+    timings = []
+    for i in range(frames):
+        start = time.perf_counter()
+        func(i)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{name:<28} mean {statistics.mean(timings):7.2f} ms   "
+          f"median {statistics.median(timings):7.2f} ms   p95 {p95:7.2f} ms")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Display Render-Benchmark")
+    parser.add_argument('--backend', default='null', choices=['null', 'framebuffer', 'png'])
+    parser.add_argument('--rotation', type=int, default=0, choices=[0, 90, 180, 270])
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--no-partial', action='store_true', help="Immer komplette Frames übertragen")
+    parser.add_argument('--max-progress-ms', type=float, default=None,
+                        help="Fehlschlagen, wenn show_progress im Mittel langsamer ist")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        config = {
+            'enabled': True,
+            'backend': args.backend,
+            'rotation': args.rotation,
+            'partial_updates': not args.no_partial,
+            # Synchron messen: Render-Zeit statt Übergabe an den Render-Thread
+            'async_render': False,
+            'png_path': str(tmp / 'display.png'),
+        }
+
+        display = DisplayManager(config)
+        if not display.enabled:
+            print("❌ Display konnte nicht initialisiert werden")
+            return 1
+
+        cover = tmp / 'cover.jpg'
+        make_cover(cover, 1)
+        cold_covers = []
+        for i in range(min(args.frames, 20)):
+            path = tmp / f'cover-{i}.jpg'
+            make_cover(path, i + 2)
+            cold_covers.append(str(path))
+
+        print(f"Backend: {args.backend}, Rotation: {args.rotation}°, "
+              f"Partial Updates: {not args.no_partial}, Frames: {args.frames}")
+        print("-" * 80)
+
+        steps = ['ripping', 'encoding', 'tagging', 'syncing']
+        measure("show_idle", args.frames, lambda i: display.show_idle())
+        measure("show_cd_with_cover (neu)", len(cold_covers),
+                lambda i: display.show_cd_with_cover("Artist", "Album", cold_covers[i]))
+        measure("show_cd_with_cover", args.frames,
+                lambda i: display.show_cd_with_cover("Artist", "Album", str(cover)))
+        progress = measure("show_progress", args.frames,
+                           lambda i: display.show_progress(steps[i * 4 // args.frames], i * 100 // args.frames,
+                                                           i % 12 + 1, 12, str(cover)))
+
+        print("-" * 80)
+        stats = display.display
+        print(f"Übertragen: {stats.frames} Frames, {stats.bytes_written / 1024:.0f} KiB (RGB565)")
+
+        display.cleanup()
+
+        if args.max_progress_ms is not None and statistics.mean(progress) > args.max_progress_ms:
+            print(f"❌ show_progress langsamer als {args.max_progress_ms} ms")
+            return 1
+
+    print("✅ Benchmark abgeschlossen")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
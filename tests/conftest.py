@@ -0,0 +1,5 @@
+"""
+pytest-Konfiguration: die Simulations-Skripte sind keine Testmodule
+"""
+
+collect_ignore = ['test_simulate_rip.py', 'test_web_updates.py']
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests für den Cover-Cache (Treffer, Fehlschlag, Download, LRU, MIME-Erkennung)
+
+Aufruf:
+    python3 -m pytest tests/test_cover_cache.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import cover_cache
+from cover_cache import CoverCache, detect_image_mime
+
+
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00' * 60
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 60
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status: int = 200):
+        self.content = content
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status != 200:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Ersetzt requests.get, zählt Downloads und liefert FakeResponse-Objekte"""
+    calls = []
+    responses = {}
+
+    def fake_get(url, timeout=None):
+        calls.append(url)
+        response = responses.get(url)
+        if isinstance(response, Exception):
+            raise response
+        return response or FakeResponse(b'', status=404)
+
+    monkeypatch.setattr(cover_cache.requests, 'get', fake_get)
+    return calls, responses
+
+
+@pytest.mark.parametrize('data, mime', [
+    (JPEG, 'image/jpeg'),
+    (PNG, 'image/png'),
+    (b'GIF89a' + b'\x00' * 10, 'image/gif'),
+    (b'', 'image/jpeg'),
+])
+def test_detect_image_mime(data, mime):
+    assert detect_image_mime(data) == mime
+
+
+def test_miss_returns_none(tmp_path):
+    cache = CoverCache(str(tmp_path / 'covers'))
+    assert cache.get('release-1') is None
+
+
+def test_put_then_get_from_disk(tmp_path):
+    CoverCache(str(tmp_path / 'covers')).put('release-1', PNG)
+
+    # Neue Instanz: nur der Disk-Cache kann treffen
+    cache = CoverCache(str(tmp_path / 'covers'))
+    assert cache.get('release-1') == PNG
+    assert cache.get('release-2') is None
+
+
+def test_unsafe_key_stays_inside_cache_dir(tmp_path):
+    cache = CoverCache(str(tmp_path / 'covers'))
+    cache.put('https://example.org/../cover?size=500', JPEG)
+
+    files = list((tmp_path / 'covers').iterdir())
+    assert len(files) == 1 and files[0].suffix == '.img'
+    assert CoverCache(str(tmp_path / 'covers')).get('https://example.org/../cover?size=500') == JPEG
+
+
+def test_fetch_downloads_once(tmp_path, downloads):
+    calls, responses = downloads
+    responses['http://covers/1'] = FakeResponse(JPEG)
+    cache = CoverCache(str(tmp_path / 'covers'))
+
+    assert cache.fetch('release-1', 'http://covers/1') == JPEG
+    assert cache.fetch('release-1', 'http://covers/1') == JPEG
+    assert CoverCache(str(tmp_path / 'covers')).fetch('release-1', 'http://covers/1') == JPEG
+    assert calls == ['http://covers/1']
+
+
+def test_fetch_failure_is_not_cached(tmp_path, downloads):
+    calls, responses = downloads
+    responses['http://covers/1'] = ConnectionError('offline')
+    cache = CoverCache(str(tmp_path / 'covers'))
+
+    assert cache.fetch('release-1', 'http://covers/1') is None
+    assert cache.fetch('release-1', 'http://covers/404') is None
+    assert cache.get('release-1') is None
+    assert len(calls) == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = CoverCache(str(tmp_path / 'covers'), max_bytes=2 * len(JPEG))
+    cache.put('old', JPEG)
+    cache.put('used', JPEG)
+
+    # 'old' länger nicht benutzt als 'used'
+    os.utime(cache._path_for('old'), (1000, 1000))
+    os.utime(cache._path_for('used'), (2000, 2000))
+    cache.get('used')
+
+    cache.put('new', JPEG)
+
+    fresh = CoverCache(str(tmp_path / 'covers'))
+    assert fresh.get('old') is None
+    assert fresh.get('used') == JPEG
+    assert fresh.get('new') == JPEG
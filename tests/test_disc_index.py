@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests für den Index gerippter CDs (Eintragen, Nachschlagen, Re-Verifikation, Sync-Stand)
+
+Aufruf:
+    python3 -m pytest tests/test_disc_index.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from disc_index import DiscIndex, DiscRecord
+
+
+@pytest.fixture
+def index(tmp_path):
+    return DiscIndex(str(tmp_path / 'state' / 'disc_index.sqlite'))
+
+
+def _record(**fields) -> DiscRecord:
+    values = dict(
+        disc_id='disc-1', artist='Artist', album='Album', musicbrainz_id='release-1',
+        album_dir='/rips/Artist/Album', output_format='flac', track_count=3, ripped_at=1000.0,
+        accurate=2, mismatch=0, unknown=1, sync_destination='nas:/music/Artist', sync_state='queued'
+    )
+    values.update(fields)
+    return DiscRecord(**values)
+
+
+TRACKS = {1: (0x11111111, 'accurate'), 2: (0x22222222, 'accurate'), 3: (0x33333333, 'unknown')}
+
+
+def test_lookup_unknown_disc(index):
+    assert index.lookup('disc-1') is None
+
+
+def test_record_rip_and_lookup_survive_restart(tmp_path, index):
+    index.record_rip(_record(), TRACKS)
+
+    entry = DiscIndex(str(tmp_path / 'state' / 'disc_index.sqlite')).lookup('disc-1')
+    assert entry == _record(track_crcs={1: 0x11111111, 2: 0x22222222, 3: 0x33333333})
+
+
+def test_tracks_without_crc_are_not_reference(index):
+    index.record_rip(_record(), {1: (0x11111111, 'accurate'), 2: (None, None)})
+    assert index.lookup('disc-1').track_crcs == {1: 0x11111111}
+
+
+def test_record_rip_replaces_previous_rip(index):
+    index.record_rip(_record(), TRACKS)
+    index.record_rip(_record(album='Album (Re-Rip)', track_count=2, ripped_at=2000.0),
+                     {1: (0x44444444, 'accurate'), 2: (0x55555555, 'mismatch')})
+
+    entry = index.lookup('disc-1')
+    assert (entry.album, entry.track_count, entry.ripped_at) == ('Album (Re-Rip)', 2, 2000.0)
+    assert entry.track_crcs == {1: 0x44444444, 2: 0x55555555}
+
+
+def test_verification_keeps_original_crcs(index):
+    index.record_rip(_record(), TRACKS)
+
+    # Erneutes Lesen liefert andere CRC32 (z.B. zerkratzte CD) und neue AccurateRip-Ergebnisse
+    index.record_verification('disc-1', {'accurate': 1, 'mismatch': 2, 'unknown': 0},
+                              {1: (0x11111111, 'accurate'), 2: (0xBADBAD00, 'mismatch'),
+                               3: (0xBADBAD01, 'mismatch')})
+
+    entry = index.lookup('disc-1')
+    assert entry.track_crcs == {1: 0x11111111, 2: 0x22222222, 3: 0x33333333}
+    assert (entry.accurate, entry.mismatch, entry.unknown) == (1, 2, 0)
+    assert entry.verified_at is not None
+    # Alles andere bleibt beim ursprünglichen Rip
+    assert (entry.ripped_at, entry.album_dir, entry.sync_state) == (1000.0, '/rips/Artist/Album', 'queued')
+
+
+def test_verification_of_unknown_disc_is_ignored(index):
+    index.record_verification('disc-1', {'accurate': 3}, TRACKS)
+    assert index.lookup('disc-1') is None
+
+
+def test_update_sync(index):
+    index.record_rip(_record(), TRACKS)
+
+    assert index.update_sync('disc-1', 'synced')
+    assert not index.update_sync('disc-2', 'synced')
+
+    entry = index.lookup('disc-1')
+    assert (entry.sync_state, entry.sync_destination) == ('synced', 'nas:/music/Artist')
+
+
+def test_unavailable_database_degrades_to_miss(tmp_path):
+    blocker = tmp_path / 'state'
+    blocker.write_text('kein Verzeichnis')
+    index = DiscIndex(str(blocker / 'disc_index.sqlite'))
+
+    index.record_rip(_record(), TRACKS)
+    assert index.lookup('disc-1') is None
+    assert not index.update_sync('disc-1', 'synced')
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests für den MusicBrainz-Cache (TTL, Größenlimit, Offline-Fallback)
+
+Aufruf:
+    python3 -m pytest tests/test_mb_cache.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import mb_cache
+from mb_cache import MusicBrainzCache
+
+
+RELEASE = {'id': 'release-1', 'title': 'Album', 'artist-credit-phrase': 'Artist'}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Steuerbare Uhr für mb_cache (Sekunden seit Testbeginn)"""
+    now = [time.time()]
+    monkeypatch.setattr(mb_cache.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return MusicBrainzCache(str(tmp_path / 'state' / 'musicbrainz.sqlite'), ttl_seconds=60)
+
+
+def test_miss_returns_none(cache):
+    assert cache.get('disc-1') is None
+
+
+def test_hit_survives_restart(tmp_path, cache):
+    cache.put('disc-1', RELEASE)
+
+    reopened = MusicBrainzCache(str(tmp_path / 'state' / 'musicbrainz.sqlite'), ttl_seconds=60)
+    assert reopened.get('disc-1') == RELEASE
+
+
+def test_ttl_expiry(cache, clock):
+    cache.put('disc-1', RELEASE)
+
+    clock[0] += 59
+    assert cache.get('disc-1') == RELEASE
+
+    clock[0] += 2
+    assert cache.get('disc-1') is None
+    assert cache.get('disc-1', allow_stale=True) == RELEASE
+
+
+def test_put_refreshes_expired_entry(cache, clock):
+    cache.put('disc-1', RELEASE)
+    clock[0] += 120
+    cache.put('disc-1', dict(RELEASE, title='Neu'))
+
+    assert cache.get('disc-1')['title'] == 'Neu'
+
+
+def test_size_bound_keeps_recently_used(tmp_path, clock):
+    cache = MusicBrainzCache(str(tmp_path / 'mb.sqlite'), max_entries=2)
+    cache.put('disc-1', RELEASE)
+    clock[0] += 1
+    cache.put('disc-2', RELEASE)
+    clock[0] += 1
+    cache.get('disc-1')
+    clock[0] += 1
+    cache.put('disc-3', RELEASE)
+
+    assert cache.get('disc-1') == RELEASE
+    assert cache.get('disc-2') is None
+    assert cache.get('disc-3') == RELEASE
+
+
+@pytest.fixture
+def identifier(monkeypatch, cache):
+    """CDIdentifier mit Cache, dessen MusicBrainz-Abfrage per Liste gesteuert wird"""
+    pytest.importorskip('discid')
+    pytest.importorskip('musicbrainzngs')
+    import cd_identifier
+
+    answers = []
+
+    def get_releases_by_discid(disc_id, includes=None):
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    monkeypatch.setattr(cd_identifier.musicbrainzngs, 'get_releases_by_discid', get_releases_by_discid)
+    return cd_identifier.CDIdentifier(mb_cache=cache), answers
+
+
+def test_fresh_entry_skips_web_service(identifier, cache):
+    ident, answers = identifier
+    cache.put('disc-1', RELEASE)
+
+    assert ident.query_musicbrainz('disc-1') == RELEASE
+    assert answers == []
+
+
+def test_network_error_falls_back_to_stale_entry(identifier, cache, clock):
+    ident, answers = identifier
+    cache.put('disc-1', RELEASE)
+    clock[0] += 120
+
+    answers.append(ConnectionError('offline'))
+    assert ident.query_musicbrainz('disc-1') == RELEASE
+
+
+def test_network_error_without_entry_returns_none(identifier):
+    ident, answers = identifier
+    answers.append(ConnectionError('offline'))
+    assert ident.query_musicbrainz('disc-1') is None
+
+
+def test_expired_entry_is_refreshed_online(identifier, cache, clock):
+    ident, answers = identifier
+    cache.put('disc-1', RELEASE)
+    clock[0] += 120
+
+    fresh = dict(RELEASE, title='Neu')
+    answers.append({'disc': {'release-list': [fresh]}})
+    assert ident.query_musicbrainz('disc-1') == fresh
+    assert cache.get('disc-1') == fresh
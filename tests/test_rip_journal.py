@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests für das Rip-Journal (Fortsetzen nach Absturz, Öffnen pro Disc)
+
+Aufruf:
+    python3 -m pytest tests/test_rip_journal.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rip_journal import RipJournal, file_crc32
+
+
+@pytest.fixture
+def album(tmp_path):
+    path = tmp_path / 'rips' / 'Artist' / 'Album'
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def journals(tmp_path):
+    return RipJournal(str(tmp_path / 'state' / 'journal'))
+
+
+def _write(path: Path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def _reopen(journals: RipJournal, journal, album: Path):
+    """Simuliert einen Neustart: Journal schließen und neu von Disk lesen"""
+    journals.close(journal)
+    return RipJournal(str(journals.journal_dir)).open(journal.disc_id, str(album), 'flac')
+
+
+def test_finished_track_resumes_after_last_step(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    wav = _write(album / 'track01.wav', b'wav' * 1000)
+    output = _write(album / '01 - Title.flac', b'flac' * 500)
+    journal.mark(1, 'ripped', 'verified', wav_file=wav, pcm_crc32=123, accuraterip='accurate')
+    journal.mark(1, 'encoded', output_file=output)
+    journal.mark(1, 'tagged', output_file=output)
+    journal.mark(1, 'uploaded')
+
+    journal = _reopen(journals, journal, album)
+    assert journal.resume_step(1) == 'uploaded'
+    assert journal.tracks[1].pcm_crc32 == 123
+    assert journal.verification_counts() == {'accurate': 1, 'mismatch': 0, 'unknown': 0}
+
+
+@pytest.mark.parametrize('damage', ['changed', 'truncated', 'deleted'])
+def test_damaged_output_falls_back_to_valid_wav(journals, album, damage):
+    journal = journals.open('disc-1', str(album), 'flac')
+    wav = _write(album / 'track01.wav', b'wav' * 1000)
+    output = _write(album / '01 - Title.flac', b'flac' * 500)
+    journal.mark(1, 'ripped', 'verified', wav_file=wav)
+    journal.mark(1, 'encoded', 'tagged', output_file=output)
+    journal.mark(1, 'uploaded')
+
+    if damage == 'changed':
+        # Gleiche Größe, anderer Inhalt: nur die CRC32 fällt auf
+        _write(album / '01 - Title.flac', b'FLAC' * 500)
+    elif damage == 'truncated':
+        _write(album / '01 - Title.flac', b'flac' * 499)
+    else:
+        (album / '01 - Title.flac').unlink()
+
+    journal = _reopen(journals, journal, album)
+    assert journal.resume_step(1) == 'verified'
+    # 'uploaded' bleibt nur mit gültiger Ausgabe-Datei
+    assert not journal.done(1, 'uploaded') and not journal.done(1, 'encoded')
+    assert journal.pending_wav(1) == wav
+
+    # Bereinigter Stand ist persistent
+    journal = _reopen(journals, journal, album)
+    assert set(journal.tracks[1].steps) == {'ripped', 'verified'}
+
+
+def test_damaged_output_and_wav_restarts_track(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    wav = _write(album / 'track01.wav', b'wav' * 1000)
+    output = _write(album / '01 - Title.flac', b'flac' * 500)
+    journal.mark(1, 'ripped', wav_file=wav)
+    journal.mark(1, 'encoded', 'tagged', 'uploaded', output_file=output)
+    (album / '01 - Title.flac').unlink()
+    (album / 'track01.wav').unlink()
+
+    assert journal.resume_step(1) is None
+    assert journal.tracks[1].steps == {}
+
+
+def test_valid_wav_without_encode_resumes_at_rip(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    wav = _write(album / 'track02.wav', b'pcm' * 2000)
+    journal.mark(2, 'ripped', wav_file=wav)
+
+    journal = _reopen(journals, journal, album)
+    assert journal.resume_step(2) == 'ripped'
+    assert journal.pending_wav(2) == wav
+    assert journal.tracks[2].wav_crc32 == file_crc32(wav)
+
+    _write(album / 'track02.wav', b'PCM' * 2000)
+    assert journal.resume_step(2) is None
+
+
+def test_unknown_track_has_no_resume_step(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    assert journal.resume_step(5) is None
+    assert journal.pending_wav(5) is None
+
+
+def test_new_results_invalidate_album_sync(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    output = _write(album / '01 - Title.flac', b'flac' * 10)
+    journal.set_sync('synced')
+
+    journal.mark(1, 'uploaded')
+    assert journal.sync == 'synced'
+    journal.mark(1, 'encoded', output_file=output)
+    assert journal.sync is None
+
+
+def test_second_open_of_same_disc_is_rejected(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    assert journal is not None
+    assert journals.open('disc-1', str(album), 'flac') is None
+
+    # Andere Disc ist unabhängig
+    assert journals.open('disc-2', str(album), 'flac') is not None
+
+    journals.close(journal)
+    assert journals.open('disc-1', str(album), 'flac') is not None
+
+
+@pytest.mark.parametrize('album_dir, fmt', [('Other Album', 'flac'), (None, 'mp3')])
+def test_journal_is_discarded_when_album_dir_or_format_changes(journals, album, album_dir, fmt):
+    journal = journals.open('disc-1', str(album), 'flac')
+    wav = _write(album / 'track01.wav', b'wav' * 100)
+    journal.mark(1, 'ripped', wav_file=wav)
+    journal.set_sync('synced')
+    journals.close(journal)
+
+    other_dir = str(album.parent / album_dir) if album_dir else str(album)
+    journal = journals.open('disc-1', other_dir, fmt)
+    assert journal.tracks == {} and journal.sync is None
+
+    stored = json.loads(journals._path('disc-1').read_text())
+    assert (stored['album_dir'], stored['format'], stored['tracks']) == (other_dir, fmt, {})
+
+
+def test_unreadable_journal_starts_fresh(journals, album):
+    journals._path('disc-1').write_text('{kaputt')
+    journal = journals.open('disc-1', str(album), 'flac')
+    assert journal.tracks == {}
+
+
+def test_mark_synced_updates_closed_journal(journals, album):
+    journal = journals.open('disc-1', str(album), 'flac')
+    output = _write(album / '01 - Title.flac', b'flac' * 10)
+    journal.mark(1, 'ripped', 'encoded', 'tagged', output_file=output)
+    journal.mark(2, 'ripped')
+    journal.set_sync('queued')
+    journal.complete()
+    journals.close(journal)
+
+    assert journals.mark_synced('disc-1')
+    assert not journals.mark_synced('disc-unknown')
+
+    journal = journals.open('disc-1', str(album), 'flac')
+    assert journal.sync == 'synced'
+    assert journal.resume_step(1) == 'uploaded'
+    assert not journal.done(2, 'uploaded')
+
+
+def test_discard_and_prune(journals, album, tmp_path):
+    journal = journals.open('disc-1', str(album), 'flac')
+    journal.mark(1, 'ripped')
+    journals.close(journal)
+    journals.discard('disc-1')
+    assert not journals._path('disc-1').exists()
+
+    journals.close(journals.open('disc-2', str(album), 'flac'))
+    assert journals.prune() == []
+    assert RipJournal(str(journals.journal_dir), keep_days=-1).prune() == ['disc-2']
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests für das adaptive Rippen (cdparanoia -e Ereignisse, unsichere Bereiche, Neu-Lesen)
+
+Aufruf:
+    python3 -m pytest tests/test_ripper_adaptive.py
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ripper import CD_FRAME_WORDS, CD_SECTOR_BYTES, CDRipper
+
+
+FIRST_SECTOR = 10000
+TRACK_SECTORS = 100
+HEADER = b'RIFF' + b'h' * 40
+
+
+def event(code: int, name: str, sector: int, word: int = 0) -> str:
+    """Ereignis-Zeile von cdparanoia -e für einen absoluten Sektor"""
+    return f"##: {code} [{name}] @ {sector * CD_FRAME_WORDS + word}"
+
+
+@pytest.fixture
+def ripper():
+    return CDRipper(quality='adaptive', reread_margin=2)
+
+
+def test_quality_args_use_full_paranoia_for_reread(ripper):
+    # -Z schaltet Verifikation und Korrektur ab, -Y prüft nur Overlaps
+    assert ripper._quality_args('paranoia') == []
+    assert ripper._quality_args() == ['-Y', '-e']
+    assert ripper._quality_args('fast') == ['-Y']
+
+
+def test_suspect_sectors_from_events(ripper):
+    lines = [
+        "cdparanoia III release 10.2",
+        f"Ripping from sector {FIRST_SECTOR} (track  3 [0:00.00])",
+        f"\t  to sector {FIRST_SECTOR + TRACK_SECTORS - 1} (track  3 [0:01.24])",
+        event(0, 'read', FIRST_SECTOR + 1),
+        event(4, 'scratch', FIRST_SECTOR + 5, word=CD_FRAME_WORDS - 1),
+        event(1, 'verify', FIRST_SECTOR + 6),
+        event(6, 'skip', FIRST_SECTOR + 7),
+        event(12, 'transport error', FIRST_SECTOR + 7, word=3),
+        "kein Ereignis",
+    ]
+    assert ripper._suspect_sectors(lines) == (FIRST_SECTOR, {FIRST_SECTOR + 5, FIRST_SECTOR + 7})
+
+
+def test_suspect_sectors_without_position(ripper):
+    assert ripper._suspect_sectors([event(3, 'correction', 42)]) == (None, {42})
+    assert ripper._suspect_sectors(["Ripping from sector 7"]) == (7, set())
+
+
+@pytest.mark.parametrize('relative, expected', [
+    # Einzelne Sektoren mit Rand
+    ([50], [(48, 5)]),
+    ([20, 60], [(18, 5), (58, 5)]),
+    # Überlappende Bereiche werden zusammengefasst
+    ([50, 53], [(48, 8)]),
+    # Aneinander grenzende Bereiche ebenfalls
+    ([50, 55], [(48, 10)]),
+    # Eine Lücke bleibt getrennt
+    ([50, 56], [(48, 5), (54, 5)]),
+    # Mehrere Sektoren im selben Bereich verlängern ihn nicht
+    ([50, 51, 50, 52], [(48, 7)]),
+    # Begrenzung auf Track-Anfang und -Ende
+    ([0, 1], [(0, 4)]),
+    ([TRACK_SECTORS - 1], [(TRACK_SECTORS - 3, 3)]),
+    # Außerhalb des Tracks (z.B. Overlap-Lesen am Rand)
+    ([-3, TRACK_SECTORS + 2], []),
+    ([-2], [(0, 1)]),
+])
+def test_suspect_ranges(ripper, relative, expected):
+    sectors = {FIRST_SECTOR + sector for sector in relative}
+    assert ripper._suspect_ranges(sectors, FIRST_SECTOR, TRACK_SECTORS) == expected
+
+
+def _sector(n: int) -> bytes:
+    return bytes([n % 256]) * CD_SECTOR_BYTES
+
+
+def _track() -> io.BytesIO:
+    """WAV-Header und Track-Daten, jeder Sektor mit eigenem Inhalt"""
+    return io.BytesIO(HEADER + b''.join(_sector(n) for n in range(TRACK_SECTORS)))
+
+
+class FakeReread:
+    """Ersetzt reread_range: liefert 0xEE-Sektoren, schlägt für einzelne Starts fehl"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, track_number, start, count):
+        self.calls.append((track_number, start, count))
+        if start in self.failing:
+            return None
+        return b'\xee' * (count * CD_SECTOR_BYTES)
+
+
+def _sectors(output: io.BytesIO) -> list:
+    data = output.getvalue()[len(HEADER):]
+    return [data[n * CD_SECTOR_BYTES:(n + 1) * CD_SECTOR_BYTES] for n in range(TRACK_SECTORS)]
+
+
+def test_repair_splices_at_data_offset(ripper, monkeypatch):
+    reread = FakeReread()
+    monkeypatch.setattr(ripper, 'reread_range', reread)
+    output = _track()
+    lines = [f"Ripping from sector {FIRST_SECTOR}",
+             event(4, 'scratch', FIRST_SECTOR + 10), event(6, 'skip', FIRST_SECTOR + 90)]
+
+    assert ripper._repair(3, output, len(HEADER), lines, TRACK_SECTORS)
+
+    assert reread.calls == [(3, 8, 5), (3, 88, 5)]
+    assert output.getvalue()[:len(HEADER)] == HEADER
+    assert len(output.getvalue()) == len(HEADER) + TRACK_SECTORS * CD_SECTOR_BYTES
+    replaced = set(range(8, 13)) | set(range(88, 93))
+    for n, data in enumerate(_sectors(output)):
+        assert data == (b'\xee' * CD_SECTOR_BYTES if n in replaced else _sector(n)), f"Sektor {n}"
+
+
+def test_repair_failed_reread(ripper, monkeypatch):
+    reread = FakeReread(failing={8})
+    monkeypatch.setattr(ripper, 'reread_range', reread)
+    output = _track()
+    lines = [f"Ripping from sector {FIRST_SECTOR}",
+             event(4, 'scratch', FIRST_SECTOR + 10), event(4, 'scratch', FIRST_SECTOR + 50)]
+
+    assert not ripper._repair(3, output, len(HEADER), lines, TRACK_SECTORS)
+
+    # Übrige Bereiche werden trotzdem ersetzt, der fehlgeschlagene bleibt unverändert
+    assert len(reread.calls) == 2
+    sectors = _sectors(output)
+    assert sectors[10] == _sector(10)
+    assert sectors[50] == b'\xee' * CD_SECTOR_BYTES
+
+
+def test_repair_uses_known_first_sector(ripper, monkeypatch):
+    reread = FakeReread()
+    monkeypatch.setattr(ripper, 'reread_range', reread)
+    output = _track()
+    lines = [event(3, 'correction', FIRST_SECTOR)]
+
+    assert ripper._repair(1, output, 0, lines, TRACK_SECTORS, first_sector=FIRST_SECTOR)
+    assert reread.calls == [(1, 0, 3)]
+    # Ohne WAV-Header beginnt die Ersetzung bei Byte 0
+    assert output.getvalue()[:3 * CD_SECTOR_BYTES] == b'\xee' * (3 * CD_SECTOR_BYTES)
+
+
+def test_repair_without_position_or_events(ripper, monkeypatch):
+    reread = FakeReread()
+    monkeypatch.setattr(ripper, 'reread_range', reread)
+    output = _track()
+
+    assert not ripper._repair(1, output, len(HEADER), [event(4, 'scratch', 5)], TRACK_SECTORS)
+    assert ripper._repair(1, output, len(HEADER), [event(0, 'read', 5)], TRACK_SECTORS)
+    assert reread.calls == []
+    assert output.getvalue() == _track().getvalue()
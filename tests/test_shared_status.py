@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests für den Status-Speicher (mmap-Seqlock unter Last, JSON-Fallback)
+
+Aufruf:
+    python3 -m pytest tests/test_shared_status.py
+"""
+
+import multiprocessing
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import shared_status
+from shared_status import MmapStatusStore, SharedStatus
+
+
+WRITES = 2000
+READERS = 4
+
+
+def _record(i: int) -> dict:
+    """
+    Stand Nr. i: alle Felder hängen von i ab, die Länge ist immer gleich.
+    Ein zerrissener Stand ist damit gültiges JSON und fällt nur über den
+    Inhalt auf.
+    """
+    return {'seq': 100000 + i, 'check': 900000 - i, 'blob': chr(ord('a') + i % 26) * 20000}
+
+
+def _assert_consistent(data: dict):
+    i = data['seq'] - 100000
+    assert data == _record(i), f"Zerrissener Stand bei seq={i}"
+
+
+def _write_records(path: str):
+    """Schreibt alle Stände nacheinander (als Thread oder eigener Prozess)"""
+    store = MmapStatusStore(path)
+    for i in range(1, WRITES + 1):
+        store.update(lambda status, i=i: (status.clear(), status.update(_record(i))))
+
+
+@pytest.fixture
+def fast_switching():
+    """Häufige Thread-Wechsel, damit Leser mitten in Schreibvorgänge fallen"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.parametrize('writer_kind', ['thread', 'process'])
+def test_mmap_readers_never_see_torn_status(tmp_path, fast_switching, writer_kind):
+    path = str(tmp_path / 'status')
+    MmapStatusStore(path).update(lambda status: status.update(_record(0)))
+
+    if writer_kind == 'thread':
+        writer = threading.Thread(target=_write_records, args=(path,))
+    else:
+        # Eigener Prozess wie der Service: Leser sehen halb kopierte Nutzdaten
+        writer = multiprocessing.get_context('fork').Process(target=_write_records, args=(path,))
+
+    errors = []
+    reads = [0] * READERS
+
+    def reader(index: int):
+        # Eigene Instanz pro Leser, wie im Web-Prozess
+        store = MmapStatusStore(path)
+        last_version, last_seq = 0, 0
+        try:
+            while True:
+                finished = not writer.is_alive()
+                version, data = store.read()
+                assert version % 2 == 0, f"Ungerade Version {version}"
+                assert version >= last_version and data['seq'] >= last_seq, "Stand ging zurück"
+                _assert_consistent(data)
+                last_version, last_seq = version, data['seq']
+                reads[index] += 1
+                if finished:
+                    assert data == _record(WRITES)
+                    return
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=reader, args=(n,)) for n in range(READERS)]
+    writer.start()
+    for thread in readers:
+        thread.start()
+    writer.join(timeout=60)
+    for thread in readers:
+        thread.join(timeout=60)
+
+    assert not writer.is_alive() and not any(thread.is_alive() for thread in readers)
+    assert not errors, errors[0]
+    assert all(count > 1 for count in reads)
+
+
+def test_mmap_version_without_parsing(tmp_path):
+    store = MmapStatusStore(str(tmp_path / 'status'))
+    assert store.version() == 0
+
+    store.update(lambda status: status.update(_record(1)))
+    first = store.version()
+    store.update(lambda status: status.update(_record(2)))
+
+    assert store.version() > first
+    assert store.read() == (store.version(), _record(2))
+
+
+def test_mmap_rejects_oversized_status(tmp_path):
+    store = MmapStatusStore(str(tmp_path / 'status'), capacity=1024)
+    store.update(lambda status: status.update(step='ripping'))
+
+    with pytest.raises(ValueError):
+        store.update(lambda status: status.update(blob='x' * 2048))
+    assert store.read()[1] == {'step': 'ripping'}
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 1, 1, 12, 0, 0)
+
+
+def _exercise(status: SharedStatus) -> list:
+    """Gleiche Aufrufe wie der Service, liefert die Zwischenstände"""
+    states = []
+    status.set_drives({'sr0': '/dev/sr0', 'sr1': '/dev/sr1'})
+    states.append(status.get_status())
+    status.update_cd('Album', 'Artist', cover_path='/tmp/cover.jpg', drive='sr0')
+    status.set_processing(True, drive='sr0')
+    status.update_progress('ripping', 40, 4, 10, drive='sr0')
+    states.append(status.get_status())
+    status.update_progress('encoding', 10, 1, 12, drive='sr1')
+    status.update_sync({'pending': 1, 'active': None})
+    states.append(status.get_status())
+    status.clear(drive='sr0')
+    states.append(status.get_status())
+    status.clear()
+    states.append(status.get_status())
+    return states
+
+
+def test_json_fallback_matches_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_status, 'datetime', _FixedDatetime)
+
+    mmap_status = SharedStatus(str(tmp_path / 'status.mmap'), backend='mmap')
+    json_status = SharedStatus(str(tmp_path / 'status.json'), backend='json')
+    assert isinstance(mmap_status._store, MmapStatusStore)
+    assert not isinstance(json_status._store, MmapStatusStore)
+
+    mmap_states = _exercise(mmap_status)
+    assert mmap_states == _exercise(json_status)
+
+    # Fokus wechselt auf das noch aktive Laufwerk, Sync bleibt beim Leeren erhalten
+    assert mmap_states[3]['focus_drive'] == 'sr1'
+    assert mmap_states[4]['sync'] == {'pending': 1, 'active': None}
+
+
+def test_falls_back_to_json_when_mmap_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_status, 'DEFAULT_JSON_PATH', str(tmp_path / 'status.json'))
+
+    # Verzeichnis statt Datei: mmap-Store lässt sich nicht öffnen
+    status = SharedStatus(str(tmp_path), backend='mmap')
+    status.update_progress('ripping', 5, 1, 3)
+
+    assert status.status_file == tmp_path / 'status.json'
+    assert status.get_status()['progress'] == 5
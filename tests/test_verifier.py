@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests für die Rip-Verifikation (AccurateRip v1/v2, Disc-IDs, lokale Datenbank)
+
+Aufruf:
+    python3 -m pytest tests/test_verifier.py
+"""
+
+import random
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import verifier
+from verifier import (AccurateRipDatabase, AccurateRipIds, ChecksumSink, DiscardSink, DiscVerifier,
+                      TrackChecksum, accuraterip_ids, build_dbar, parse_dbar)
+
+
+SKIP = 5 * 588
+
+
+def reference_checksums(data: bytes, is_first: bool, is_last: bool):
+    """
+    AccurateRip v1/v2 nach der Referenz-Implementierung: Multiplikator ab 1,
+    erster Track ab 5 * 588 - 1, letzter Track bis Samples - 5 * 588
+    """
+    samples = struct.unpack(f'<{len(data) // 4}I', data[:len(data) // 4 * 4])
+    check_start = SKIP - 1 if is_first else 0
+    check_end = len(samples) - SKIP if is_last else len(samples)
+    v1 = v2 = 0
+    for multiplier, sample in enumerate(samples, start=1):
+        if check_start <= multiplier <= check_end:
+            product = sample * multiplier
+            v1 = (v1 + (product & 0xFFFFFFFF)) & 0xFFFFFFFF
+            v2 = (v2 + (product & 0xFFFFFFFF) + (product >> 32)) & 0xFFFFFFFF
+    return v1, v2
+
+
+def pcm(seed: int, samples: int) -> bytes:
+    return random.Random(seed).randbytes(samples * 4)
+
+
+def feed(checksum: TrackChecksum, data: bytes, seed: int):
+    """Übergibt die Daten in Blöcken ungerader Größe (Sample-Grenzen werden zerschnitten)"""
+    rng = random.Random(seed)
+    pos = 0
+    while pos < len(data):
+        size = rng.choice([1, 3, 7, 4093, 65537 * 4 + 1, rng.randrange(1, 20000)])
+        checksum.update(data[pos:pos + size])
+        pos += size
+    return checksum.finalize()
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    """Prüft den NumPy-Pfad und den reinen Python-Pfad"""
+    if request.param == 'numpy':
+        if verifier.numpy is None:
+            pytest.skip("NumPy nicht installiert")
+    else:
+        monkeypatch.setattr(verifier, 'numpy', None)
+    return request.param
+
+
+@pytest.mark.parametrize('is_first, is_last', [
+    (True, False),     # erster Track
+    (False, False),    # mittlerer Track
+    (False, True),     # letzter Track
+    (True, True),      # Disc mit nur einem Track
+])
+def test_track_checksum_matches_reference(backend, is_first, is_last):
+    # Mehr als ein NumPy-Block (65536 Samples), ungerade Sample-Anzahl
+    data = pcm(1, 70001)
+    expected_v1, expected_v2 = reference_checksums(data, is_first, is_last)
+
+    result = feed(TrackChecksum(is_first=is_first, is_last=is_last), data, seed=2)
+
+    assert (result.accuraterip_v1, result.accuraterip_v2) == (expected_v1, expected_v2)
+    assert result.crc32 == zlib.crc32(data)
+    assert result.samples == 70001
+
+
+def test_track_checksum_short_first_track(backend):
+    # Kürzer als der übersprungene Bereich am Disc-Anfang
+    data = pcm(3, SKIP - 100)
+    result = feed(TrackChecksum(is_first=True), data, seed=4)
+    assert (result.accuraterip_v1, result.accuraterip_v2) == (0, 0)
+
+
+def test_track_checksum_trailing_partial_sample(backend):
+    # Unvollständiges letztes Sample zählt nur für CRC32
+    data = pcm(5, 10000) + b'\x01\x02'
+    result = feed(TrackChecksum(), data, seed=6)
+    assert (result.accuraterip_v1, result.accuraterip_v2) == reference_checksums(data, False, False)
+    assert result.crc32 == zlib.crc32(data)
+
+
+def test_numpy_and_python_agree(monkeypatch):
+    if verifier.numpy is None:
+        pytest.skip("NumPy nicht installiert")
+    data = pcm(7, 140000)
+    with_numpy = feed(TrackChecksum(is_first=True), data, seed=8)
+    monkeypatch.setattr(verifier, 'numpy', None)
+    assert feed(TrackChecksum(is_first=True), data, seed=9) == with_numpy
+
+
+def test_accuraterip_ids_known_disc():
+    # 3 Tracks bei LBA 0, 14850, 29850, Lead-Out bei LBA 44850 (discid-Offsets inkl. 150 Lead-In)
+    ids = accuraterip_ids([150, 15000, 30000], 45000)
+
+    # id1 = 0 + 14850 + 29850 + 44850
+    assert ids.id1 == 89550
+    # id2 = 1 * 1 + 14850 * 2 + 29850 * 3 + 44850 * 4 (LBA 0 zählt als 1)
+    assert ids.id2 == 298651
+    # freedb: Ziffernsumme der Sekunden 2 + 200 + 400 = 8, Länge 600 - 2 = 598 s, 3 Tracks
+    assert ids.cddb == (8 << 24) | (598 << 8) | 3 == 0x08025603
+    assert ids.track_count == 3
+    assert ids.filename == 'dBAR-003-00015dce-00048e9b-08025603.bin'
+    assert ids.url.endswith('/accuraterip/e/c/d/dBAR-003-00015dce-00048e9b-08025603.bin')
+
+
+def test_accuraterip_ids_prefers_freedb_id_from_discid():
+    ids = accuraterip_ids([150, 15000, 30000], 45000, freedb_id='0a025603')
+    assert ids.cddb == 0x0A025603
+
+
+def test_dbar_roundtrip():
+    ids = AccurateRipIds(1, 2, 3, 2)
+    pressings = [[(12, 0x11111111), (300, 0xFFFFFFFF)], [(1, 0x22222222), (2, 0x33333333)]]
+    data = build_dbar(ids, pressings)
+
+    # Konfidenz ist ein Byte
+    assert parse_dbar(data) == [[(12, 0x11111111), (255, 0xFFFFFFFF)], pressings[1]]
+    # Abgeschnittene Antwort: nur vollständige Pressungen
+    assert parse_dbar(data[:-1]) == [[(12, 0x11111111), (255, 0xFFFFFFFF)]]
+
+
+@pytest.fixture
+def disc(tmp_path):
+    """Drei Tracks mit Prüfsummen und einer lokalen AccurateRip-Datenbank"""
+    tracks = {n: pcm(10 + n, 8000 + n) for n in (1, 2, 3)}
+    checksums = {}
+    for n, data in tracks.items():
+        sink = ChecksumSink(DiscardSink(), TrackChecksum(is_first=n == 1, is_last=n == 3))
+        sink.write(data)
+        assert sink.close()
+        checksums[n] = sink.result
+
+    ids = accuraterip_ids([150, 5000, 10000], 15000)
+    local_db = tmp_path / 'accuraterip'
+    local_db.mkdir()
+    # Track 1 passt (v2 in der einen, v1 in der anderen Pressung), Track 2 weicht ab,
+    # Track 3 fehlt in beiden Pressungen
+    (local_db / ids.filename).write_bytes(build_dbar(ids, [
+        [(5, checksums[1].accuraterip_v2), (3, 0xDEADBEEF)],
+        [(2, checksums[1].accuraterip_v1), (7, checksums[2].accuraterip_v1 ^ 1)],
+    ]))
+    database = AccurateRipDatabase(str(tmp_path / 'cache'), local_dir=str(local_db))
+    return ids, database, checksums
+
+
+def test_disc_verifier_against_local_db(disc):
+    ids, database, checksums = disc
+    disc_verifier = DiscVerifier(database, ids, 3)
+
+    first = disc_verifier.verify(1, checksums[1])
+    assert (first.status, first.version, first.confidence) == ('accurate', 2, 5)
+    assert disc_verifier.verify(2, checksums[2]).status == 'mismatch'
+    assert disc_verifier.verify(3, checksums[3]).status == 'unknown'
+    assert disc_verifier.summary() == {'accurate': 1, 'mismatch': 1, 'unknown': 1}
+
+
+def test_disc_verifier_unknown_disc(disc, tmp_path):
+    _, database, checksums = disc
+    other = accuraterip_ids([150, 6000, 12000], 18000)
+    disc_verifier = DiscVerifier(database, other, 3)
+
+    assert disc_verifier.pressings == []
+    assert [disc_verifier.verify(n, checksums[n]).status for n in (1, 2, 3)] == ['unknown'] * 3
+
+
+def test_disc_verifier_without_ids(disc):
+    _, database, checksums = disc
+    disc_verifier = DiscVerifier(database, None, 3)
+    assert disc_verifier.verify(1, checksums[1]).status == 'unknown'
+    assert disc_verifier.checksum(3).is_last and not disc_verifier.checksum(2).is_last
@@ -4,6 +4,14 @@ let currentConfig = null;
 let autoScroll = true;
 let logsExpanded = false;
 
+// Live updates (Server-Sent Events, polling as fallback)
+const MAX_LOG_ENTRIES = 100;
+let eventSource = null;
+let pollTimers = [];
+let currentStatus = {};
+let logEntries = [];
+let logCursor = null;
+
 // Initialize i18n on page load
 document.addEventListener('DOMContentLoaded', async () => {
     // Load language from config
@@ -19,12 +27,54 @@ document.addEventListener('DOMContentLoaded', async () => {
         setLanguage('en'); // fallback
     }
     
-    // Start status polling
+    // Start live updates
+    startLiveUpdates();
+});
+
+function startLiveUpdates() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    eventSource = new EventSource('/api/events');
+    
+    eventSource.addEventListener('status', (event) => {
+        const data = JSON.parse(event.data);
+        currentStatus = data.full ? data.changes : Object.assign({}, currentStatus, data.changes);
+        updateStatus(currentStatus);
+    });
+    
+    eventSource.addEventListener('logs', (event) => {
+        const data = JSON.parse(event.data);
+        logEntries = (data.reset ? data.entries : logEntries.concat(data.entries)).slice(-MAX_LOG_ENTRIES);
+        updateLogs(logEntries);
+    });
+    
+    eventSource.onopen = () => stopPolling();
+    
+    eventSource.onerror = () => {
+        // EventSource reconnects by itself; poll until the stream is back
+        startPolling();
+        if (eventSource.readyState === EventSource.CLOSED) {
+            eventSource = null;
+            setTimeout(startLiveUpdates, 10000);
+        }
+    };
+}
+
+function startPolling() {
+    if (pollTimers.length) return;
+    
     fetchStatus();
     fetchLogs();
-    setInterval(fetchStatus, 2000);
-    setInterval(fetchLogs, 3000);
-});
+    pollTimers = [setInterval(fetchStatus, 2000), setInterval(fetchLogs, 3000)];
+}
+
+function stopPolling() {
+    pollTimers.forEach(clearInterval);
+    pollTimers = [];
+}
 
 // API Calls
 async function fetchStatus() {
@@ -39,9 +89,18 @@ async function fetchStatus() {
 
 async function fetchLogs() {
     try {
-        const response = await fetch('/api/logs/tail?lines=100');
+        let url = `/api/logs/tail?lines=${MAX_LOG_ENTRIES}`;
+        if (logCursor) {
+            url += `&cursor=${encodeURIComponent(logCursor)}`;
+        }
+        const response = await fetch(url);
         const data = await response.json();
-        updateLogs(data.logs);
+        logCursor = data.cursor || null;
+        
+        // Only lines appended since the last call, unless the server reset the cursor
+        if (!data.reset && (!data.logs || data.logs.length === 0)) return;
+        logEntries = (data.reset ? data.logs : logEntries.concat(data.logs)).slice(-MAX_LOG_ENTRIES);
+        updateLogs(logEntries);
     } catch (error) {
         console.error('Error loading logs:', error);
     }
@@ -175,6 +234,7 @@ function updateLogs(logs) {
 function getStepName(step) {
     const steps = {
         'ripping': '🎵 Rippe CD',
+        'verifying': '🔍 Verifiziere CD',
         'encoding': '🔄 Encodiere Audio',
         'tagging': '🏷️ Schreibe Metadaten',
         'syncing': '☁️ Synchronisiere',
@@ -208,14 +268,6 @@ function toggleLogs() {
 
 // Event Listeners
 document.addEventListener('DOMContentLoaded', () => {
-    // Initial load
-    fetchStatus();
-    fetchLogs();
-    
-    // Auto-refresh
-    setInterval(fetchStatus, 2000);
-    setInterval(fetchLogs, 3000);
-    
     // Buttons
     document.getElementById('ejectBtn').addEventListener('click', ejectCD);
     document.getElementById('configBtn').addEventListener('click', () => {
@@ -236,6 +288,7 @@ document.addEventListener('DOMContentLoaded', () => {
     
     // Clear logs
     document.getElementById('clearLogs').addEventListener('click', () => {
+        logEntries = [];
         document.getElementById('logContainer').innerHTML = '<div class="log-placeholder">Logs gelöscht</div>';
     });
 });
@@ -16,6 +16,7 @@ const translations = {
         'step_detecting': 'Detecting CD...',
         'step_identifying': 'Identifying...',
         'step_ripping': 'Ripping',
+        'step_verifying': 'Verifying',
         'step_encoding': 'Encoding',
         'step_tagging': 'Tagging',
         'step_syncing': 'Syncing to server',
@@ -76,6 +77,7 @@ const translations = {
         'step_detecting': 'Erkenne CD...',
         'step_identifying': 'Identifiziere...',
         'step_ripping': 'Rippe',
+        'step_verifying': 'Verifiziere',
         'step_encoding': 'Kodiere',
         'step_tagging': 'Tagge',
         'step_syncing': 'Synchronisiere zum Server',